@@ -2,8 +2,18 @@
 형태소 분석 모듈
 """
 
-from .morpheme_analyzer import MorphemeAnalyzer
+from .morpheme_analyzer import (
+    MorphemeAnalyzer,
+    close_shared_analyzer,
+    get_shared_analyzer,
+    shared_analyzer_status,
+    warm_shared_analyzer,
+)
+from .analyzer_pool import AnalyzerPool, PooledAnalyzer
 
-__all__ = ['MorphemeAnalyzer']
+__all__ = [
+    'MorphemeAnalyzer', 'AnalyzerPool', 'PooledAnalyzer',
+    'get_shared_analyzer', 'warm_shared_analyzer', 'close_shared_analyzer', 'shared_analyzer_status',
+]
 
 
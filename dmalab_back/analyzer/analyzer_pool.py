@@ -0,0 +1,275 @@
+"""
+형태소 분석 워커 프로세스 풀 모듈
+konlpy 분석기(Okt/Kkma/Komoran)는 JPype로 한 프로세스의 JVM을 공유하므로, 스레드 풀에서 동시에 분석해도
+JVM 브리지와 GIL에서 경합합니다. 설정(ANALYZER_WORKERS)하면 각자 JVM과 예열된 분석기를 가진 워커 프로세스 N개에
+분석을 나눠 보냅니다. 호출하는 쪽은 get_shared_analyzer()가 반환하는 PooledAnalyzer를 MorphemeAnalyzer처럼 사용합니다.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from .morpheme_analyzer import MorphemeAnalyzer
+
+# 형태소 분석 워커 프로세스 수 (0이면 사용하지 않고 현재 프로세스의 공유 분석기 사용)
+ANALYZER_WORKERS = int(os.getenv("ANALYZER_WORKERS", "0"))
+# 워커가 비정상 종료되었을 때 다른(새) 워커로 다시 보내는 횟수
+ANALYZER_RETRIES = int(os.getenv("ANALYZER_RETRIES", "1"))
+
+# 워커 프로세스마다 하나씩 만드는 분석기 (initializer에서 생성/예열)
+_worker_analyzer: Optional[MorphemeAnalyzer] = None
+_worker_warm_seconds = 0.0
+
+
+def _init_worker():
+    """워커 프로세스 시작 시 분석기를 만들고 예열합니다 (JVM 시작과 사전 로딩을 첫 작업 전에 끝냄)."""
+    global _worker_analyzer, _worker_warm_seconds
+    start = time.perf_counter()
+    _worker_analyzer = MorphemeAnalyzer(use_konlpy=True)
+    _worker_analyzer.warm()
+    _worker_warm_seconds = time.perf_counter() - start
+
+
+def _worker_info() -> dict:
+    """워커 프로세스 정보 (PID, 분석기 이름, 예열 시간)"""
+    return {
+        'pid': os.getpid(),
+        'backend': _worker_analyzer.backend_name,
+        'warm_seconds': round(_worker_warm_seconds, 3),
+    }
+
+
+def _worker_count(text: str, min_length: int) -> Counter:
+    """워커 프로세스에서 전처리된 조각 하나의 키워드 빈도를 계산합니다 (MorphemeAnalyzer.count_keywords)."""
+    return _worker_analyzer.count_keywords(text, min_length=min_length, markers=False)
+
+
+class _WorkerSlot:
+    """워커 프로세스 하나 (단일 프로세스 실행기)와 처리 통계"""
+
+    __slots__ = ('index', 'executor', 'pending', 'completed', 'failed', 'restarts', 'info')
+
+    def __init__(self, index: int):
+        self.index = index
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0        # 보냈지만 끝나지 않은 작업 수 (대기열 길이)
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.info: dict = {}
+
+
+class AnalyzerPool:
+    """
+    형태소 분석 워커 프로세스 풀
+    워커마다 실행기를 따로 두어 대기열이 가장 짧은 워커로 작업을 보내고, 워커별 대기열 길이를 집계합니다.
+    """
+
+    def __init__(self, workers: int = ANALYZER_WORKERS, retries: int = ANALYZER_RETRIES):
+        """
+        Args:
+            workers: 워커 프로세스 수
+            retries: 워커가 비정상 종료되었을 때 다시 보내는 횟수
+        """
+        self.workers = workers
+        self.retries = retries
+        self._lock = threading.Lock()
+        self._slots = [_WorkerSlot(index) for index in range(workers)]
+        self._context = multiprocessing.get_context('spawn')
+
+    def _executor_for(self, slot: _WorkerSlot) -> ProcessPoolExecutor:
+        """워커 실행기를 반환합니다 (없으면 생성, _lock 안에서 호출)."""
+        if slot.executor is None:
+            slot.executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=self._context, initializer=_init_worker
+            )
+        return slot.executor
+
+    def _acquire(self) -> Tuple[_WorkerSlot, ProcessPoolExecutor]:
+        """대기열이 가장 짧은 워커를 고르고 대기열 길이를 1 늘립니다."""
+        with self._lock:
+            slot = min(self._slots, key=lambda s: (s.pending, s.index))
+            slot.pending += 1
+            return slot, self._executor_for(slot)
+
+    def _release(self, slot: _WorkerSlot, ok: bool):
+        with self._lock:
+            slot.pending -= 1
+            if ok:
+                slot.completed += 1
+            else:
+                slot.failed += 1
+
+    def _restart(self, slot: _WorkerSlot, executor: ProcessPoolExecutor):
+        """비정상 종료된 워커의 실행기를 버립니다 (다음 작업에서 새 프로세스를 시작)."""
+        with self._lock:
+            if slot.executor is executor:
+                slot.executor = None
+                slot.restarts += 1
+                slot.info = {}
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, chunk: str, min_length: int) -> tuple:
+        """조각 하나를 대기열이 가장 짧은 워커로 보냅니다 ((워커, 실행기, future) 반환, 보내지 못하면 future는 None)."""
+        slot, executor = self._acquire()
+        try:
+            return slot, executor, executor.submit(_worker_count, chunk, min_length)
+        except BrokenProcessPool:
+            self._release(slot, False)
+            self._restart(slot, executor)
+            return slot, executor, None
+
+    def _result(self, slot: _WorkerSlot, executor: ProcessPoolExecutor, future) -> Optional[Counter]:
+        """보낸 조각의 결과를 기다립니다 (워커가 비정상 종료되었으면 None)."""
+        ok = False
+        try:
+            result = future.result()
+            ok = True
+            return result
+        except BrokenProcessPool as e:
+            print(f"[WARN] 형태소 분석 워커 #{slot.index}가 비정상 종료되었습니다: {e}")
+            self._restart(slot, executor)
+            return None
+        finally:
+            self._release(slot, ok)
+
+    def count(self, chunks: List[str], min_length: int = 2) -> Optional[Counter]:
+        """
+        전처리된 조각들을 여러 워커에 동시에 나눠 보내 키워드 빈도를 계산하고 합칩니다
+        (결과를 기다리는 동안 호출한 스레드는 GIL을 놓음).
+        워커가 비정상 종료된 조각은 다른(새) 워커로 retries번까지 다시 보냅니다.
+
+        Args:
+            chunks: MorphemeAnalyzer.text_chunks 결과
+            min_length: 키워드 최소 길이
+
+        Returns:
+            {키워드: 빈도} Counter (조각 순서대로 합침, 다시 보내도 실패한 조각이 있으면 None)
+        """
+        submitted = [self._submit(chunk, min_length) for chunk in chunks]
+        keyword_counter: Optional[Counter] = Counter()
+        for chunk, (slot, executor, future) in zip(chunks, submitted):
+            # 실패한 조각이 있어도 남은 결과를 모두 기다려 워커 대기열 길이를 맞춤
+            counts = self._result(slot, executor, future) if future is not None else None
+            for _ in range(self.retries if keyword_counter is not None else 0):
+                if counts is not None:
+                    break
+                slot, executor, future = self._submit(chunk, min_length)
+                if future is not None:
+                    counts = self._result(slot, executor, future)
+            if counts is None:
+                keyword_counter = None
+            elif keyword_counter is not None:
+                keyword_counter.update(counts)
+        return keyword_counter
+
+    def warm(self) -> float:
+        """
+        모든 워커 프로세스를 시작하고 분석기 예열이 끝날 때까지 기다립니다.
+
+        Returns:
+            걸린 시간 (초)
+        """
+        start = time.perf_counter()
+        with self._lock:
+            futures = {
+                self._executor_for(slot).submit(_worker_info): slot for slot in self._slots
+            }
+        wait(futures)
+        for future, slot in futures.items():
+            try:
+                info = future.result()
+            except Exception as e:
+                print(f"[WARN] 형태소 분석 워커 #{slot.index} 예열 실패: {e}")
+                continue
+            with self._lock:
+                slot.info = info
+        return time.perf_counter() - start
+
+    @property
+    def backend_name(self) -> Optional[str]:
+        """예열된 워커의 분석기 이름 (예열 전이면 None)"""
+        with self._lock:
+            names = {slot.info['backend'] for slot in self._slots if slot.info}
+        return ','.join(sorted(names)) if names else None
+
+    def stats(self) -> Dict[str, object]:
+        """워커별 대기열 길이와 처리 통계"""
+        with self._lock:
+            workers = [
+                {
+                    'index': slot.index,
+                    'alive': slot.executor is not None,
+                    'pending': slot.pending,
+                    'completed': slot.completed,
+                    'failed': slot.failed,
+                    'restarts': slot.restarts,
+                    **slot.info,
+                }
+                for slot in self._slots
+            ]
+        return {
+            'workers': len(workers),
+            'pending': sum(w['pending'] for w in workers),
+            'completed': sum(w['completed'] for w in workers),
+            'restarts': sum(w['restarts'] for w in workers),
+            'per_worker': workers,
+        }
+
+    def close(self):
+        """워커 프로세스를 종료합니다."""
+        with self._lock:
+            executors = [slot.executor for slot in self._slots if slot.executor is not None]
+            for slot in self._slots:
+                slot.executor = None
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class PooledAnalyzer(MorphemeAnalyzer):
+    """
+    분석을 AnalyzerPool 워커로 보내는 MorphemeAnalyzer
+    현재 프로세스에서는 JVM을 시작하지 않으며, analyze_keywords/get_keyword_ranking/analyze_blocks 등은
+    모두 count_keywords를 거치므로 기존 MorphemeAnalyzer와 같이 사용할 수 있습니다.
+    긴 텍스트는 조각(ANALYZER_CHUNK_CHARS)으로 나눠 여러 워커에서 동시에 분석합니다.
+    """
+
+    def __init__(self, pool: AnalyzerPool):
+        super().__init__(use_konlpy=False)
+        self.pool = pool
+        self._local: Optional[MorphemeAnalyzer] = None
+        self._local_lock = threading.Lock()
+
+    @property
+    def backend_name(self) -> str:
+        return self.pool.backend_name or 'pool'
+
+    def _local_analyzer(self) -> MorphemeAnalyzer:
+        """워커가 계속 실패할 때 사용할 현재 프로세스 분석기 (처음 필요할 때 생성)"""
+        if self._local is None:
+            with self._local_lock:
+                if self._local is None:
+                    self._local = MorphemeAnalyzer(use_konlpy=True)
+        return self._local
+
+    def warm(self) -> float:
+        seconds = self.pool.warm()
+        self.ready = True
+        return seconds
+
+    def count_keywords(self, text: str, min_length: int = 2, markers: bool = True) -> Counter:
+        # 전처리와 조각 나누기는 현재 프로세스에서, 조각별 분석은 워커에서 동시에 실행
+        keyword_counter = self.pool.count(self.text_chunks(text, markers=markers), min_length=min_length)
+        if keyword_counter is None:
+            print("[WARN] 형태소 분석 워커를 사용할 수 없어 현재 프로세스에서 분석합니다.")
+            keyword_counter = self._local_analyzer().count_keywords(text, min_length=min_length, markers=markers)
+        return keyword_counter
+
+    def close(self):
+        """워커 프로세스를 종료합니다."""
+        self.pool.close()
@@ -6,6 +6,9 @@
 from typing import List, Dict, Tuple, Optional
 import re
 import os
+import threading
+import time
+from contextlib import nullcontext
 from collections import Counter
 
 # rich import 시도 (예쁜 출력용)
@@ -101,10 +104,117 @@ except Exception as e:
         print("[INFO] 간단한 키워드 분석 방법을 사용합니다.")
     KONLPY_AVAILABLE = False
 
+# 프로세스에서 분석기 하나를 공유할지 (0이면 기존처럼 호출할 때마다 새로 생성)
+ANALYZER_SHARED = os.getenv("ANALYZER_SHARED", "1") == "1"
+# 긴 텍스트를 나눠 분석할 조각 크기 (전처리된 글자 수, 0이면 기존처럼 처음 10000자만 분석)
+CHUNK_CHARS = int(os.getenv("ANALYZER_CHUNK_CHARS", "10000"))
+# 예열(warm) 시 분석할 문장 (사전 로딩과 JIT 컴파일을 요청 전에 끝냄)
+_WARM_TEXT = "홈페이지제작은 현대 비즈니스에서 중요한 요소입니다. 웹사이트 제작 시 반응형 디자인을 고려해야 합니다."
+
+
+def split_text_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    텍스트를 max_chars 이하 조각으로 나눕니다 (단어가 잘리지 않도록 조각 끝의 마지막 공백에서 나눔).
+    
+    Args:
+        text: 나눌 텍스트
+        max_chars: 조각 최대 길이 (0 이하면 나누지 않음)
+        
+    Returns:
+        공백을 제거한 비어 있지 않은 조각 리스트 (순서 유지)
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text] if text.strip() else []
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + max_chars
+        if end < len(text):
+            split_at = text.rfind(' ', start, end + 1)
+            # 공백이 없으면 (아주 긴 단어) 그대로 자름
+            if split_at > start:
+                end = split_at
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
+    return chunks
+
 
 class MorphemeAnalyzer:
     """형태소 분석을 통해 키워드 빈도와 순위를 분석하는 클래스"""
     
+    # 불용어 리스트 (한국어) - 기본 조사와 의미 없는 단어만 포함 (모든 인스턴스가 공유)
+    # 조사가 붙은 형태는 정규식 패턴으로 자동 처리하므로 여기서는 기본 조사만 포함
+    STOPWORDS = frozenset({
+        # 기본 조사 (단독으로 사용되는 경우)
+        '이', '가', '을', '를', '에', '의', '와', '과', '은', '는',
+        '도', '로', '으로', '에서', '에게', '께', '한테', '처럼',
+        '만', '까지', '부터', '보다', '같이', '하고',
+        '만큼', '대로', '마저', '조차',
+
+        # 대명사/지시어
+        '그', '이것', '저것', '그것', '이런', '저런', '그런',
+        '이', '저', '그', '어떤', '무엇', '누구', '어디',
+
+        # 일반 명사 (의미 없는 단어)
+        '것', '수', '때', '등', '및', '또', '또한', '그리고',
+        '경우', '때문', '위해', '통해', '대해', '관련',
+
+        # 접속어/부사
+        '하지만', '그러나', '따라서', '그래서', '그런데',
+        '그래도', '그리고', '또한', '그래서', '따라서',
+        '그런데', '그러면', '그렇다면', '그러므로',
+
+        # 동사 어간/어미 (기본 형태만)
+        '있', '없', '되', '하',
+        '있다', '없다', '된다', '하다', '이다', '아니다',
+
+        # 기타 불필요한 단어
+        '등', '및', '또', '또한', '그리고', '그러나',
+        '때문', '위해', '통해', '대해', '관련', '경우',
+        '수', '때', '것',
+    })
+
+    # 어미 패턴 (정규식으로 필터링할 패턴) - 범용적으로 적용
+    ENDING_PATTERNS = (
+        # 종결 어미
+        r'습니다$', r'합니다$', r'됩니다$', r'입니다$', r'합니다$',
+        # 연결 어미
+        r'해야$', r'해야$', r'해야$',
+        r'할$', r'한$', r'하는$', r'되는$', r'있는$', r'없는$',
+        r'해$', r'되$', r'있$', r'없$',
+        # 동사/형용사 어미 패턴
+        r'[하되있없]다$',  # ~하다, ~되다, ~있다, ~없다
+        r'[하되있없]는$',  # ~하는, ~되는, ~있는, ~없는
+        r'[하되있없]한$',  # ~한
+        r'[하되있없]할$',  # ~할
+        r'[하되있없]해$',  # ~해
+    )
+
+    # 조사 패턴 (정규식으로 필터링할 패턴) - 범용적으로 적용
+    # 모든 조사가 단어 끝에 붙는 패턴을 감지
+    JOSA_PATTERNS = (
+        # 주격 조사
+        r'이$', r'가$', r'은$', r'는$',
+        # 목적격 조사
+        r'을$', r'를$',
+        # 부사격 조사
+        r'에$', r'에서$', r'에게$', r'께$', r'한테$',
+        # 관형격 조사
+        r'의$',
+        # 보조사
+        r'도$', r'만$', r'까지$', r'부터$', r'보다$', r'처럼$', r'같이$',
+        # 부사격 조사 (추가)
+        r'로$', r'으로$', r'하고$',
+    )
+    
+    # 어미/조사 패턴을 하나의 정규식으로 한 번만 컴파일 (패턴 중 하나라도 맞으면 일치, 모두 단어 끝 기준)
+    _ENDING_RE = re.compile('(?:' + '|'.join(dict.fromkeys(p[:-1] for p in ENDING_PATTERNS)) + ')$')
+    _JOSA_RE = re.compile('(?:' + '|'.join(p[:-1] for p in JOSA_PATTERNS) + ')$')
+    # _remove_josa에서 순서대로 떼어 낼 조사 (JOSA_PATTERNS 순서)
+    _JOSA_SUFFIXES = tuple(p[:-1] for p in JOSA_PATTERNS)
+    
     def __init__(self, use_konlpy: bool = True):
         """
         형태소 분석기 초기화
@@ -168,72 +278,37 @@ class MorphemeAnalyzer:
                         print("[INFO] 간단한 키워드 분석 방법을 사용합니다.")
                         self.use_konlpy = False
         
-        # 불용어 리스트 (한국어) - 기본 조사와 의미 없는 단어만 포함
-        # 조사가 붙은 형태는 정규식 패턴으로 자동 처리하므로 여기서는 기본 조사만 포함
-        self.stopwords = {
-            # 기본 조사 (단독으로 사용되는 경우)
-            '이', '가', '을', '를', '에', '의', '와', '과', '은', '는',
-            '도', '로', '으로', '에서', '에게', '께', '한테', '처럼',
-            '만', '까지', '부터', '보다', '같이', '하고',
-            '만큼', '대로', '마저', '조차',
-            
-            # 대명사/지시어
-            '그', '이것', '저것', '그것', '이런', '저런', '그런',
-            '이', '저', '그', '어떤', '무엇', '누구', '어디',
-            
-            # 일반 명사 (의미 없는 단어)
-            '것', '수', '때', '등', '및', '또', '또한', '그리고',
-            '경우', '때문', '위해', '통해', '대해', '관련',
-            
-            # 접속어/부사
-            '하지만', '그러나', '따라서', '그래서', '그런데',
-            '그래도', '그리고', '또한', '그래서', '따라서',
-            '그런데', '그러면', '그렇다면', '그러므로',
-            
-            # 동사 어간/어미 (기본 형태만)
-            '있', '없', '되', '하',
-            '있다', '없다', '된다', '하다', '이다', '아니다',
-            
-            # 기타 불필요한 단어
-            '등', '및', '또', '또한', '그리고', '그러나',
-            '때문', '위해', '통해', '대해', '관련', '경우',
-            '수', '때', '것',
-        }
+        # Kkma/Komoran 객체는 스레드 안전하지 않으므로 공유할 때 pos 호출을 직렬화 (Okt는 동시 호출 가능)
+        self._pos_lock = threading.Lock() if self.analyzer is not None and not isinstance(self.analyzer, Okt) else None
+        # warm() 완료 여부
+        self.ready = False
+    
+    @property
+    def backend_name(self) -> str:
+        """사용 중인 형태소 분석기 이름 (konlpy를 사용하지 않으면 'simple')"""
+        if self.use_konlpy and self.analyzer is not None:
+            return type(self.analyzer).__name__
+        return 'simple'
+    
+    def _pos(self, text: str, **kwargs) -> List[Tuple[str, str]]:
+        """konlpy 품사 태깅 (공유 인스턴스에서 스레드 안전하게 호출)"""
+        with self._pos_lock or nullcontext():
+            return self.analyzer.pos(text, **kwargs)
+    
+    def warm(self) -> float:
+        """
+        짧은 문장을 한 번 분석해 JVM 클래스 로딩과 사전 로딩을 끝냅니다 (첫 요청 지연 제거).
         
-        # 어미 패턴 (정규식으로 필터링할 패턴) - 범용적으로 적용
-        self.ending_patterns = [
-            # 종결 어미
-            r'습니다$', r'합니다$', r'됩니다$', r'입니다$', r'합니다$',
-            # 연결 어미
-            r'해야$', r'해야$', r'해야$',
-            r'할$', r'한$', r'하는$', r'되는$', r'있는$', r'없는$',
-            r'해$', r'되$', r'있$', r'없$',
-            # 동사/형용사 어미 패턴
-            r'[하되있없]다$',  # ~하다, ~되다, ~있다, ~없다
-            r'[하되있없]는$',  # ~하는, ~되는, ~있는, ~없는
-            r'[하되있없]한$',  # ~한
-            r'[하되있없]할$',  # ~할
-            r'[하되있없]해$',  # ~해
-        ]
-        
-        # 조사 패턴 (정규식으로 필터링할 패턴) - 범용적으로 적용
-        # 모든 조사가 단어 끝에 붙는 패턴을 감지
-        self.josa_patterns = [
-            # 주격 조사
-            r'이$', r'가$', r'은$', r'는$',
-            # 목적격 조사
-            r'을$', r'를$',
-            # 부사격 조사
-            r'에$', r'에서$', r'에게$', r'께$', r'한테$',
-            # 관형격 조사
-            r'의$',
-            # 보조사
-            r'도$', r'만$', r'까지$', r'부터$', r'보다$', r'처럼$', r'같이$',
-            # 부사격 조사 (추가)
-            r'로$', r'으로$', r'하고$',
-        ]
-    
-    def analyze_keywords(self, text: str, min_length: int = 2, min_count: int = 1) -> List[Tuple[str, int, int]]:
+        Returns:
+            예열에 걸린 시간 (초)
+        """
+        start = time.perf_counter()
+        self.analyze_keywords(_WARM_TEXT, min_length=2, min_count=1, markers=False)
+        self.ready = True
+        return time.perf_counter() - start
+    
+    def analyze_keywords(self, text: str, min_length: int = 2, min_count: int = 1,
+                         markers: bool = True) -> List[Tuple[str, int, int]]:
         """
         텍스트에서 키워드를 추출하고 빈도와 순위를 계산합니다.
         
@@ -241,6 +316,7 @@ class MorphemeAnalyzer:
             text: 분석할 텍스트
             min_length: 키워드 최소 길이 (기본값: 2)
             min_count: 최소 출현 횟수 (기본값: 1, 이 횟수 이상인 키워드만 반환)
+            markers: 텍스트에 [이미지 삽입N] 등 마커가 들어 있을 수 있는지 (False면 마커 제거 생략)
             
         Returns:
             (키워드, 빈도, 순위) 튜플 리스트 (빈도순 정렬)
@@ -249,13 +325,8 @@ class MorphemeAnalyzer:
             return []
         
         try:
-            if self.use_konlpy and self.analyzer:
-                keywords = self._extract_keywords_with_konlpy(text, min_length)
-            else:
-                keywords = self._extract_keywords_simple(text, min_length)
-            
             # 빈도 계산
-            keyword_counter = Counter(keywords)
+            keyword_counter = self.count_keywords(text, min_length=min_length, markers=markers)
             
             # 최소 출현 횟수 필터링
             filtered_keywords = {
@@ -283,6 +354,68 @@ class MorphemeAnalyzer:
             traceback.print_exc()
             return []
     
+    def text_chunks(self, text: str, markers: bool = True) -> List[str]:
+        """
+        텍스트를 전처리한 뒤 CHUNK_CHARS 크기의 조각으로 나눕니다 (조각은 다시 전처리해도 바뀌지 않음).
+        
+        Args:
+            text: 분석할 텍스트
+            markers: 텍스트에 [이미지 삽입N] 등 마커가 들어 있을 수 있는지
+            
+        Returns:
+            전처리된 조각 리스트
+        """
+        return split_text_chunks(self._preprocess_text(text, markers=markers), CHUNK_CHARS)
+    
+    def count_keywords(self, text: str, min_length: int = 2, markers: bool = True) -> Counter:
+        """
+        텍스트 전체의 키워드 빈도를 계산합니다.
+        konlpy를 사용하면 조각(CHUNK_CHARS)마다 품사 태깅해 빈도를 합치므로, 텍스트 길이에 비례하는 시간과
+        조각 크기로 제한된 메모리로 끝까지 분석합니다.
+        
+        Args:
+            text: 분석할 텍스트
+            min_length: 키워드 최소 길이
+            markers: 텍스트에 [이미지 삽입N] 등 마커가 들어 있을 수 있는지
+            
+        Returns:
+            {키워드: 빈도} Counter
+        """
+        if not (self.use_konlpy and self.analyzer):
+            return Counter(self._extract_keywords_simple(text, min_length, markers=markers))
+        if CHUNK_CHARS <= 0:
+            return Counter(self._extract_keywords_with_konlpy(text, min_length, markers=markers))
+        keyword_counter = Counter()
+        for chunk in self.text_chunks(text, markers=markers):
+            keyword_counter.update(
+                self._extract_keywords_with_konlpy(chunk, min_length, max_text_length=CHUNK_CHARS, markers=False)
+            )
+        return keyword_counter
+    
+    @staticmethod
+    def text_from_blocks(blocks: List[dict]) -> str:
+        """
+        본문 블록 리스트(extract_blog_body_with_media 결과의 'blocks')에서 분석할 텍스트만 모읍니다.
+        문단/제목/인용 텍스트와 링크 텍스트를 사용하고, 이미지/링크/이모티콘 마커는 포함하지 않습니다.
+        """
+        return '\n'.join(block['text'] for block in blocks if block.get('text'))
+    
+    def analyze_blocks(self, blocks: List[dict], min_length: int = 2, min_count: int = 1) -> List[Tuple[str, int, int]]:
+        """
+        본문 블록 리스트에서 키워드를 분석합니다 (마커를 정규식으로 다시 제거하지 않음).
+        
+        Args:
+            blocks: extract_blog_body_with_media 결과의 'blocks'
+            min_length: 키워드 최소 길이 (기본값: 2)
+            min_count: 최소 출현 횟수 (기본값: 1)
+            
+        Returns:
+            analyze_keywords와 같은 (키워드, 빈도, 순위) 튜플 리스트
+        """
+        return self.analyze_keywords(
+            self.text_from_blocks(blocks), min_length=min_length, min_count=min_count, markers=False
+        )
+    
     def get_keyword_ranking(self, text: str, top_n: Optional[int] = None, min_length: int = 2, min_count: int = 1) -> Dict[str, Dict[str, int]]:
         """
         키워드 빈도와 순위를 딕셔너리 형태로 반환합니다.
@@ -297,7 +430,20 @@ class MorphemeAnalyzer:
             {키워드: {'count': 빈도, 'rank': 순위}} 형태의 딕셔너리
         """
         results = self.analyze_keywords(text, min_length=min_length, min_count=min_count)
+        return self.ranking_from_results(results, top_n=top_n)
+    
+    @staticmethod
+    def ranking_from_results(results: List[Tuple[str, int, int]], top_n: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        analyze_keywords 결과를 get_keyword_ranking 형태의 딕셔너리로 변환합니다.
         
+        Args:
+            results: (키워드, 빈도, 순위) 튜플 리스트
+            top_n: 상위 N개만 반환 (None이면 전체 반환)
+            
+        Returns:
+            {키워드: {'count': 빈도, 'rank': 순위}} 형태의 딕셔너리
+        """
         if top_n:
             results = results[:top_n]
         
@@ -317,7 +463,16 @@ class MorphemeAnalyzer:
             min_count: 최소 출현 횟수 (기본값: 1)
         """
         results = self.analyze_keywords(text, min_length=min_length, min_count=min_count)
+        self.print_results(results, top_n=top_n)
+    
+    def print_results(self, results: List[Tuple[str, int, int]], top_n: Optional[int] = None):
+        """
+        이미 계산된 analyze_keywords 결과로 키워드 통계를 출력합니다.
         
+        Args:
+            results: (키워드, 빈도, 순위) 튜플 리스트
+            top_n: 상위 N개만 출력 (None이면 전체 출력)
+        """
         if not results:
             print("[INFO] 분석된 키워드가 없습니다.")
             return
@@ -375,201 +530,74 @@ class MorphemeAnalyzer:
             print(f"총 {len(results)}개의 키워드가 분석되었습니다.")
             print("=" * 60 + "\n")
     
-    def _extract_keywords_with_konlpy(self, text: str, min_length: int, max_text_length: int = 10000) -> List[str]:
+    def _extract_keywords_with_konlpy(self, text: str, min_length: int, max_text_length: int = 10000,
+                                      markers: bool = True) -> List[str]:
         """
         konlpy를 사용한 키워드 추출
         """
         try:
             # 텍스트 전처리
-            cleaned_text = self._preprocess_text(text)
+            cleaned_text = self._preprocess_text(text, markers=markers)
             
             # 텍스트가 너무 길면 자동으로 잘라서 처리
             if len(cleaned_text) > max_text_length:
                 print(f"[INFO] 텍스트가 너무 깁니다 ({len(cleaned_text)}자). 처음 {max_text_length}자만 분석합니다.")
                 cleaned_text = cleaned_text[:max_text_length]
             
-            keywords = []
-            
-            # Okt 사용 시
-            if isinstance(self.analyzer, Okt):
-                try:
-                    if len(cleaned_text) > 2000:
-                        # 긴 텍스트는 문장 단위로 나눠서 처리
-                        sentences = re.split(r'[.!?。！？\n]+', cleaned_text)
-                        for sentence in sentences:
-                            if len(sentence.strip()) > 0:
-                                try:
-                                    pos_tags = self.analyzer.pos(sentence.strip(), stem=True)
-                                    sentence_keywords = []
-                                    for word, pos in pos_tags:
-                                        # 명사와 영문만
-                                        if pos not in ['Noun', 'Alpha']:
-                                            continue
-                                        # 조사가 붙은 경우 제거 시도
-                                        if self._has_josa(word):
-                                            word = self._remove_josa(word)
-                                        # 최소 길이 체크
-                                        if len(word) < min_length:
-                                            continue
-                                        # 불용어 체크
-                                        if word in self.stopwords:
-                                            continue
-                                        # 어미 패턴 체크
-                                        if self._is_ending_word(word):
-                                            continue
-                                        sentence_keywords.append(word)
-                                    keywords.extend(sentence_keywords)
-                                except Exception:
-                                    continue
-                    else:
-                        pos_tags = self.analyzer.pos(cleaned_text, stem=True)
-                        keywords = []
-                        for word, pos in pos_tags:
-                            # 명사와 영문만
-                            if pos not in ['Noun', 'Alpha']:
-                                continue
-                            # 조사가 붙은 경우 제거 시도
-                            if self._has_josa(word):
-                                word = self._remove_josa(word)
-                            # 최소 길이 체크
-                            if len(word) < min_length:
-                                continue
-                            # 불용어 체크
-                            if word in self.stopwords:
-                                continue
-                            # 어미 패턴 체크
-                            if self._is_ending_word(word):
-                                continue
-                            keywords.append(word)
-                except Exception as e:
-                    print(f"[WARN] Okt 형태소 분석 중 오류: {e}")
-                    return self._extract_keywords_simple(text, min_length)
-            
-            # Kkma 사용 시
-            elif isinstance(self.analyzer, Kkma):
-                try:
-                    if len(cleaned_text) > 2000:
-                        sentences = re.split(r'[.!?。！？\n]+', cleaned_text)
-                        for sentence in sentences:
-                            if len(sentence.strip()) > 0:
-                                try:
-                                    pos_tags = self.analyzer.pos(sentence.strip())
-                                    sentence_keywords = []
-                                    for word, pos in pos_tags:
-                                        # 명사만
-                                        if not pos.startswith('N'):
-                                            continue
-                                        # 조사, 어미, 동사, 형용사 제외
-                                        if pos.startswith('J') or pos.startswith('E') or pos.startswith('V') or pos.startswith('VA'):
-                                            continue
-                                        # 조사가 붙은 경우 제거 시도
-                                        if self._has_josa(word):
-                                            word = self._remove_josa(word)
-                                        # 최소 길이 체크
-                                        if len(word) < min_length:
-                                            continue
-                                        # 불용어 체크
-                                        if word in self.stopwords:
-                                            continue
-                                        # 어미 패턴 체크
-                                        if self._is_ending_word(word):
-                                            continue
-                                        sentence_keywords.append(word)
-                                    keywords.extend(sentence_keywords)
-                                except Exception:
-                                    continue
-                    else:
-                        pos_tags = self.analyzer.pos(cleaned_text)
-                        keywords = []
-                        for word, pos in pos_tags:
-                            # 명사만
-                            if not pos.startswith('N'):
-                                continue
-                            # 조사, 어미, 동사, 형용사 제외
-                            if pos.startswith('J') or pos.startswith('E') or pos.startswith('V') or pos.startswith('VA'):
-                                continue
-                            # 조사가 붙은 경우 제거 시도
-                            if self._has_josa(word):
-                                word = self._remove_josa(word)
-                            # 최소 길이 체크
-                            if len(word) < min_length:
-                                continue
-                            # 불용어 체크
-                            if word in self.stopwords:
-                                continue
-                            # 어미 패턴 체크
-                            if self._is_ending_word(word):
-                                continue
-                            keywords.append(word)
-                except Exception as e:
-                    print(f"[WARN] Kkma 형태소 분석 중 오류: {e}")
-                    return self._extract_keywords_simple(text, min_length)
-            
-            # Komoran 사용 시
-            elif isinstance(self.analyzer, Komoran):
-                try:
-                    if len(cleaned_text) > 2000:
-                        sentences = re.split(r'[.!?。！？\n]+', cleaned_text)
-                        for sentence in sentences:
-                            if len(sentence.strip()) > 0:
-                                try:
-                                    pos_tags = self.analyzer.pos(sentence.strip())
-                                    sentence_keywords = []
-                                    for word, pos in pos_tags:
-                                        # 명사만
-                                        if not pos.startswith('N'):
-                                            continue
-                                        # 조사, 어미, 동사, 형용사 제외
-                                        if pos.startswith('J') or pos.startswith('E') or pos.startswith('V') or pos.startswith('VA'):
-                                            continue
-                                        # 조사가 붙은 경우 제거 시도
-                                        if self._has_josa(word):
-                                            word = self._remove_josa(word)
-                                        # 최소 길이 체크
-                                        if len(word) < min_length:
-                                            continue
-                                        # 불용어 체크
-                                        if word in self.stopwords:
-                                            continue
-                                        # 어미 패턴 체크
-                                        if self._is_ending_word(word):
-                                            continue
-                                        sentence_keywords.append(word)
-                                    keywords.extend(sentence_keywords)
-                                except Exception:
-                                    continue
-                    else:
-                        pos_tags = self.analyzer.pos(cleaned_text)
-                        keywords = []
-                        for word, pos in pos_tags:
-                            # 명사만
-                            if not pos.startswith('N'):
-                                continue
-                            # 조사, 어미, 동사, 형용사 제외
-                            if pos.startswith('J') or pos.startswith('E') or pos.startswith('V') or pos.startswith('VA'):
-                                continue
-                            # 조사가 붙은 경우 제거 시도
-                            if self._has_josa(word):
-                                word = self._remove_josa(word)
-                            # 최소 길이 체크
-                            if len(word) < min_length:
-                                continue
-                            # 불용어 체크
-                            if word in self.stopwords:
-                                continue
-                            # 어미 패턴 체크
-                            if self._is_ending_word(word):
-                                continue
-                            keywords.append(word)
-                except Exception as e:
-                    print(f"[WARN] Komoran 형태소 분석 중 오류: {e}")
-                    return self._extract_keywords_simple(text, min_length)
+            try:
+                keywords = []
+                for pos_tags in self._pos_batches(cleaned_text):
+                    keywords.extend(self._keywords_from_pos(pos_tags, min_length))
+            except Exception as e:
+                print(f"[WARN] {type(self.analyzer).__name__} 형태소 분석 중 오류: {e}")
+                return self._extract_keywords_simple(text, min_length, markers=markers)
             
             return keywords
             
         except Exception as e:
             print(f"[ERROR] konlpy 키워드 추출 실패: {e}")
-            return self._extract_keywords_simple(text, min_length)
+            return self._extract_keywords_simple(text, min_length, markers=markers)
+    
+    def _pos_batches(self, cleaned_text: str):
+        """
+        전처리된 텍스트의 품사 태깅 결과를 pos 호출(Python↔JVM 왕복) 단위로 생성합니다.
+        _preprocess_text가 문장 부호와 줄바꿈을 모두 공백으로 바꾸므로 문장 단위로 나눌 수 없고,
+        텍스트(count_keywords에서는 조각 하나) 전체를 한 번에 태깅합니다 (기존 2000자 초과 시 문장 분리 분기도 실제로는 한 번 호출).
+        """
+        # Okt만 어간 추출 옵션 사용
+        pos_kwargs = {'stem': True} if isinstance(self.analyzer, Okt) else {}
+        yield self._pos(cleaned_text, **pos_kwargs)
+    
+    def _keywords_from_pos(self, pos_tags: List[Tuple[str, str]], min_length: int) -> List[str]:
+        """품사 태깅 결과에서 키워드(명사/영문)를 골라 조사/불용어/어미 필터를 적용합니다."""
+        is_okt = isinstance(self.analyzer, Okt)
+        keywords = []
+        for word, pos in pos_tags:
+            if is_okt:
+                # 명사와 영문만
+                if pos not in ['Noun', 'Alpha']:
+                    continue
+            else:
+                # 명사만
+                if not pos.startswith('N'):
+                    continue
+                # 조사, 어미, 동사, 형용사 제외
+                if pos.startswith('J') or pos.startswith('E') or pos.startswith('V') or pos.startswith('VA'):
+                    continue
+            # 조사가 붙은 경우 제거 시도
+            if self._has_josa(word):
+                word = self._remove_josa(word)
+            # 최소 길이 체크
+            if len(word) < min_length:
+                continue
+            # 불용어 체크
+            if word in self.STOPWORDS:
+                continue
+            # 어미 패턴 체크
+            if self._is_ending_word(word):
+                continue
+            keywords.append(word)
+        return keywords
     
     def _is_ending_word(self, word: str) -> bool:
         """
@@ -581,10 +609,7 @@ class MorphemeAnalyzer:
         Returns:
             어미 패턴이 포함되어 있으면 True
         """
-        for pattern in self.ending_patterns:
-            if re.search(pattern, word):
-                return True
-        return False
+        return self._ENDING_RE.search(word) is not None
     
     def _has_josa(self, word: str) -> bool:
         """
@@ -596,10 +621,7 @@ class MorphemeAnalyzer:
         Returns:
             조사가 붙어있으면 True
         """
-        for pattern in self.josa_patterns:
-            if re.search(pattern, word):
-                return True
-        return False
+        return self._JOSA_RE.search(word) is not None
     
     def _remove_josa(self, word: str) -> str:
         """
@@ -612,21 +634,23 @@ class MorphemeAnalyzer:
             조사가 제거된 단어 (조사가 제거된 후 빈 문자열이면 원본 반환)
         """
         original_word = word
-        for pattern in self.josa_patterns:
-            word = re.sub(pattern, '', word)
+        # 기존 패턴별 re.sub와 같이 JOSA_PATTERNS 순서대로 단어 끝의 조사를 하나씩 떼어 냄
+        for suffix in self._JOSA_SUFFIXES:
+            if word.endswith(suffix):
+                word = word[:-len(suffix)]
         word = word.strip()
         # 조사 제거 후 단어가 너무 짧아지면 원본 반환 (예: "이" -> "")
         if len(word) < 1:
             return original_word
         return word
     
-    def _extract_keywords_simple(self, text: str, min_length: int) -> List[str]:
+    def _extract_keywords_simple(self, text: str, min_length: int, markers: bool = True) -> List[str]:
         """
         konlpy 없이 간단한 키워드 추출
         """
         try:
             # 텍스트 전처리
-            cleaned_text = self._preprocess_text(text)
+            cleaned_text = self._preprocess_text(text, markers=markers)
             
             # 단어 분리 (공백, 구두점 기준)
             words = re.findall(r'[\w가-힣]+', cleaned_text)
@@ -641,7 +665,7 @@ class MorphemeAnalyzer:
                 if len(word) < min_length:
                     continue
                 # 불용어 체크
-                if word in self.stopwords:
+                if word in self.STOPWORDS:
                     continue
                 # 숫자 제외
                 if word.isdigit():
@@ -657,8 +681,14 @@ class MorphemeAnalyzer:
             print(f"[ERROR] 간단한 키워드 추출 실패: {e}")
             return []
     
-    def _preprocess_text(self, text: str) -> str:
-        """텍스트 전처리"""
+    def _preprocess_text(self, text: str, markers: bool = True) -> str:
+        """
+        텍스트 전처리
+        
+        Args:
+            text: 전처리할 텍스트
+            markers: [이미지 삽입N] 등 마커를 제거할지 (블록 텍스트처럼 마커가 없는 텍스트는 False)
+        """
         # HTML 태그 제거
         text = re.sub(r'<[^>]+>', '', text)
         
@@ -670,8 +700,9 @@ class MorphemeAnalyzer:
         
         # 마커 패턴 제거 ([이미지 삽입1], [링크 삽입2], [이모티콘 삽입3] 등)
         # 숫자가 포함된 패턴과 숫자가 없는 패턴 모두 처리
-        text = re.sub(r'\[(이미지|링크|이모티콘)\s*삽입\s*\d+\]', '', text)
-        text = re.sub(r'\[(이미지|링크|이모티콘)\s*삽입\]', '', text)
+        if markers:
+            text = re.sub(r'\[(이미지|링크|이모티콘)\s*삽입\s*\d+\]', '', text)
+            text = re.sub(r'\[(이미지|링크|이모티콘)\s*삽입\]', '', text)
         
         # 특수 문자 제거 (일부 제외)
         text = re.sub(r'[^\w가-힣\s]', ' ', text)
@@ -726,10 +757,29 @@ class MorphemeAnalyzer:
             print("[INFO] pip install pandas openpyxl 로 설치하세요.")
             return None
         
-        try:
-            # 키워드 분석
-            results = self.analyze_keywords(text, min_length=min_length, min_count=min_count)
+        # 키워드 분석
+        results = self.analyze_keywords(text, min_length=min_length, min_count=min_count)
+        return self.export_results_to_excel(results, output_path=output_path, top_n=top_n)
+    
+    def export_results_to_excel(self, results: List[Tuple[str, int, int]], output_path: str = None,
+                                top_n: Optional[int] = None) -> Optional[str]:
+        """
+        이미 계산된 analyze_keywords 결과를 엑셀 파일로 저장합니다 (형태소 분석을 다시 하지 않음).
+        
+        Args:
+            results: (키워드, 빈도, 순위) 튜플 리스트
+            output_path: 저장할 엑셀 파일 경로 (None이면 자동 생성)
+            top_n: 상위 N개만 저장 (None이면 전체 저장)
             
+        Returns:
+            저장된 파일 경로 (실패하면 None)
+        """
+        if not PANDAS_AVAILABLE:
+            print("[ERROR] pandas가 설치되지 않았습니다. 엑셀 저장 기능을 사용할 수 없습니다.")
+            print("[INFO] pip install pandas openpyxl 로 설치하세요.")
+            return None
+        
+        try:
             if not results:
                 print("[WARN] 분석된 키워드가 없습니다. 엑셀 파일을 생성할 수 없습니다.")
                 return None
@@ -815,6 +865,77 @@ class MorphemeAnalyzer:
             return None
 
 
+# 공유 인스턴스 (지연 초기화)
+_shared_analyzer: Optional[MorphemeAnalyzer] = None
+_shared_analyzer_lock = threading.Lock()
+_shared_warm_seconds: Optional[float] = None
+
+
+def get_shared_analyzer() -> MorphemeAnalyzer:
+    """
+    프로세스 공유 MorphemeAnalyzer(use_konlpy=True)를 반환합니다.
+    Okt → Kkma → Komoran 초기화와 JVM 시작은 처음 한 번만 실행됩니다 (ANALYZER_SHARED=0이면 매번 새로 생성).
+    ANALYZER_WORKERS가 설정되어 있으면 워커 프로세스로 분석을 보내는 PooledAnalyzer를 반환합니다 (analyzer_pool 참고).
+    
+    Returns:
+        MorphemeAnalyzer 인스턴스
+    """
+    global _shared_analyzer
+    from .analyzer_pool import ANALYZER_WORKERS, AnalyzerPool, PooledAnalyzer
+    if ANALYZER_WORKERS > 0:
+        if _shared_analyzer is None:
+            with _shared_analyzer_lock:
+                if _shared_analyzer is None:
+                    _shared_analyzer = PooledAnalyzer(AnalyzerPool(ANALYZER_WORKERS))
+        return _shared_analyzer
+    if not ANALYZER_SHARED:
+        return MorphemeAnalyzer(use_konlpy=True)
+    if _shared_analyzer is None:
+        with _shared_analyzer_lock:
+            if _shared_analyzer is None:
+                _shared_analyzer = MorphemeAnalyzer(use_konlpy=True)
+    return _shared_analyzer
+
+
+def warm_shared_analyzer() -> MorphemeAnalyzer:
+    """
+    공유 분석기를 만들고 예열합니다 (서버 시작 시 호출, 이미 예열되었으면 바로 반환).
+    
+    Returns:
+        예열된 MorphemeAnalyzer 인스턴스
+    """
+    global _shared_warm_seconds
+    analyzer = get_shared_analyzer()
+    if not analyzer.ready:
+        try:
+            _shared_warm_seconds = analyzer.warm()
+            print(f"[INFO] 형태소 분석기 예열 완료 ({analyzer.backend_name}, {_shared_warm_seconds:.2f}초)")
+        except Exception as e:
+            print(f"[WARN] 형태소 분석기 예열 실패: {e}")
+    return analyzer
+
+
+def close_shared_analyzer():
+    """공유 분석기가 워커 프로세스를 사용하면 종료합니다 (서버 종료 시 호출)."""
+    analyzer = _shared_analyzer
+    if analyzer is not None and hasattr(analyzer, 'close'):
+        analyzer.close()
+
+
+def shared_analyzer_status() -> Dict[str, object]:
+    """공유 분석기 준비 상태 (헬스 체크용, 워커 프로세스를 사용하면 워커별 대기열 길이 포함)"""
+    analyzer = _shared_analyzer
+    status = {
+        'shared': ANALYZER_SHARED,
+        'ready': bool(analyzer is not None and analyzer.ready),
+        'backend': analyzer.backend_name if analyzer is not None else None,
+        'warm_seconds': round(_shared_warm_seconds, 3) if _shared_warm_seconds is not None else None,
+    }
+    if analyzer is not None and hasattr(analyzer, 'pool'):
+        status['pool'] = analyzer.pool.stats()
+    return status
+
+
 def analyze_keywords_from_text(text: str, top_n: Optional[int] = None, min_length: int = 2, min_count: int = 1, use_konlpy: bool = True) -> List[Tuple[str, int, int]]:
     """
     간편 함수: 텍스트에서 키워드 빈도와 순위 분석
@@ -829,7 +950,7 @@ def analyze_keywords_from_text(text: str, top_n: Optional[int] = None, min_lengt
     Returns:
         (키워드, 빈도, 순위) 튜플 리스트
     """
-    analyzer = MorphemeAnalyzer(use_konlpy=use_konlpy)
+    analyzer = get_shared_analyzer() if use_konlpy else MorphemeAnalyzer(use_konlpy=False)
     results = analyzer.analyze_keywords(text, min_length=min_length, min_count=min_count)
     
     if top_n:
@@ -854,7 +975,7 @@ def export_keywords_to_excel(text: str, output_path: str = None, top_n: Optional
     Returns:
         저장된 파일 경로 (실패하면 None)
     """
-    analyzer = MorphemeAnalyzer(use_konlpy=use_konlpy)
+    analyzer = get_shared_analyzer() if use_konlpy else MorphemeAnalyzer(use_konlpy=False)
     return analyzer.export_to_excel(text, output_path=output_path, top_n=top_n,
                                    min_length=min_length, min_count=min_count)
 
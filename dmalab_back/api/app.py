@@ -12,6 +12,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote, unquote, urlparse
 import hashlib
+import shutil
 from dotenv import load_dotenv
 
 # .env 파일 로드 (프로젝트 루트에서)
@@ -20,7 +21,7 @@ project_root = current_dir.parent.parent  # DMaLab 디렉토리
 load_dotenv(project_root / ".env")
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
-from fastapi.responses import Response, FileResponse
+from fastapi.responses import Response, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -32,12 +33,27 @@ import mimetypes
 import json
 import uuid
 import asyncio
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta
 from enum import Enum
 
 from crawler.naver_crawler import NaverCrawler
-from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from crawler.blog_document import BlogDocument
+from crawler.async_fetcher import close_async_fetcher
+from crawler.page_cache import get_page_cache
+from crawler.serp_cache import get_serp_cache
+from crawler.rank_snapshot import content_fingerprint, get_rank_snapshot_store
+from crawler.rate_limiter import get_rate_limiter
+from crawler.circuit_breaker import get_circuit_breaker
+from crawler.session_pool import get_crawler_pool
+from crawler.parse_pool import get_parse_pool
+from analyzer.morpheme_analyzer import (
+    close_shared_analyzer,
+    get_shared_analyzer,
+    shared_analyzer_status,
+    warm_shared_analyzer,
+)
 from blog.gpt_generator import (
     generate_blog_content,
     save_blog_json,
@@ -200,6 +216,11 @@ task_queues: Dict[str, List[str]] = defaultdict(list)
 # IP별 최대 동시 실행 작업 수 (기본 1개)
 MAX_CONCURRENT_TASKS_PER_IP = int(os.getenv("MAX_CONCURRENT_TASKS_PER_IP", "1"))
 
+# 요청 하나에서 동시에 수집할 블로그 글 수 (비동기 수집용, 기본 5개)
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "5"))
+# 배치 검색에서 동시에 처리할 키워드 수 (실제 요청 속도는 호스트별 속도 제한을 따름)
+SEARCH_BATCH_CONCURRENCY = int(os.getenv("SEARCH_BATCH_CONCURRENCY", "4"))
+
 def create_task_id() -> str:
     """고유한 작업 ID를 생성합니다."""
     return str(uuid.uuid4())
@@ -696,14 +717,23 @@ app.add_middleware(
 
 class BlogInfo(BaseModel):
     """블로그 정보 모델"""
-    title: str
+    title: Optional[str] = None
     url: str
+    title_pending: bool = Field(default=False, description="검색 결과에 제목이 없어 아직 찾지 않은 경우 True")
 
 
 class SearchRequest(BaseModel):
     """검색 요청 모델"""
     keyword: str = Field(..., description="검색 키워드")
     n: int = Field(default=3, ge=1, le=10, description="가져올 블로그 개수 (1-10)")
+    resolve_titles: bool = Field(default=True, description="검색 결과에 제목이 없는 글의 제목을 찾아서 반환할지 여부 (False면 title_pending으로 표시하고 바로 반환)")
+
+
+class SearchBatchRequest(BaseModel):
+    """배치 검색 요청 모델"""
+    keywords: List[str] = Field(..., min_length=1, max_length=200, description="검색 키워드 리스트")
+    n: int = Field(default=3, ge=1, le=10, description="키워드별로 가져올 블로그 개수 (1-10)")
+    resolve_titles: bool = Field(default=True, description="검색 결과에 제목이 없는 글의 제목을 찾아서 반환할지 여부")
 
 
 class SearchResponse(BaseModel):
@@ -717,12 +747,16 @@ class CrawlRequest(BaseModel):
     """크롤링 요청 모델 (단일)"""
     url: str = Field(..., description="블로그 URL")
     title: Optional[str] = Field(None, description="블로그 제목 (선택사항)")
+    include_blocks: bool = Field(default=False, description="본문 블록 리스트(문단/제목/인용/이미지/링크/이모티콘)를 함께 반환할지 여부")
+    include_text: bool = Field(default=True, description="마커가 들어간 본문 텍스트(body_text)를 반환할지 여부")
 
 
 class CrawlBulkRequest(BaseModel):
     """크롤링 요청 모델 (리스트)"""
     urls: List[str] = Field(..., description="크롤링할 블로그 URL 리스트")
     titles: Optional[List[Optional[str]]] = Field(None, description="블로그 제목 리스트 (선택사항, urls와 같은 길이)")
+    include_blocks: bool = Field(default=False, description="본문 블록 리스트를 함께 반환할지 여부")
+    include_text: bool = Field(default=True, description="마커가 들어간 본문 텍스트(body_text)를 반환할지 여부")
 
 
 class CrawlResponse(BaseModel):
@@ -734,6 +768,7 @@ class CrawlResponse(BaseModel):
     body_length: Optional[int] = None
     image_urls: Optional[List[str]] = None
     link_urls: Optional[List[str]] = None
+    blocks: Optional[List[Dict[str, Any]]] = Field(default=None, description="본문 블록 리스트 (include_blocks=true일 때)")
     txt_path: Optional[str] = None
     error: Optional[str] = None
 
@@ -777,6 +812,7 @@ class ProcessRequest(BaseModel):
     top_n: int = Field(default=20, ge=1, le=100, description="상위 N개 키워드")
     min_length: int = Field(default=2, ge=1, description="최소 키워드 길이")
     min_count: int = Field(default=2, ge=1, description="최소 출현 횟수")
+    incremental: bool = Field(default=False, description="지난 실행과 순위를 비교해 새로 들어온/바뀐 글만 다시 처리할지 여부")
 
 
 class ProcessResult(BaseModel):
@@ -793,6 +829,9 @@ class ProcessResult(BaseModel):
     excel_path: Optional[str] = None
     keywords: Optional[List[KeywordStat]] = None
     error: Optional[str] = None
+    rank_status: Optional[str] = Field(default=None, description="지난 실행 대비 순위 변화 (new, same, moved)")
+    previous_rank: Optional[int] = None
+    reused: bool = Field(default=False, description="지난 실행 결과를 재사용했는지 여부")
 
 
 class ProcessResponse(BaseModel):
@@ -802,6 +841,8 @@ class ProcessResponse(BaseModel):
     total_count: int
     success_count: int
     results: List[ProcessResult]
+    recomputed_ranks: List[int] = Field(default_factory=list, description="이번에 새로 수집/분석한 순위")
+    reused_ranks: List[int] = Field(default_factory=list, description="지난 실행 결과를 재사용한 순위")
 
 
 class GenerateBlogRequest(BaseModel):
@@ -1035,7 +1076,7 @@ def get_create_blog_prompt_directory() -> Path:
     return output_dir
 
 
-def build_reference_analysis(
+async def build_reference_analysis(
     keyword: str,
     use_auto_reference: bool,
     reference_count: int,
@@ -1044,17 +1085,19 @@ def build_reference_analysis(
     """
     키워드와 참고용 블로그 URL들을 기반으로 상위 블로그 본문을 수집·분석하여
     GPT 프롬프트에 전달할 analysis_json을 생성합니다.
+    참고 블로그 본문은 이벤트 루프에서 동시에 수집합니다.
     """
-    from analyzer.morpheme_analyzer import MorphemeAnalyzer
+    from analyzer.morpheme_analyzer import get_shared_analyzer
 
     try:
         reference_urls: List[str] = []
 
         # 1) 키워드 기반 상위 블로그 자동 수집
         if use_auto_reference:
-            crawler = NaverCrawler()
             logger.info(f"[GENERATE][REF] auto reference enabled, keyword={keyword!r}, n={reference_count}")
-            auto_list = crawler.get_top_n_blog_info(keyword, n=reference_count)
+            async with get_crawler_pool().crawler_async() as crawler:
+                # 참고 분석에는 URL만 필요하므로 제목은 찾지 않음
+                auto_list = await crawler.get_top_n_blog_info_async(keyword, n=reference_count, resolve_titles=False)
             for item in auto_list or []:
                 url = item.get("url")
                 if url and url not in reference_urls:
@@ -1071,26 +1114,42 @@ def build_reference_analysis(
             logger.info("[GENERATE][REF] no reference urls provided/collected")
             return None
 
-        # 3) 각 URL에서 본문 텍스트 수집
-        crawler = NaverCrawler()
+        # 3) 각 URL에서 본문 텍스트 수집 (동시 수집, 결과는 URL 순서 유지)
+        crawler_pool = get_crawler_pool()
         body_texts: List[str] = []
+        # 본문 블록 리스트 (모든 글에 블록이 있으면 마커를 다시 제거하지 않고 블록 텍스트를 분석)
+        body_blocks: List[dict] = []
+        blocks_available = True
         used_urls: List[str] = []
+        semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
 
-        for url in reference_urls:
-            try:
-                result = crawler.extract_blog_body_with_media(url)
-                body_text = result.get("body_text") if result else None
-                if not body_text:
-                    logger.warning(f"[GENERATE][REF] no body_text for reference url={url!r}")
-                    continue
-                text = str(body_text).strip()
-                if not text:
-                    continue
-                body_texts.append(text)
-                used_urls.append(url)
-            except Exception as e:
-                logger.warning(f"[GENERATE][REF] error extracting body for url={url!r}: {e}")
+        async def extract_reference(url: str):
+            async with semaphore:
+                async with crawler_pool.crawler_async() as crawler:
+                    return await crawler.extract_blog_body_with_media_async(url)
+
+        extracted = await asyncio.gather(
+            *[extract_reference(url) for url in reference_urls],
+            return_exceptions=True
+        )
+
+        for url, result in zip(reference_urls, extracted):
+            if isinstance(result, Exception):
+                logger.warning(f"[GENERATE][REF] error extracting body for url={url!r}: {result}")
+                continue
+            body_text = result.get("body_text") if result else None
+            if not body_text:
+                logger.warning(f"[GENERATE][REF] no body_text for reference url={url!r}")
                 continue
+            text = str(body_text).strip()
+            if not text:
+                continue
+            body_texts.append(text)
+            used_urls.append(url)
+            if result.get("blocks") is None:
+                blocks_available = False
+            else:
+                body_blocks.extend(result["blocks"])
 
         if not body_texts:
             logger.warning("[GENERATE][REF] no usable body_text from any reference urls")
@@ -1103,14 +1162,21 @@ def build_reference_analysis(
 
         combined_text = "\n\n".join(body_texts)
 
-        # 4) 키워드 분석
-        analyzer = MorphemeAnalyzer(use_konlpy=True)
-        keyword_stats = analyzer.get_keyword_ranking(
-            combined_text,
-            top_n=10,
-            min_length=2,
-            min_count=2
-        )
+        # 4) 키워드 분석 (CPU 작업이므로 실행기에서 처리)
+        def analyze_combined_text():
+            analyzer = get_shared_analyzer()
+            if blocks_available:
+                results = analyzer.analyze_blocks(body_blocks, min_length=2, min_count=2)
+                return analyzer.ranking_from_results(results, top_n=10)
+            return analyzer.get_keyword_ranking(
+                combined_text,
+                top_n=10,
+                min_length=2,
+                min_count=2
+            )
+
+        loop = asyncio.get_event_loop()
+        keyword_stats = await loop.run_in_executor(None, analyze_combined_text)
 
         top_keywords = [
             {
@@ -1147,9 +1213,15 @@ def process_single_blog(
     analyze: bool = True,
     top_n: int = 20,
     min_length: int = 2,
-    min_count: int = 2
+    min_count: int = 2,
+    media_result: Optional[Dict[str, Any]] = None
 ) -> ProcessResult:
-    """단일 블로그를 처리하는 함수"""
+    """
+    단일 블로그를 처리하는 함수
+    
+    페이지는 한 번만 수집/파싱하고(BlogDocument), txt 저장과 키워드 통계/엑셀 저장은
+    그 결과를 재사용합니다. media_result가 주어지면(비동기 수집 결과) 수집도 생략합니다.
+    """
     result = ProcessResult(
         rank=rank,
         title=blog_info['title'],
@@ -1160,19 +1232,23 @@ def process_single_blog(
     try:
         top_dir = os.path.join(base_output_dir, f"TOP{rank}")
         
-        # 본문 텍스트 및 미디어 URL 추출
-        media_result = crawler.extract_blog_body_with_media(blog_info['url'])
+        # 본문 텍스트 및 미디어 URL 추출 (한 번만 수집)
+        if media_result is not None:
+            document = BlogDocument.from_media_result(blog_info['url'], media_result, title=blog_info['title'], crawler=crawler)
+        else:
+            document = BlogDocument(blog_info['url'], title=blog_info['title'], crawler=crawler)
+            document.fetch()
         
-        if not media_result or not media_result.get('body_text'):
+        if not document.is_loaded:
             result.error = "본문 텍스트를 추출할 수 없습니다."
             return result
         
-        body_text = media_result['body_text']
+        body_text = document.body_text
         result.body_text = body_text
         result.body_length = len(body_text)
         
         # 이미지 URL을 다운로드하여 저장하고 경로 변환 (마커 순서와 일치)
-        original_image_urls = media_result.get('image_urls', [])
+        original_image_urls = document.image_urls
         saved_image_paths = []
         for idx, img_url in enumerate(original_image_urls, 1):
             # 블로그 URL을 Referer로 전달하여 원본 이미지 다운로드
@@ -1192,24 +1268,20 @@ def process_single_blog(
                 saved_image_paths.append(f"/api/image-proxy?url={quote(img_url)}&output_dir={quote(top_dir)}&referer={quote(blog_info['url'])}")
         
         result.image_urls = saved_image_paths
-        result.link_urls = media_result.get('link_urls', [])
+        result.link_urls = document.link_urls
         
-        # 본문을 txt 파일로 저장
-        txt_path = crawler.save_blog_to_txt(
-            blog_info['url'],
-            title=blog_info['title'],
-            output_dir=top_dir
-        )
+        # 본문을 txt 파일로 저장 (추출한 본문 재사용)
+        txt_path = document.save_txt(output_dir=top_dir)
         result.txt_path = txt_path
         
         # 키워드 분석
         if analyze:
             try:
-                analyzer = MorphemeAnalyzer(use_konlpy=True)
+                analyzer = get_shared_analyzer()
                 
-                # 키워드 통계 가져오기
-                keyword_stats = analyzer.get_keyword_ranking(
-                    body_text,
+                # 키워드 통계 가져오기 (분석 결과는 엑셀 저장에 재사용)
+                keyword_stats = document.keyword_ranking(
+                    analyzer,
                     top_n=top_n,
                     min_length=min_length,
                     min_count=min_count
@@ -1223,16 +1295,9 @@ def process_single_blog(
                 result.keywords = keywords
                 
                 # 엑셀 파일로 저장
-                if txt_path:
-                    base_name = os.path.splitext(os.path.basename(txt_path))[0]
-                    excel_path = os.path.join(top_dir, f"{base_name}_keyword_analysis.xlsx")
-                else:
-                    excel_filename = f"blog_{int(datetime.now().timestamp())}_keyword_analysis.xlsx"
-                    excel_path = os.path.join(top_dir, excel_filename)
-                
-                excel_path = analyzer.export_to_excel(
-                    body_text,
-                    output_path=excel_path,
+                excel_path = document.export_excel(
+                    analyzer,
+                    output_path=document.excel_path_for(top_dir),
                     top_n=top_n,
                     min_length=min_length,
                     min_count=min_count
@@ -1250,6 +1315,45 @@ def process_single_blog(
     return result
 
 
+def reuse_process_result(previous_entry: Dict[str, Any], previous_output_dir: str, rank: int,
+                         output_dir: str, title: Optional[str] = None) -> ProcessResult:
+    """
+    지난 실행의 처리 결과를 재사용합니다 (증분 처리).
+    지난 TOP 디렉토리의 txt/엑셀/이미지를 이번 출력 디렉토리의 TOP{rank}로 복사하고 경로를 바꿉니다.
+    """
+    old_top_dir = os.path.join(previous_output_dir, f"TOP{previous_entry['rank']}")
+    new_top_dir = os.path.join(output_dir, f"TOP{rank}")
+    shutil.copytree(old_top_dir, new_top_dir, dirs_exist_ok=True)
+
+    # 파일 경로, 정적 이미지 경로, 이미지 프록시 URL의 TOP 디렉토리 부분을 교체
+    replacements = [(old_top_dir + os.sep, new_top_dir + os.sep), (quote(old_top_dir) + "&", quote(new_top_dir) + "&")]
+    try:
+        old_relative = Path(old_top_dir).relative_to(NAVER_CRAWLER_DIR).as_posix()
+        new_relative = Path(new_top_dir).relative_to(NAVER_CRAWLER_DIR).as_posix()
+        replacements.append((f"/static/naver_crawler/{old_relative}/", f"/static/naver_crawler/{new_relative}/"))
+    except ValueError:
+        pass
+
+    def move_path(value: Optional[str]) -> Optional[str]:
+        if not value:
+            return value
+        for old, new in replacements:
+            value = value.replace(old, new)
+        return value
+
+    data = dict(previous_entry['result'])
+    data.update(
+        rank=rank,
+        txt_path=move_path(data.get('txt_path')),
+        excel_path=move_path(data.get('excel_path')),
+        image_urls=[move_path(url) for url in data.get('image_urls') or []],
+        reused=True
+    )
+    if title:
+        data['title'] = title
+    return ProcessResult(**data)
+
+
 # ===== API 엔드포인트 =====
 
 @app.get("/")
@@ -1262,10 +1366,36 @@ async def root():
     }
 
 
+@app.on_event("startup")
+async def warm_crawler_sessions():
+    """서버 시작 시 크롤러 세션 풀을 미리 준비합니다."""
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, get_crawler_pool().warm)
+
+
+@app.on_event("startup")
+async def warm_morpheme_analyzer():
+    """
+    서버 시작 시 공유 형태소 분석기를 백그라운드에서 만들고 예열합니다 (JVM 시작/사전 로딩).
+    예열이 끝나면 /health의 analyzer.ready가 true가 됩니다.
+    """
+    loop = asyncio.get_event_loop()
+    loop.run_in_executor(None, warm_shared_analyzer)
+
+
+@app.on_event("shutdown")
+async def shutdown_crawler_clients():
+    """서버 종료 시 공유 HTTP 커넥션 풀을 정리하고 세션 쿠키를 저장합니다 (파싱/형태소 분석 워커 프로세스도 종료)."""
+    await close_async_fetcher()
+    get_crawler_pool().close()
+    get_parse_pool().close()
+    close_shared_analyzer()
+
+
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
+    """헬스 체크 엔드포인트 (analyzer.ready: 형태소 분석기 예열 완료 여부)"""
+    return {"status": "healthy", "analyzer": shared_analyzer_status()}
 
 
 @app.get("/api/usage")
@@ -1506,6 +1636,47 @@ async def get_usage_stats(http_request: Request):
         raise HTTPException(status_code=500, detail=f"사용량 통계 조회 중 오류 발생: {str(e)}")
 
 
+@app.get("/api/admin/page-cache-stats")
+async def get_page_cache_stats(http_request: Request):
+    """
+    관리자용: 블로그 글 페이지 캐시의 적중/미스/재검증 통계를 조회합니다.
+    TTL(PAGE_CACHE_TTL)을 키워드 구성에 맞게 조정할 때 참고합니다.
+    Admin IP만 접근 가능합니다.
+    """
+    client_ip = get_client_ip(http_request)
+    if not is_admin_ip(client_ip):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    return get_page_cache().stats()
+
+
+@app.get("/api/admin/serp-cache-stats")
+async def get_serp_cache_stats(http_request: Request):
+    """
+    관리자용: 검색 결과(SERP) 캐시의 적중/만료 후 사용/미스/백그라운드 새로 고침 통계를 조회합니다.
+    TTL(SERP_CACHE_TTL, SERP_CACHE_STALE_TTL)을 조정할 때 참고합니다.
+    Admin IP만 접근 가능합니다.
+    """
+    client_ip = get_client_ip(http_request)
+    if not is_admin_ip(client_ip):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    return get_serp_cache().stats()
+
+
+@app.get("/api/crawler/status")
+async def get_crawler_status():
+    """
+    호스트별 차단 감지 서킷 상태를 반환합니다.
+    state가 open이면 retry_after초 동안 해당 호스트 수집이 중단됩니다.
+    """
+    hosts = get_circuit_breaker().status()
+    return {
+        "paused": any(h["state"] != "closed" for h in hosts.values()),
+        "hosts": hosts,
+        "session_pool": get_crawler_pool().status(),
+        "parse_pool": get_parse_pool().stats()
+    }
+
+
 @app.post("/api/search", response_model=SearchResponse)
 async def search_blogs(request: SearchRequest):
     """
@@ -1513,16 +1684,22 @@ async def search_blogs(request: SearchRequest):
     
     - **keyword**: 검색할 키워드
     - **n**: 가져올 블로그 개수 (1-10)
+    - **resolve_titles**: False면 제목이 없는 글을 title_pending으로 표시해 바로 반환
     """
     try:
         logger.info(f"[SEARCH] keyword={request.keyword!r}, n={request.n}")
-        crawler = NaverCrawler()
-        blog_list = crawler.get_top_n_blog_info(request.keyword, n=request.n)
-        
+        async with get_crawler_pool().crawler_async() as crawler:
+            blog_list = await crawler.get_top_n_blog_info_async(
+                request.keyword, n=request.n, resolve_titles=request.resolve_titles
+            )
+            
         if not blog_list or len(blog_list) == 0:
             raise HTTPException(status_code=404, detail="블로그 글을 찾을 수 없습니다.")
         
-        blogs = [BlogInfo(title=blog['title'], url=blog['url']) for blog in blog_list]
+        blogs = [
+            BlogInfo(title=blog['title'], url=blog['url'], title_pending=blog.get('title_pending', False))
+            for blog in blog_list
+        ]
         logger.info(f"[SEARCH] found {len(blogs)} blogs for keyword={request.keyword!r}")
         
         return SearchResponse(
@@ -1535,6 +1712,86 @@ async def search_blogs(request: SearchRequest):
         raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
 
 
+@app.post("/api/search/batch")
+async def search_blogs_batch(request: SearchBatchRequest):
+    """
+    여러 키워드를 한 번에 검색하고, 키워드별 결과를 준비되는 대로 NDJSON으로 스트리밍합니다.
+    
+    - **keywords**: 검색할 키워드 리스트 (중복/빈 키워드는 한 번만 처리)
+    - **n**: 키워드별로 가져올 블로그 개수 (1-10)
+    - **resolve_titles**: False면 제목이 없는 글을 title_pending으로 표시해 바로 반환
+    
+    각 줄은 하나의 JSON 객체입니다 (index는 요청한 keywords 리스트에서의 위치).
+    - {"type": "result", "index", "keyword", "count", "blogs": [...]}
+    - {"type": "error", "index", "keyword", "error"}
+    - 마지막 줄: {"type": "summary", "total", "succeeded", "failed", "elapsed"}
+    
+    검색 요청은 공유 속도 제한과 SERP 캐시를 거치므로, 캐시된 키워드는 바로 반환됩니다.
+    """
+    from crawler.serp_cache import normalize_keyword
+
+    # (요청 리스트에서의 위치, 키워드)
+    keywords = []
+    seen = set()
+    for index, keyword in enumerate(request.keywords):
+        key = normalize_keyword(keyword)
+        if key and key not in seen:
+            seen.add(key)
+            keywords.append((index, keyword.strip()))
+    if not keywords:
+        raise HTTPException(status_code=400, detail="검색할 키워드가 없습니다.")
+
+    logger.info(f"[SEARCH][BATCH] keywords={len(keywords)}, n={request.n}")
+    crawler_pool = get_crawler_pool()
+    semaphore = asyncio.Semaphore(SEARCH_BATCH_CONCURRENCY)
+
+    async def search_one(index: int, keyword: str) -> Dict[str, Any]:
+        try:
+            async with semaphore:
+                async with crawler_pool.crawler_async() as crawler:
+                    blog_list = await crawler.get_top_n_blog_info_async(
+                        keyword, n=request.n, resolve_titles=request.resolve_titles
+                    )
+        except Exception as e:
+            logger.exception(f"[SEARCH][BATCH] error for keyword={keyword!r}: {e}")
+            return {"type": "error", "index": index, "keyword": keyword, "error": f"검색 중 오류 발생: {str(e)}"}
+
+        if not blog_list:
+            return {"type": "error", "index": index, "keyword": keyword, "error": "블로그 글을 찾을 수 없습니다."}
+        blogs = [
+            BlogInfo(title=blog['title'], url=blog['url'], title_pending=blog.get('title_pending', False)).model_dump()
+            for blog in blog_list
+        ]
+        return {"type": "result", "index": index, "keyword": keyword, "count": len(blogs), "blogs": blogs}
+
+    async def stream_results():
+        started = time.time()
+        succeeded = 0
+        tasks = [asyncio.ensure_future(search_one(index, keyword)) for index, keyword in keywords]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                line = await next_done
+                if line["type"] == "result":
+                    succeeded += 1
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+            elapsed = round(time.time() - started, 2)
+            logger.info(f"[SEARCH][BATCH] done keywords={len(keywords)}, succeeded={succeeded}, elapsed={elapsed}s")
+            yield json.dumps({
+                "type": "summary",
+                "total": len(keywords),
+                "succeeded": succeeded,
+                "failed": len(keywords) - succeeded,
+                "elapsed": elapsed
+            }, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 검색을 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @app.post("/api/crawl", response_model=CrawlResponse)
 async def crawl_blog(request: CrawlRequest):
     """
@@ -1545,40 +1802,43 @@ async def crawl_blog(request: CrawlRequest):
     """
     try:
         logger.info(f"[CRAWL] single url={request.url!r}, title={request.title!r}")
-        crawler = NaverCrawler()
-        result = crawler.extract_blog_body_with_media(request.url)
-        
-        if not result or not result.get('body_text'):
-            logger.warning(f"[CRAWL] no body_text extracted for url={request.url!r}")
+        async with get_crawler_pool().crawler_async() as crawler:
+            result = await crawler.extract_blog_body_with_media_async(request.url)
+            
+            if not result or not result.get('body_text'):
+                logger.warning(f"[CRAWL] no body_text extracted for url={request.url!r}")
+                return CrawlResponse(
+                    success=False,
+                    url=request.url,
+                    error="본문 텍스트를 추출할 수 없습니다."
+                )
+            
+            body_text = result['body_text']
+            image_urls = result.get('image_urls', [])
+            link_urls = result.get('link_urls', [])
+            logger.info(
+                f"[CRAWL] success url={request.url!r}, "
+                f"body_length={len(body_text)}, images={len(image_urls)}, links={len(link_urls)}"
+            )
+            
+            # txt 파일 저장 (선택사항, 이미 추출한 본문을 실행기에서 저장)
+            txt_path = None
+            if request.title:
+                txt_path = await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: crawler.write_blog_txt(request.url, body_text, title=request.title)
+                )
+            
             return CrawlResponse(
-                success=False,
+                success=True,
+                title=request.title,
                 url=request.url,
-                error="본문 텍스트를 추출할 수 없습니다."
+                body_text=body_text if request.include_text else None,
+                body_length=len(body_text),
+                image_urls=image_urls if image_urls else None,
+                link_urls=link_urls if link_urls else None,
+                blocks=result.get('blocks') if request.include_blocks else None,
+                txt_path=txt_path
             )
-        
-        body_text = result['body_text']
-        image_urls = result.get('image_urls', [])
-        link_urls = result.get('link_urls', [])
-        logger.info(
-            f"[CRAWL] success url={request.url!r}, "
-            f"body_length={len(body_text)}, images={len(image_urls)}, links={len(link_urls)}"
-        )
-        
-        # txt 파일 저장 (선택사항)
-        txt_path = None
-        if request.title:
-            txt_path = crawler.save_blog_to_txt(request.url, title=request.title)
-        
-        return CrawlResponse(
-            success=True,
-            title=request.title,
-            url=request.url,
-            body_text=body_text,
-            body_length=len(body_text),
-            image_urls=image_urls if image_urls else None,
-            link_urls=link_urls if link_urls else None,
-            txt_path=txt_path
-        )
     except Exception as e:
         logger.exception(f"[CRAWL] error for url={request.url!r}: {e}")
         return CrawlResponse(
@@ -1604,60 +1864,78 @@ async def crawl_blogs_bulk(request: CrawlBulkRequest):
                 detail="titles 리스트의 길이가 urls 리스트의 길이와 일치하지 않습니다."
             )
         
-        crawler = NaverCrawler()
-        results = []
-        success_count = 0
-        
-        for i, url in enumerate(request.urls):
-            title = request.titles[i] if request.titles else None
+        async with get_crawler_pool().crawler_async() as crawler:
+            results = []
+            success_count = 0
             
-            try:
-                media_result = crawler.extract_blog_body_with_media(url)
+            # 모든 URL을 이벤트 루프에서 동시에 수집 (동시 수집 개수 제한)
+            semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+            
+            async def extract_one(url: str):
+                async with semaphore:
+                    return await crawler.extract_blog_body_with_media_async(url)
+            
+            media_results = await asyncio.gather(
+                *[extract_one(url) for url in request.urls],
+                return_exceptions=True
+            )
+            loop = asyncio.get_event_loop()
+            
+            for i, url in enumerate(request.urls):
+                title = request.titles[i] if request.titles else None
+            
+                try:
+                    media_result = media_results[i]
+                    if isinstance(media_result, Exception):
+                        raise media_result
+                
+                    if not media_result or not media_result.get('body_text'):
+                        results.append(CrawlResponse(
+                            success=False,
+                            url=url,
+                            title=title,
+                            error="본문 텍스트를 추출할 수 없습니다."
+                        ))
+                        continue
+                
+                    body_text = media_result['body_text']
+                    image_urls = media_result.get('image_urls', [])
+                    link_urls = media_result.get('link_urls', [])
+                
+                    # txt 파일 저장 (선택사항, 이미 추출한 본문을 저장하므로 페이지를 다시 요청하지 않음)
+                    txt_path = None
+                    if title:
+                        txt_path = await loop.run_in_executor(
+                            None, lambda: crawler.write_blog_txt(url, body_text, title=title)
+                        )
+                
+                    results.append(CrawlResponse(
+                        success=True,
+                        title=title,
+                        url=url,
+                        body_text=body_text if request.include_text else None,
+                        body_length=len(body_text),
+                        image_urls=image_urls if image_urls else None,
+                        link_urls=link_urls if link_urls else None,
+                        blocks=media_result.get('blocks') if request.include_blocks else None,
+                        txt_path=txt_path
+                    ))
+                    success_count += 1
                 
-                if not media_result or not media_result.get('body_text'):
+                except Exception as e:
                     results.append(CrawlResponse(
                         success=False,
                         url=url,
                         title=title,
-                        error="본문 텍스트를 추출할 수 없습니다."
+                        error=str(e)
                     ))
-                    continue
-                
-                body_text = media_result['body_text']
-                image_urls = media_result.get('image_urls', [])
-                link_urls = media_result.get('link_urls', [])
-                
-                # txt 파일 저장 (선택사항)
-                txt_path = None
-                if title:
-                    txt_path = crawler.save_blog_to_txt(url, title=title)
-                
-                results.append(CrawlResponse(
-                    success=True,
-                    title=title,
-                    url=url,
-                    body_text=body_text,
-                    body_length=len(body_text),
-                    image_urls=image_urls if image_urls else None,
-                    link_urls=link_urls if link_urls else None,
-                    txt_path=txt_path
-                ))
-                success_count += 1
-                
-            except Exception as e:
-                results.append(CrawlResponse(
-                    success=False,
-                    url=url,
-                    title=title,
-                    error=str(e)
-                ))
-        
-        return CrawlBulkResponse(
-            total_count=len(results),
-            success_count=success_count,
-            results=results
-        )
-        
+            
+            return CrawlBulkResponse(
+                total_count=len(results),
+                success_count=success_count,
+                results=results
+            )
+            
     except HTTPException:
         raise
     except Exception as e:
@@ -1679,7 +1957,7 @@ async def analyze_keywords(request: AnalyzeRequest):
             f"[ANALYZE] text_length={len(request.text)}, "
             f"top_n={request.top_n}, min_length={request.min_length}, min_count={request.min_count}"
         )
-        analyzer = MorphemeAnalyzer(use_konlpy=True)
+        analyzer = get_shared_analyzer()
         
         # 키워드 통계 가져오기
         keyword_stats = analyzer.get_keyword_ranking(
@@ -1722,6 +2000,8 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
     - **top_n**: 상위 N개 키워드
     - **min_length**: 최소 키워드 길이
     - **min_count**: 최소 출현 횟수
+    - **incremental**: True면 지난 실행의 순위 스냅샷과 비교해 새로 들어오거나 내용이 바뀐 글만 다시 수집/분석하고,
+      나머지는 저장된 결과를 재사용 (응답의 recomputed_ranks/reused_ranks로 확인)
     """
     try:
         # 사용량 제한 확인 (상위 블로그 분석)
@@ -1737,17 +2017,13 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
         logger.info(
             f"[PROCESS] keyword={request.keyword!r}, n={request.n}, "
             f"analyze={request.analyze}, top_n={request.top_n}, "
-            f"min_length={request.min_length}, min_count={request.min_count}"
-        )
-        # 1. 블로그 검색 (비동기 처리)
-        loop = asyncio.get_event_loop()
-        crawler = NaverCrawler()
-        blog_list = await loop.run_in_executor(
-            None,
-            crawler.get_top_n_blog_info,
-            request.keyword,
-            request.n
+            f"min_length={request.min_length}, min_count={request.min_count}, "
+            f"incremental={request.incremental}"
         )
+        # 1. 블로그 검색 (비동기 처리, 검색 결과에 없는 제목은 본문 수집 후 페이지에서 찾음)
+        crawler_pool = get_crawler_pool()
+        async with crawler_pool.crawler_async() as crawler:
+            blog_list = await crawler.get_top_n_blog_info_async(request.keyword, request.n, resolve_titles=False)
         
         if not blog_list or len(blog_list) == 0:
             raise HTTPException(status_code=404, detail="블로그 글을 찾을 수 없습니다.")
@@ -1756,29 +2032,95 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
         # 2. 출력 디렉토리 생성 (요청한 개수만큼만) - 동기 처리 (순서 보장 필요)
         output_dir = get_output_directory(count=request.n)
         
-        # 3. 병렬 처리 (비동기로 실행하여 다른 요청을 블로킹하지 않음)
-        results = []
+        # 지난 실행과 순위 비교 (증분 처리)
+        snapshot_store = get_rank_snapshot_store()
+        settings = {
+            "analyze": request.analyze,
+            "top_n": request.top_n,
+            "min_length": request.min_length,
+            "min_count": request.min_count
+        }
+        # 스냅샷 파일 읽기/쓰기와 결과 파일 확인은 이벤트 루프 밖에서
         loop = asyncio.get_event_loop()
+        previous_snapshot = await loop.run_in_executor(None, snapshot_store.load, request.keyword)
+        rank_changes = snapshot_store.diff(previous_snapshot, [blog['url'] for blog in blog_list])
+        reusable = {}
+        if request.incremental and previous_snapshot:
+            # 재사용 후보는 조건부 요청(ETag/Last-Modified)으로 확인한 지금 본문이 그때와 같을 때만 재사용
+            revalidate_semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+
+            async def reusable_entry_async(url: str):
+                candidate = await loop.run_in_executor(
+                    None, snapshot_store.candidate_entry, previous_snapshot, url, settings
+                )
+                if candidate is None:
+                    return None
+                async with revalidate_semaphore:
+                    async with crawler_pool.crawler_async() as crawler_instance:
+                        current = await crawler_instance.extract_current_body_async(url)
+                return await loop.run_in_executor(
+                    None, snapshot_store.reusable_entry, previous_snapshot, url, settings, content_fingerprint(current)
+                )
+
+            entries = await asyncio.gather(
+                *[reusable_entry_async(change['url']) for change in rank_changes],
+                return_exceptions=True
+            )
+            for change, entry in zip(rank_changes, entries):
+                if isinstance(entry, Exception):
+                    logger.warning(f"[PROCESS] revalidation failed for url={change['url']!r}: {entry}")
+                elif entry is not None:
+                    reusable[change['rank']] = entry
+            logger.info(
+                f"[PROCESS] incremental: reuse ranks={sorted(reusable)}, "
+                f"recompute ranks={[c['rank'] for c in rank_changes if c['rank'] not in reusable]}"
+            )
+        
+        # 3. 병렬 처리 (본문 수집은 이벤트 루프에서, 이미지 저장·분석은 스레드에서)
+        results = []
+        # 다시 처리한 순위의 본문 해시 (스냅샷에 저장)
+        fingerprints = {}
+        semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
         with ThreadPoolExecutor(max_workers=min(request.n, 3)) as executor:
             # 각 블로그 처리를 비동기로 실행
             async def process_single_blog_async(blog_info, rank):
-                crawler_instance = NaverCrawler()
+                # 세마포어를 먼저 얻은 뒤 크롤러를 빌림 (크롤러를 쥔 채 세마포어를 기다리지 않도록)
+                async with semaphore:
+                    async with crawler_pool.crawler_async() as crawler_instance:
+                        media_result = await crawler_instance.extract_blog_body_with_media_async(blog_info['url'])
+                        fingerprints[rank] = content_fingerprint(media_result)
+                        if blog_info.get('title_pending'):
+                            # 방금 수집한 페이지(페이지 캐시)에서 제목을 찾음
+                            blog_title = await crawler_instance.resolve_title_async(blog_info['url'], keyword=request.keyword)
+                            blog_info = {**blog_info, 'title': blog_title or "제목 없음"}
+                        return await loop.run_in_executor(
+                            executor,
+                            process_single_blog,
+                            crawler_instance,
+                            blog_info,
+                            rank,
+                            output_dir,
+                            request.analyze,
+                            request.top_n,
+                            request.min_length,
+                            request.min_count,
+                            media_result or {}
+                        )
+                    
+            async def reuse_single_blog_async(blog_info, rank):
                 return await loop.run_in_executor(
                     executor,
-                    process_single_blog,
-                    crawler_instance,
-                    blog_info,
+                    reuse_process_result,
+                    reusable[rank],
+                    previous_snapshot['output_dir'],
                     rank,
                     output_dir,
-                    request.analyze,
-                    request.top_n,
-                    request.min_length,
-                    request.min_count
+                    blog_info['title']
                 )
             
-            # 모든 블로그를 동시에 처리
+            # 모든 블로그를 동시에 처리 (재사용할 수 있는 순위는 지난 결과를 복사)
             tasks = [
-                process_single_blog_async(blog_info, i)
+                reuse_single_blog_async(blog_info, i) if i in reusable else process_single_blog_async(blog_info, i)
                 for i, blog_info in enumerate(blog_list, 1)
             ]
             
@@ -1790,7 +2132,7 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
                     logger.exception(f"[PROCESS] error processing rank={rank}: {result}")
                     results.append(ProcessResult(
                         rank=rank,
-                        title=blog_list[rank-1]['title'] if rank <= len(blog_list) else "알 수 없음",
+                        title=(blog_list[rank-1]['title'] or "알 수 없음") if rank <= len(blog_list) else "알 수 없음",
                         url=blog_list[rank-1]['url'] if rank <= len(blog_list) else "",
                         success=False,
                         error=str(result)
@@ -1801,10 +2143,31 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
         # 결과 정렬 (동기 처리 - 순서 보장 필요)
         results.sort(key=lambda x: x.rank)
         
+        for result, change in zip(results, rank_changes):
+            result.rank_status = change['status']
+            result.previous_rank = change['previous_rank']
+        
+        # 다음 증분 처리를 위해 이번 순위와 결과를 저장
+        now = time.time()
+        ranking = [
+            {
+                "rank": result.rank,
+                "url": result.url,
+                "title": result.title,
+                "fingerprint": reusable[result.rank].get("fingerprint") if result.reused else fingerprints.get(result.rank),
+                "processed_at": reusable[result.rank].get("processed_at", now) if result.reused else now,
+                "result": result.model_dump(exclude={"rank_status", "previous_rank", "reused"})
+            }
+            for result in results
+        ]
+        await loop.run_in_executor(None, snapshot_store.save, request.keyword, output_dir, settings, ranking)
+        
+        reused_ranks = [r.rank for r in results if r.reused]
+        recomputed_ranks = [r.rank for r in results if not r.reused]
         success_count = sum(1 for r in results if r.success)
         logger.info(
             f"[PROCESS] done keyword={request.keyword!r}, "
-            f"total={len(results)}, success={success_count}"
+            f"total={len(results)}, success={success_count}, recomputed={recomputed_ranks}"
         )
         
         return ProcessResponse(
@@ -1812,7 +2175,9 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
             output_dir=output_dir,
             total_count=len(results),
             success_count=success_count,
-            results=results
+            results=results,
+            recomputed_ranks=recomputed_ranks,
+            reused_ranks=reused_ranks
         )
         
     except HTTPException:
@@ -1822,7 +2187,7 @@ async def process_blogs(request: ProcessRequest, http_request: Request):
         raise HTTPException(status_code=500, detail=f"처리 중 오류 발생: {str(e)}")
 
 
-def download_and_save_image(image_url: str, output_dir: Optional[str] = None, image_index: Optional[int] = None, referer_url: Optional[str] = None, session: Optional[requests.Session] = None) -> str:
+def download_and_save_image(image_url: str, output_dir: Optional[str] = None, image_index: Optional[int] = None, referer_url: Optional[str] = None, session: Optional[requests.Session] = None, rate_limited: bool = True) -> str:
     """
     이미지를 다운로드하여 서버에 저장하고, 저장된 파일 경로를 반환합니다.
     
@@ -1834,6 +2199,8 @@ def download_and_save_image(image_url: str, output_dir: Optional[str] = None, im
                     None이면 MD5 해시 사용
         referer_url: Referer 헤더로 사용할 블로그 URL (원본 이미지 다운로드를 위해 필요)
         session: requests.Session 객체 (쿠키와 헤더 유지를 위해 사용)
+        rate_limited: True면 요청 전에 호스트별 속도 제한 토큰을 기다림
+                      (호출하는 쪽에서 acquire_async로 이미 토큰을 받았으면 False)
         
     Returns:
         저장된 이미지 파일의 상대 경로 (예: /static/naver_crawler/.../이미지삽입1.jpg)
@@ -1889,6 +2256,10 @@ def download_and_save_image(image_url: str, output_dir: Optional[str] = None, im
             'Cache-Control': 'no-cache'
         }
         
+        # 호스트별 요청 속도 제한 (postfiles.pstatic.net 등)
+        if rate_limited:
+            get_rate_limiter().acquire(original_image_url)
+        
         # 세션이 제공되면 사용 (쿠키와 헤더 유지)
         if session:
             # 세션의 기본 헤더를 복사하고 추가 헤더 업데이트
@@ -1944,8 +2315,16 @@ async def proxy_image(url: str, output_dir: Optional[str] = None, image_index: O
                 output_dir = str(NAVER_CRAWLER_DIR / output_dir.replace('naver_crawler/', ''))
         
         # 이미지 다운로드 및 저장 (image_index 및 referer 전달)
+        # 속도 제한 대기는 이벤트 루프에서 비동기로, 다운로드/저장은 실행기에서 (토큰을 두 번 받지 않도록 rate_limited=False)
         referer_url = unquote(referer) if referer else None
-        saved_path = download_and_save_image(image_url, output_dir, image_index=image_index, referer_url=referer_url)
+        loop = asyncio.get_event_loop()
+        await get_rate_limiter().acquire_async(image_url)
+        saved_path = await loop.run_in_executor(
+            None,
+            lambda: download_and_save_image(
+                image_url, output_dir, image_index=image_index, referer_url=referer_url, rate_limited=False
+            )
+        )
         
         if saved_path:
             # 저장된 파일 경로 파싱
@@ -1975,7 +2354,10 @@ async def proxy_image(url: str, output_dir: Optional[str] = None, image_index: O
             'Sec-Fetch-Site': 'cross-site'
         }
         
-        response = requests.get(image_url, headers=headers, timeout=10, stream=True)
+        await get_rate_limiter().acquire_async(image_url)
+        response = await loop.run_in_executor(
+            None, lambda: requests.get(image_url, headers=headers, timeout=10)
+        )
         response.raise_for_status()
         
         content_type = response.headers.get('Content-Type', 'image/jpeg')
@@ -2040,11 +2422,8 @@ async def generate_blog(request: GenerateBlogRequest, http_request: Request):
                 f"reference_count={request.reference_count}, "
                 f"manual_refs={len(request.manual_reference_urls or [])}"
             )
-            # 비동기로 실행
-            loop = asyncio.get_event_loop()
-            analysis_json = await loop.run_in_executor(
-                None,
-                build_reference_analysis,
+            # 비동기로 실행 (참고 블로그는 이벤트 루프에서 동시 수집)
+            analysis_json = await build_reference_analysis(
                 request.keywords,
                 request.use_auto_reference,
                 request.reference_count,
@@ -2295,6 +2674,7 @@ async def export_blog(request: ExportBlogRequest):
             # http/https URL
             elif src.startswith("http://") or src.startswith("https://"):
                 try:
+                    await get_rate_limiter().acquire_async(src)
                     resp = requests.get(src, timeout=10)
                     if resp.status_code != 200:
                         logger.warning(f"[EXPORT] 이미지 다운로드 실패: url={src}, status={resp.status_code}")
@@ -10,7 +10,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from crawler.naver_crawler import NaverCrawler
-from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from crawler.blog_document import BlogDocument
+from analyzer.morpheme_analyzer import get_shared_analyzer
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 from datetime import datetime
@@ -95,23 +96,20 @@ def process_single_blog(crawler, blog_info, rank, base_output_dir):
         # TOP별 디렉토리 경로 생성
         top_dir = os.path.join(base_output_dir, prefix)
         
-        # 본문 텍스트 추출
-        body_text = crawler.extract_blog_body_text(blog_info['url'])
+        # 본문 텍스트 추출 (한 번만 수집하고 이후 단계에서 재사용)
+        document = BlogDocument(blog_info['url'], title=blog_info['title'], crawler=crawler)
         
-        if not body_text:
+        if not document.fetch():
             result['error'] = "본문 텍스트를 추출할 수 없습니다."
             print(f"[{prefix}] ❌ {result['error']}")
             return result
         
+        body_text = document.body_text
         result['body_text'] = body_text
         print(f"[{prefix}] ✅ 본문 텍스트 추출 완료 (길이: {len(body_text)}자)")
         
         # 본문을 txt 파일로 저장 (TOP 디렉토리 내에 저장)
-        txt_path = crawler.save_blog_to_txt(
-            blog_info['url'], 
-            title=blog_info['title'],
-            output_dir=top_dir
-        )
+        txt_path = document.save_txt(output_dir=top_dir)
         
         if txt_path:
             result['txt_path'] = txt_path
@@ -121,23 +119,17 @@ def process_single_blog(crawler, blog_info, rank, base_output_dir):
         
         # 형태소 분석 및 키워드 빈도 분석
         try:
-            analyzer = MorphemeAnalyzer(use_konlpy=True)
+            analyzer = get_shared_analyzer()
             
             # 키워드 통계 출력 (상위 20개)
-            analyzer.print_keyword_statistics(body_text, top_n=20, min_length=2, min_count=2)
+            keyword_results = document.analyze(analyzer, min_length=2, min_count=2)
+            analyzer.print_results(keyword_results, top_n=20)
             
-            # 엑셀 파일로 저장 (TOP 디렉토리 내에 저장)
-            if txt_path:
-                base_name = os.path.splitext(os.path.basename(txt_path))[0]
-                excel_path = os.path.join(top_dir, f"{base_name}_keyword_analysis.xlsx")
-            else:
-                # txt 파일이 없어도 엑셀 파일은 저장 시도
-                excel_filename = f"blog_{int(os.path.getmtime(top_dir) if os.path.exists(top_dir) else 0)}_keyword_analysis.xlsx"
-                excel_path = os.path.join(top_dir, excel_filename)
-            
-            excel_path = analyzer.export_to_excel(
-                body_text, 
-                output_path=excel_path,
+            # 엑셀 파일로 저장 (TOP 디렉토리 내에 저장, 위 분석 결과 재사용)
+            # txt 파일이 없어도 엑셀 파일은 저장 시도
+            excel_path = document.export_excel(
+                analyzer,
+                output_path=document.excel_path_for(top_dir),
                 top_n=20,
                 min_length=2,
                 min_count=2
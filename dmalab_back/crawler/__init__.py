@@ -3,7 +3,8 @@
 """
 
 from .naver_crawler import NaverCrawler
+from .blog_document import BlogDocument
 # naver_login은 직접 실행할 때만 사용하므로 import하지 않음
 
-__all__ = ['NaverCrawler']
+__all__ = ['NaverCrawler', 'BlogDocument']
 
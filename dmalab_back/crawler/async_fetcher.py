@@ -0,0 +1,156 @@
+"""
+비동기 HTTP 수집 모듈
+asyncio 이벤트 루프 위에서 네이버 페이지를 동시에 수집하기 위한 공유 커넥션 풀을 제공합니다.
+keep-alive 커넥션은 프로세스 전체가 공유하고, 쿠키는 요청마다 넘긴 세션의 쿠키 저장소를 사용합니다
+(공유 클라이언트 자체는 쿠키를 저장하지 않으므로 세션끼리 쿠키가 섞이지 않음).
+"""
+
+import os
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Optional
+
+import httpx
+
+# brotli 디코더가 있어야 br 압축 응답을 풀 수 있음
+BROTLI_AVAILABLE = False
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 커넥션 풀 설정 (환경 변수로 조정 가능)
+ASYNC_MAX_CONNECTIONS = int(os.getenv("CRAWLER_MAX_CONNECTIONS", "20"))
+ASYNC_MAX_KEEPALIVE = int(os.getenv("CRAWLER_MAX_KEEPALIVE", "10"))
+ASYNC_TIMEOUT = float(os.getenv("CRAWLER_TIMEOUT", "15"))
+# 따라갈 최대 리다이렉트 수 (httpx 기본값과 같음)
+ASYNC_MAX_REDIRECTS = 20
+
+
+class AsyncFetcher:
+    """프로세스 전체에서 공유하는 비동기 HTTP 클라이언트 래퍼"""
+
+    def __init__(self, max_connections: int = ASYNC_MAX_CONNECTIONS,
+                 max_keepalive: int = ASYNC_MAX_KEEPALIVE, timeout: float = ASYNC_TIMEOUT):
+        """
+        Args:
+            max_connections: 동시에 열 수 있는 최대 커넥션 수
+            max_keepalive: 유지할 keep-alive 커넥션 수
+            timeout: 요청 타임아웃 (초)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive
+        )
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def accept_encoding(self) -> str:
+        """디코딩 가능한 압축 방식만 Accept-Encoding에 포함합니다."""
+        return 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """클라이언트를 반환합니다 (지연 초기화)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={'Accept-Encoding': self.accept_encoding},
+                # 공유 클라이언트에는 쿠키를 저장하지 않음 (쿠키는 요청마다 넘긴 세션 쿠키 저장소 사용)
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+            )
+        return self._client
+
+    async def _send(self, url: str, headers: Optional[dict], params: Optional[dict],
+                    cookies: Optional[CookieJar], stream: bool) -> httpx.Response:
+        """
+        GET 요청을 보내고 리다이렉트를 직접 따라갑니다.
+        리다이렉트마다 cookies에서 Cookie 헤더를 만들고, 응답의 Set-Cookie를 cookies에 저장합니다.
+        """
+        client = self._get_client()
+        request_headers = dict(headers or {})
+        request_headers['Accept-Encoding'] = self.accept_encoding
+        request = client.build_request('GET', url, headers=request_headers, params=params)
+        jar = httpx.Cookies(cookies) if cookies is not None else None
+        history = []
+        for _ in range(ASYNC_MAX_REDIRECTS + 1):
+            if jar is not None:
+                request.headers.pop('Cookie', None)
+                jar.set_cookie_header(request)
+            response = await client.send(request, stream=stream, follow_redirects=False)
+            if jar is not None:
+                jar.extract_cookies(response)
+            if not response.has_redirect_location:
+                response.history = history
+                return response
+            await response.aclose()
+            history.append(response)
+            request = response.next_request
+        raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.", request=request)
+
+    async def get(self, url: str, headers: Optional[dict] = None, params: Optional[dict] = None,
+                  cookies: Optional[CookieJar] = None) -> httpx.Response:
+        """
+        GET 요청을 보내고 압축이 해제된 응답을 반환합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 요청별 헤더 (User-Agent, Referer 등)
+            params: 쿼리 파라미터
+            cookies: 보내고 받을 쿠키 저장소 (크롤러 세션의 session.cookies, None이면 쿠키 없이 요청)
+
+        Returns:
+            httpx.Response 객체
+        """
+        return await self._send(url, headers, params, cookies, stream=False)
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[dict] = None, params: Optional[dict] = None,
+                     cookies: Optional[CookieJar] = None):
+        """
+        응답 본문을 조각 단위로 읽는 스트리밍 GET 요청입니다.
+        `async with fetcher.stream(url) as response:` 형태로 사용합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 요청별 헤더
+            params: 쿼리 파라미터
+            cookies: 보내고 받을 쿠키 저장소 (get과 같음)
+        """
+        response = await self._send(url, headers, params, cookies, stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def aclose(self):
+        """커넥션 풀을 닫습니다."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+# 공유 인스턴스 (지연 초기화)
+_fetcher: Optional[AsyncFetcher] = None
+
+
+def get_async_fetcher() -> AsyncFetcher:
+    """
+    프로세스 공유 AsyncFetcher를 반환합니다 (지연 초기화).
+
+    Returns:
+        AsyncFetcher 인스턴스
+    """
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = AsyncFetcher()
+    return _fetcher
+
+
+async def close_async_fetcher():
+    """공유 AsyncFetcher의 커넥션 풀을 닫습니다 (서버 종료 시 호출)."""
+    if _fetcher is not None:
+        await _fetcher.aclose()
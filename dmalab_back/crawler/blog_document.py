@@ -0,0 +1,176 @@
+"""
+블로그 글 문서 파이프라인 모듈
+블로그 글을 한 번만 수집/파싱한 뒤, 그 결과 하나로 본문 텍스트, 미디어 목록,
+txt 파일, 키워드 통계, 엑셀 파일을 모두 만들어 냅니다.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .naver_crawler import NaverCrawler
+
+
+class BlogDocument:
+    """한 번 수집한 블로그 글과 그로부터 파생된 결과물을 보관하는 클래스"""
+
+    def __init__(self, url: str, title: Optional[str] = None, crawler: Optional[NaverCrawler] = None):
+        """
+        Args:
+            url: 블로그 글 URL
+            title: 블로그 글 제목 (txt 헤더에 사용)
+            crawler: 사용할 NaverCrawler (None이면 새로 생성)
+        """
+        self.url = url
+        self.title = title
+        self.crawler = crawler or NaverCrawler()
+        self.media: Optional[dict] = None
+        self.txt_path: Optional[str] = None
+        # (min_length, min_count) → analyze_keywords 결과
+        self._keyword_results: Dict[Tuple[int, int], List[Tuple[str, int, int]]] = {}
+
+    @classmethod
+    def from_media_result(cls, url: str, media_result: Optional[dict], title: Optional[str] = None,
+                          crawler: Optional[NaverCrawler] = None) -> 'BlogDocument':
+        """
+        이미 추출한 extract_blog_body_with_media 결과로 문서를 생성합니다 (비동기 수집 결과 재사용).
+
+        Args:
+            url: 블로그 글 URL
+            media_result: extract_blog_body_with_media(_async) 결과
+            title: 블로그 글 제목
+            crawler: 사용할 NaverCrawler
+        """
+        document = cls(url, title=title, crawler=crawler)
+        document.media = media_result or None
+        return document
+
+    def fetch(self) -> bool:
+        """
+        블로그 글을 수집하고 본문/미디어를 추출합니다 (이미 수집했으면 다시 요청하지 않음).
+
+        Returns:
+            본문 텍스트 추출 성공 여부
+        """
+        if self.media is None:
+            self.media = self.crawler.extract_blog_body_with_media(self.url)
+        return self.is_loaded
+
+    async def fetch_async(self) -> bool:
+        """fetch의 asyncio 버전입니다."""
+        if self.media is None:
+            self.media = await self.crawler.extract_blog_body_with_media_async(self.url)
+        return self.is_loaded
+
+    @property
+    def is_loaded(self) -> bool:
+        """본문 텍스트가 추출되었는지 여부"""
+        return bool(self.media and self.media.get('body_text'))
+
+    @property
+    def body_text(self) -> Optional[str]:
+        """본문 텍스트 ([이미지 삽입N], [링크 삽입N] 마커 포함)"""
+        return self.media.get('body_text') if self.media else None
+
+    @property
+    def image_urls(self) -> List[str]:
+        """본문 이미지 URL 목록 (마커 순서와 동일)"""
+        return self.media.get('image_urls', []) if self.media else []
+
+    @property
+    def link_urls(self) -> List[str]:
+        """본문 링크 URL 목록 (마커 순서와 동일)"""
+        return self.media.get('link_urls', []) if self.media else []
+
+    @property
+    def blocks(self) -> Optional[List[dict]]:
+        """본문 블록 리스트 (블록 없이 추출한 결과면 None)"""
+        return self.media.get('blocks') if self.media else None
+
+    def save_txt(self, output_dir: Optional[str] = None, output_path: Optional[str] = None) -> Optional[str]:
+        """
+        본문 텍스트를 txt 파일로 저장합니다.
+
+        Args:
+            output_dir: 저장할 디렉토리 경로
+            output_path: 저장할 파일 경로 (None이면 URL 기반으로 자동 생성)
+
+        Returns:
+            저장된 파일 경로 (실패하면 None)
+        """
+        if not self.is_loaded:
+            print("[ERROR] 본문 텍스트가 없어 txt 파일을 저장할 수 없습니다.")
+            return None
+        self.txt_path = self.crawler.write_blog_txt(
+            self.url,
+            self.body_text,
+            output_path=output_path,
+            title=self.title,
+            output_dir=output_dir
+        )
+        return self.txt_path
+
+    def analyze(self, analyzer, min_length: int = 2, min_count: int = 1) -> List[Tuple[str, int, int]]:
+        """
+        본문 키워드를 분석합니다. 같은 조건의 분석 결과는 재사용합니다.
+        블록 리스트가 있으면 마커가 없는 블록 텍스트를 바로 분석합니다.
+
+        Args:
+            analyzer: MorphemeAnalyzer 인스턴스
+            min_length: 키워드 최소 길이
+            min_count: 최소 출현 횟수
+
+        Returns:
+            (키워드, 빈도, 순위) 튜플 리스트
+        """
+        key = (min_length, min_count)
+        if key not in self._keyword_results:
+            if self.blocks is not None:
+                self._keyword_results[key] = analyzer.analyze_blocks(
+                    self.blocks, min_length=min_length, min_count=min_count
+                )
+            else:
+                self._keyword_results[key] = analyzer.analyze_keywords(
+                    self.body_text or "", min_length=min_length, min_count=min_count
+                )
+        return self._keyword_results[key]
+
+    def keyword_ranking(self, analyzer, top_n: Optional[int] = None, min_length: int = 2,
+                        min_count: int = 1) -> Dict[str, Dict[str, int]]:
+        """
+        키워드 통계를 {키워드: {'count', 'rank'}} 형태로 반환합니다.
+
+        Args:
+            analyzer: MorphemeAnalyzer 인스턴스
+            top_n: 상위 N개만 반환 (None이면 전체 반환)
+            min_length: 키워드 최소 길이
+            min_count: 최소 출현 횟수
+        """
+        results = self.analyze(analyzer, min_length=min_length, min_count=min_count)
+        return analyzer.ranking_from_results(results, top_n=top_n)
+
+    def excel_path_for(self, output_dir: str) -> str:
+        """txt 파일명과 짝을 이루는 엑셀 파일 경로를 반환합니다."""
+        if self.txt_path:
+            base_name = os.path.splitext(os.path.basename(self.txt_path))[0]
+        else:
+            base_name = f"blog_{int(time.time())}"
+        return os.path.join(output_dir, f"{base_name}_keyword_analysis.xlsx")
+
+    def export_excel(self, analyzer, output_path: str, top_n: Optional[int] = None,
+                     min_length: int = 2, min_count: int = 1) -> Optional[str]:
+        """
+        키워드 분석 결과를 엑셀 파일로 저장합니다 (analyze 결과 재사용).
+
+        Args:
+            analyzer: MorphemeAnalyzer 인스턴스
+            output_path: 저장할 엑셀 파일 경로
+            top_n: 상위 N개만 저장 (None이면 전체 저장)
+            min_length: 키워드 최소 길이
+            min_count: 최소 출현 횟수
+
+        Returns:
+            저장된 파일 경로 (실패하면 None)
+        """
+        results = self.analyze(analyzer, min_length=min_length, min_count=min_count)
+        return analyzer.export_results_to_excel(results, output_path=output_path, top_n=top_n)
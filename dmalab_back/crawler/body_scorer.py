@@ -0,0 +1,201 @@
+"""
+본문 후보 점수 모듈
+본문 추출 방법 3(id/class에 post, content, article이 들어 있는 div)에서 후보 div를 하나씩 추출해 보는 대신,
+문서를 한 번 순회하며 후보마다 텍스트 길이, 링크 텍스트 비율, 이미지 수를 계산하고 점수로 본문 루트를 고릅니다.
+후보 div는 서로 중첩되므로, 가장 점수가 높은 후보 안에 본문 대부분을 담은 더 작은 후보가 있으면
+그 후보를 선택해 메뉴/사이드바 같은 주변 영역을 줄입니다.
+"""
+
+import os
+from typing import Callable, List, Optional
+
+from bs4.element import PreformattedString, Tag
+
+# 이미지 하나를 텍스트 몇 글자로 볼지 (이미지 위주 글도 본문 후보로 선택되도록)
+IMAGE_SCORE = int(os.getenv("CRAWLER_BODY_IMAGE_SCORE", "30"))
+# 가장 점수가 높은 후보 안의 하위 후보가 이 비율 이상의 본문을 담고 있으면 하위 후보를 선택
+DESCEND_RATIO = float(os.getenv("CRAWLER_BODY_DESCEND_RATIO", "0.8"))
+# 본문으로 인정할 최소 텍스트 길이 (기존 방법 3의 최소 길이와 같음)
+MIN_TEXT_LENGTH = 20
+
+# 텍스트 길이에서 제외하는 태그 (get_text에서 제외되는 문자열)
+_STRING_CONTAINERS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+# 본문 후보 div의 id/class 패턴 (기존 방법 3 선택자와 같음)
+_ID_PATTERNS = ('post',)
+_CLASS_PATTERNS = ('post', 'content', 'article')
+
+
+def is_body_candidate(element) -> bool:
+    """id에 post, 또는 class에 post/content/article이 들어 있는 요소인지 확인합니다 (대소문자 무시)."""
+    element_id = element.get('id')
+    if element_id and any(pattern in element_id.lower() for pattern in _ID_PATTERNS):
+        return True
+    classes = element.get('class')
+    if not classes:
+        return False
+    class_str = (' '.join(classes) if isinstance(classes, list) else classes).lower()
+    return any(pattern in class_str for pattern in _CLASS_PATTERNS)
+
+
+class BodyCandidate:
+    """본문 후보 div 하나의 통계"""
+
+    __slots__ = ('element', 'order', 'parent', 'text_length', 'link_text_length', 'images', 'links')
+
+    def __init__(self, element, order: int, parent: Optional['BodyCandidate']):
+        self.element = element
+        self.order = order          # 문서 순서
+        self.parent = parent        # 가장 가까운 상위 후보 (없으면 None)
+        self.text_length = 0        # 텍스트 길이 (공백 제거한 문자열 기준)
+        self.link_text_length = 0   # 링크 안 텍스트 길이
+        self.images = 0
+        self.links = 0
+
+    @property
+    def link_density(self) -> float:
+        """텍스트 중 링크 텍스트 비율"""
+        return self.link_text_length / self.text_length if self.text_length else 1.0
+
+    @property
+    def mass(self) -> float:
+        """링크가 아닌 텍스트 길이 + 이미지 점수"""
+        return (self.text_length - self.link_text_length) + IMAGE_SCORE * self.images
+
+    @property
+    def score(self) -> float:
+        """본문 점수 (링크 비율이 높을수록 감점)"""
+        return self.mass * (1.0 - self.link_density)
+
+    def is_inside(self, other: 'BodyCandidate') -> bool:
+        """other 후보 안에 있는지 확인합니다."""
+        parent = self.parent
+        while parent is not None:
+            if parent is other:
+                return True
+            parent = parent.parent
+        return False
+
+
+class _Measurer:
+    """
+    문서를 한 번 순회하며 본문 후보 div의 통계를 계산하는 클래스
+    트리 종류별 자식 순회(children)는 하위 클래스에서 구현합니다.
+    """
+
+    def __init__(self, is_candidate: Callable):
+        self.is_candidate = is_candidate
+        self.candidates: List[BodyCandidate] = []
+
+    def visit(self, tag, name: str, parent: Optional[BodyCandidate], in_link: bool, text: bool) -> list:
+        """
+        태그 하나의 하위 통계를 계산합니다.
+
+        Returns:
+            [텍스트 길이, 링크 텍스트 길이, 이미지 수, 링크 수]
+        """
+        if name == 'img':
+            return [0, 0, 1, 0]
+
+        candidate = None
+        if name == 'div' and self.is_candidate(tag):
+            candidate = BodyCandidate(tag, len(self.candidates), parent)
+            self.candidates.append(candidate)
+            parent = candidate
+
+        totals = [0, 0, 0, 0]
+        if name == 'a':
+            in_link = True
+            totals[3] = 1
+        if name in _STRING_CONTAINERS:
+            text = False
+
+        for child, child_name, value in self.children(tag):
+            if child is not None:
+                child_totals = self.visit(child, child_name, parent, in_link, text)
+                totals[0] += child_totals[0]
+                totals[1] += child_totals[1]
+                totals[2] += child_totals[2]
+                totals[3] += child_totals[3]
+            elif text:
+                length = len(value.strip())
+                totals[0] += length
+                if in_link:
+                    totals[1] += length
+
+        if candidate is not None:
+            candidate.text_length, candidate.link_text_length, candidate.images, candidate.links = totals
+        return totals
+
+    def children(self, tag):
+        """(자식 태그, 태그 이름, None) 또는 (None, None, 문자열)을 문서 순서대로 생성합니다."""
+        raise NotImplementedError
+
+
+class _SoupMeasurer(_Measurer):
+    """BeautifulSoup 트리용 순회"""
+
+    def children(self, tag):
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                yield child, child.name, None
+            elif not isinstance(child, PreformattedString):
+                yield None, None, child
+
+
+class _LxmlMeasurer(_Measurer):
+    """lxml 트리용 순회"""
+
+    def children(self, tag):
+        if tag.text:
+            yield None, None, tag.text
+        for child in tag:
+            if isinstance(child.tag, str):
+                yield child, child.tag, None
+            if child.tail:
+                yield None, None, child.tail
+
+
+def measure_soup(root, is_candidate: Callable = is_body_candidate) -> List[BodyCandidate]:
+    """BeautifulSoup 문서의 본문 후보 통계 (문서 순서)"""
+    measurer = _SoupMeasurer(is_candidate)
+    for child in root.contents:
+        if isinstance(child, Tag):
+            measurer.visit(child, child.name, None, False, True)
+    return measurer.candidates
+
+
+def measure_lxml(root, is_candidate: Callable = is_body_candidate) -> List[BodyCandidate]:
+    """lxml 문서의 본문 후보 통계 (문서 순서)"""
+    measurer = _LxmlMeasurer(is_candidate)
+    measurer.visit(root, root.tag, None, False, True)
+    return measurer.candidates
+
+
+def rank_body_candidates(candidates: List[BodyCandidate]) -> List[BodyCandidate]:
+    """
+    본문 후보를 추출해 볼 순서로 정렬합니다.
+    점수가 가장 높은 후보 안에 본문 대부분(DESCEND_RATIO 이상)을 담은 하위 후보가 있으면 그 후보가 맨 앞에 옵니다.
+
+    Args:
+        candidates: measure_soup/measure_lxml 결과
+
+    Returns:
+        텍스트가 MIN_TEXT_LENGTH보다 긴 후보 리스트 (첫 번째가 본문 루트)
+    """
+    eligible = [c for c in candidates if c.text_length > MIN_TEXT_LENGTH]
+    if not eligible:
+        return []
+    # 점수가 같으면 문서 순서가 앞선 후보 (기존 방식과 같이 바깥 요소 우선)
+    ranked = sorted(eligible, key=lambda c: (-c.score, c.order))
+
+    best = ranked[0]
+    while True:
+        inner = [
+            c for c in eligible
+            if c.is_inside(best) and c.mass >= DESCEND_RATIO * best.mass
+        ]
+        if not inner:
+            break
+        best = min(inner, key=lambda c: (-c.score, c.order))
+
+    return [best] + [c for c in ranked if c is not best]
@@ -0,0 +1,191 @@
+"""
+호스트별 차단 감지 서킷 브레이커 모듈
+차단 페이지(캡차, 보안 인증, 403/429)가 연속으로 감지되면 해당 호스트로의 요청을 일시 중단하고,
+쿨다운 후 한 건의 시험 요청(half-open)으로 회복 여부를 확인합니다.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# 서킷 브레이커 설정 (환경 변수로 조정 가능)
+BREAKER_THRESHOLD = int(os.getenv("CRAWLER_BREAKER_THRESHOLD", "3"))  # 연속 차단 횟수
+BREAKER_COOLDOWN = float(os.getenv("CRAWLER_BREAKER_COOLDOWN", "60"))  # 첫 쿨다운 (초)
+BREAKER_MAX_COOLDOWN = float(os.getenv("CRAWLER_BREAKER_MAX_COOLDOWN", "900"))  # 최대 쿨다운 (초)
+BREAKER_SLOWDOWN = float(os.getenv("CRAWLER_BREAKER_SLOWDOWN", "2"))  # 차단 1회당 추가 대기 (초)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """호스트가 차단 상태라 요청을 보내지 않았을 때 발생하는 예외"""
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"{host} 요청이 일시 중단되었습니다 (차단 감지, {retry_after:.0f}초 후 재시도)")
+
+
+class _HostCircuit:
+    """호스트 하나의 서킷 상태"""
+
+    def __init__(self, cooldown: float):
+        self.state = STATE_CLOSED
+        self.consecutive_blocks = 0
+        self.total_blocks = 0
+        self.cooldown = cooldown
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self.last_block_at: Optional[float] = None
+
+
+class CircuitBreaker:
+    """호스트별 서킷(closed → open → half-open → closed)을 관리하는 클래스"""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN,
+                 max_cooldown: float = BREAKER_MAX_COOLDOWN, slowdown: float = BREAKER_SLOWDOWN):
+        """
+        Args:
+            threshold: 서킷을 여는 연속 차단 횟수
+            cooldown: 첫 번째 차단 시 요청 중단 시간 (초, 다시 열릴 때마다 두 배)
+            max_cooldown: 요청 중단 시간 상한 (초)
+            slowdown: 서킷이 닫혀 있는 동안 연속 차단 1회당 추가 대기 시간 (초)
+        """
+        self.threshold = max(threshold, 1)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.slowdown = slowdown
+        self._circuits: Dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, host: str) -> _HostCircuit:
+        """호스트 서킷을 반환합니다 (lock을 잡은 상태에서 호출)."""
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = _HostCircuit(self.base_cooldown)
+            self._circuits[host] = circuit
+        return circuit
+
+    def before_request(self, host: str) -> float:
+        """
+        요청 전에 호출합니다.
+
+        Returns:
+            요청 전에 추가로 대기할 시간 (초, 차단 징후가 있을 때 속도를 늦춤)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 시험 요청이 진행 중인 경우
+        """
+        with self._lock:
+            circuit = self._circuit(host)
+            now = time.time()
+
+            if circuit.state == STATE_OPEN:
+                if now < circuit.open_until:
+                    raise CircuitOpenError(host, circuit.open_until - now)
+                # 쿨다운이 끝나면 시험 요청 한 건만 허용
+                circuit.state = STATE_HALF_OPEN
+                circuit.probe_in_flight = False
+
+            if circuit.state == STATE_HALF_OPEN:
+                if circuit.probe_in_flight:
+                    raise CircuitOpenError(host, self.base_cooldown)
+                circuit.probe_in_flight = True
+                print(f"[INFO] {host} 차단 해제 여부 확인을 위한 시험 요청을 보냅니다.")
+                return 0.0
+
+            return circuit.consecutive_blocks * self.slowdown
+
+    def record_success(self, host: str):
+        """정상 응답을 기록합니다 (half-open이면 서킷을 닫음)."""
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.state == STATE_HALF_OPEN:
+                print(f"[INFO] {host} 차단이 해제되었습니다. 수집을 재개합니다.")
+                circuit.cooldown = self.base_cooldown
+            circuit.state = STATE_CLOSED
+            circuit.consecutive_blocks = 0
+            circuit.probe_in_flight = False
+
+    def record_block(self, host: str):
+        """차단 응답을 기록합니다 (임계값 도달 또는 시험 요청 실패 시 서킷을 엶)."""
+        with self._lock:
+            circuit = self._circuit(host)
+            now = time.time()
+            circuit.consecutive_blocks += 1
+            circuit.total_blocks += 1
+            circuit.last_block_at = now
+
+            if circuit.state == STATE_HALF_OPEN:
+                # 시험 요청도 차단됨: 쿨다운을 늘려 다시 엶
+                circuit.cooldown = min(circuit.cooldown * 2, self.max_cooldown)
+                self._open(host, circuit, now)
+            elif circuit.state == STATE_CLOSED and circuit.consecutive_blocks >= self.threshold:
+                self._open(host, circuit, now)
+
+    def record_error(self, host: str):
+        """네트워크 오류를 기록합니다 (차단으로 보지 않고, 진행 중인 시험 요청만 정리)."""
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.state == STATE_HALF_OPEN and circuit.probe_in_flight:
+                self._open(host, circuit, time.time())
+
+    def release_probe(self, host: str):
+        """요청이 취소되어 결과가 없을 때 호출합니다 (시험 요청 자리만 비우고 상태는 유지)."""
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.state == STATE_HALF_OPEN:
+                circuit.probe_in_flight = False
+
+    def _open(self, host: str, circuit: _HostCircuit, now: float):
+        """서킷을 엽니다 (lock을 잡은 상태에서 호출)."""
+        circuit.state = STATE_OPEN
+        circuit.open_until = now + circuit.cooldown
+        circuit.probe_in_flight = False
+        print(f"[WARN] {host} 차단이 감지되어 {circuit.cooldown:.0f}초 동안 요청을 중단합니다.")
+
+    def status(self) -> dict:
+        """
+        호스트별 서킷 상태를 반환합니다.
+
+        Returns:
+            {호스트: {'state', 'consecutive_blocks', 'total_blocks', 'retry_after', 'cooldown'}}
+        """
+        with self._lock:
+            now = time.time()
+            result = {}
+            for host, circuit in self._circuits.items():
+                state = circuit.state
+                retry_after = 0.0
+                if state == STATE_OPEN:
+                    retry_after = max(0.0, circuit.open_until - now)
+                    if retry_after == 0:
+                        state = STATE_HALF_OPEN
+                result[host] = {
+                    'state': state,
+                    'consecutive_blocks': circuit.consecutive_blocks,
+                    'total_blocks': circuit.total_blocks,
+                    'retry_after': round(retry_after, 1),
+                    'cooldown': circuit.cooldown,
+                }
+            return result
+
+
+# 공유 인스턴스 (지연 초기화)
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    프로세스 공유 CircuitBreaker를 반환합니다 (지연 초기화).
+
+    Returns:
+        CircuitBreaker 인스턴스
+    """
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
@@ -0,0 +1,213 @@
+"""
+HTML 파서 백엔드 모듈
+본문 추출(NaverCrawler._extract_body_from_page)이 사용하는 파싱/탐색 연산을 인터페이스로 분리하여
+설정(CRAWLER_HTML_BACKEND)으로 파서를 고를 수 있게 합니다.
+- bs4: BeautifulSoup(lxml) 트리 (기본값, 기존 방식)
+- lxml: HTML 바이트를 lxml.etree에 바로 넣어 만든 트리 (BeautifulSoup 트리를 만들지 않음)
+두 백엔드는 같은 본문 텍스트와 이미지/링크 URL 리스트를 냅니다 (tests/test_html_backend.py).
+"""
+
+import os
+from typing import Iterable, List, Optional
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from .body_scorer import BodyCandidate, measure_lxml, measure_soup
+from .media_markers import (
+    extract_media_blocks,
+    extract_media_blocks_lxml,
+    extract_text_with_media_markers,
+    extract_text_with_media_markers_lxml,
+)
+
+# 본문 추출에 사용할 파서 백엔드 ('bs4' 또는 'lxml')
+HTML_BACKEND = os.getenv("CRAWLER_HTML_BACKEND", "bs4")
+
+
+class BlogPage(dict):
+    """
+    _fetch_blog_page가 반환하는 페이지 딕셔너리
+    'soup'은 처음 사용할 때 BeautifulSoup 트리를 만들어 저장합니다
+    (lxml 백엔드로 본문만 추출하는 경우 BeautifulSoup 파싱 비용이 들지 않음).
+    """
+
+    def __missing__(self, key):
+        if key != 'soup':
+            raise KeyError(key)
+        soup = BeautifulSoup(self['html'], 'lxml')
+        self['soup'] = soup
+        return soup
+
+    def fresh(self) -> 'BlogPage':
+        """파싱 결과 없이 HTML과 메타데이터만 복사합니다 (본문 추출이 트리를 변경하므로 공유하지 않음)."""
+        return BlogPage((key, value) for key, value in self.items() if key != 'soup')
+
+
+class HtmlBackend:
+    """본문 추출에 필요한 파서 연산 인터페이스"""
+
+    name = ''
+
+    def document(self, page: dict):
+        """
+        페이지의 파싱된 문서를 반환합니다.
+
+        Args:
+            page: {'html', ...} 페이지 딕셔너리
+
+        Returns:
+            문서 루트 (파싱할 수 없으면 None)
+        """
+        raise NotImplementedError
+
+    def find_all(self, root, attr: str, substring: str, tag: Optional[str] = None, lower: bool = False) -> list:
+        """
+        속성 값에 substring이 들어 있는 요소를 문서 순서대로 찾습니다.
+
+        Args:
+            root: 문서 루트
+            attr: 속성 이름 ('class' 또는 'id')
+            substring: 찾을 문자열
+            tag: 태그 이름 (None이면 모든 태그)
+            lower: 속성 값을 소문자로 바꿔 비교할지
+        """
+        raise NotImplementedError
+
+    def body(self, root):
+        """문서의 body 요소 (없으면 None)"""
+        raise NotImplementedError
+
+    def remove_tags(self, root, names: Iterable[str]):
+        """문서에서 지정한 태그를 하위 요소와 함께 제거합니다."""
+        raise NotImplementedError
+
+    def describe(self, element) -> tuple:
+        """로그용 (태그 이름, ID, 클래스 문자열) 튜플 (없으면 '없음')"""
+        raise NotImplementedError
+
+    def measure_body_candidates(self, root) -> List[BodyCandidate]:
+        """문서를 한 번 순회해 본문 후보 div의 통계를 계산합니다 (body_scorer 참고)."""
+        raise NotImplementedError
+
+    def extract_text_with_media_markers(self, element) -> tuple:
+        """(텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플 (media_markers 참고)"""
+        raise NotImplementedError
+
+    def extract_media_blocks(self, element) -> tuple:
+        """(텍스트, 이미지 URL 리스트, 링크 URL 리스트, 블록 리스트) 튜플 (media_markers 참고)"""
+        raise NotImplementedError
+
+
+class SoupBackend(HtmlBackend):
+    """BeautifulSoup(lxml) 백엔드"""
+
+    name = 'bs4'
+
+    def document(self, page: dict):
+        return page['soup']
+
+    def find_all(self, root, attr: str, substring: str, tag: Optional[str] = None, lower: bool = False) -> list:
+        def match(value):
+            return value and substring in (str(value).lower() if lower else str(value))
+        return root.find_all(tag, attrs={attr: match})
+
+    def body(self, root):
+        return root.find('body')
+
+    def remove_tags(self, root, names: Iterable[str]):
+        for element in root(list(names)):
+            element.decompose()
+
+    def describe(self, element) -> tuple:
+        element_classes = element.get('class', [])
+        class_str = ' '.join(element_classes) if element_classes else '없음'
+        return element.name, element.get('id', '없음'), class_str
+
+    def measure_body_candidates(self, root) -> List[BodyCandidate]:
+        return measure_soup(root)
+
+    def extract_text_with_media_markers(self, element) -> tuple:
+        return extract_text_with_media_markers(element)
+
+    def extract_media_blocks(self, element) -> tuple:
+        return extract_media_blocks(element)
+
+
+class LxmlBackend(HtmlBackend):
+    """lxml.etree 백엔드 (HTML을 UTF-8 바이트로 넘겨 파싱)"""
+
+    name = 'lxml'
+
+    def document(self, page: dict):
+        html_text = page['html']
+        if not html_text:
+            return None
+        try:
+            data = html_text.encode('utf-8') if isinstance(html_text, str) else html_text
+            return etree.fromstring(data, etree.HTMLParser(encoding='utf-8'))
+        except etree.LxmlError as e:
+            print(f"[WARN] lxml 파싱 실패: {e}")
+            return None
+
+    def find_all(self, root, attr: str, substring: str, tag: Optional[str] = None, lower: bool = False) -> list:
+        elements: List = []
+        for element in (root.iter(tag) if tag else root.iter()):
+            if not isinstance(element.tag, str):
+                continue
+            value = element.get(attr)
+            if not value:
+                continue
+            if attr == 'class':
+                # BeautifulSoup과 같이 공백으로 나눈 클래스 목록 기준
+                value = ' '.join(value.split())
+            if substring in (value.lower() if lower else value):
+                elements.append(element)
+        return elements
+
+    def body(self, root):
+        return next(root.iter('body'), None)
+
+    def remove_tags(self, root, names: Iterable[str]):
+        for element in list(root.iter(*names)):
+            parent = element.getparent()
+            if parent is None:
+                continue
+            # 빈 주석으로 바꿔 뒤따르는 텍스트(tail)를 앞 텍스트와 합치지 않고 그대로 유지
+            # (BeautifulSoup decompose 후 남는 문자열 노드와 같은 결과)
+            placeholder = etree.Comment('')
+            placeholder.tail = element.tail
+            parent.replace(element, placeholder)
+
+    def describe(self, element) -> tuple:
+        class_str = ' '.join((element.get('class') or '').split())
+        return element.tag, element.get('id', '없음'), class_str or '없음'
+
+    def measure_body_candidates(self, root) -> List[BodyCandidate]:
+        return measure_lxml(root)
+
+    def extract_text_with_media_markers(self, element) -> tuple:
+        return extract_text_with_media_markers_lxml(element)
+
+    def extract_media_blocks(self, element) -> tuple:
+        return extract_media_blocks_lxml(element)
+
+
+_BACKENDS = {backend.name: backend for backend in (SoupBackend(), LxmlBackend())}
+
+
+def get_html_backend(name: Optional[str] = None) -> HtmlBackend:
+    """
+    파서 백엔드를 반환합니다.
+
+    Args:
+        name: 'bs4' 또는 'lxml' (None이면 CRAWLER_HTML_BACKEND 설정값)
+
+    Returns:
+        HtmlBackend 인스턴스 (알 수 없는 이름이면 bs4)
+    """
+    backend = _BACKENDS.get(name or HTML_BACKEND)
+    if backend is None:
+        print(f"[WARN] 알 수 없는 HTML 백엔드 '{name or HTML_BACKEND}', bs4를 사용합니다.")
+        backend = _BACKENDS['bs4']
+    return backend
@@ -0,0 +1,596 @@
+"""
+본문 텍스트 + 미디어 마커 추출 모듈
+이미 파싱된 BeautifulSoup 트리를 한 번만 순회하면서 텍스트, [이미지 삽입N]/[링크 삽입N]/[이모티콘 삽입N] 마커,
+마커 순서의 이미지/링크 URL 리스트를 함께 만듭니다.
+요소를 문자열로 바꿔 다시 파싱하고 모듈 종류별로 find_all/find_parent를 반복하던 기존 방식
+(NaverCrawler._extract_text_with_media_markers_legacy)과 같은 결과를 냅니다.
+
+기존 방식은 단계(이모티콘 → se-module-image → se-module-oglink → 나머지 이미지 → 나머지 링크) 순서로
+번호를 매기므로 번호가 문서 순서와 다를 수 있습니다.
+- 이미지: se-module-image 안의 이미지가 먼저, 나머지 이미지가 그 다음
+- 링크: se-module-oglink 모듈이 먼저, 나머지 링크가 그 다음
+순회 중에는 자리표시자를 두고, 순회가 끝난 뒤 단계 순서대로 번호를 매겨 텍스트를 만듭니다.
+BeautifulSoup 트리와 lxml 트리(html_backend의 lxml 백엔드)에서 같은 규칙으로 동작합니다.
+
+extract_media_blocks는 같은 순회에서 문단/제목/인용/이미지/링크/이모티콘 블록 리스트도 함께 만듭니다.
+블록은 JSON으로 저장할 수 있는 딕셔너리이며, 분석 코드가 마커를 정규식으로 다시 걷어내지 않고 텍스트만 사용할 수 있습니다.
+- {'type': 'paragraph' | 'heading' | 'quote', 'text': str}
+- {'type': 'image', 'index': N, 'url': str}       ([이미지 삽입N], URL이 없으면 'url' 생략)
+- {'type': 'link', 'index': N, 'url': str, 'text': str}  ([링크 삽입N], oglink 모듈은 'text' 없음)
+- {'type': 'sticker', 'index': N}                  ([이모티콘 삽입N])
+"""
+
+from typing import Callable, List, Optional
+
+from bs4.element import PreformattedString, Tag
+
+# get_text에서 제외되는 문자열을 담는 태그 (기존 방식은 요소를 다시 파싱하므로
+# 원본 문자열 타입이 아니라 요소 안에서 가장 가까운 이 태그들로 판단)
+_STRING_CONTAINERS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+# 썸네일 크기 패턴 (w966 고화질로 변환)
+_THUMBNAIL_PATTERNS = ('?type=w80', '?type=w100', '?type=w200', '?type=w300', '?type=w400', '?type=w500')
+
+# 자리표시자 종류
+_MODULE_IMAGE = 0   # se-module-image 안의 이미지
+_FREE_IMAGE = 1     # 나머지 이미지
+_OGLINK = 2         # se-module-oglink 모듈
+_FREE_LINK = 3      # 나머지 링크
+_STICKER = 4        # se-module-sticker 안의 이미지 (이모티콘)
+
+# 블록 종류
+BLOCK_PARAGRAPH = 'paragraph'
+BLOCK_HEADING = 'heading'
+BLOCK_QUOTE = 'quote'
+BLOCK_IMAGE = 'image'
+BLOCK_LINK = 'link'
+BLOCK_STICKER = 'sticker'
+# 텍스트를 담는 블록 종류
+TEXT_BLOCKS = frozenset((BLOCK_PARAGRAPH, BLOCK_HEADING, BLOCK_QUOTE))
+
+# 블록 경계가 되는 태그 (안의 텍스트가 별도 블록이 됨)
+_BLOCK_TAGS = frozenset((
+    'p', 'div', 'section', 'article', 'main', 'header', 'footer', 'aside', 'nav', 'figure', 'figcaption',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'table', 'thead', 'tbody', 'tr', 'td', 'th', 'pre', 'address',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote',
+))
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+# 스마트에디터 제목/인용구 컴포넌트 클래스
+_HEADING_CLASSES = ('se-sectionTitle', 'se-documentTitle')
+_QUOTE_CLASSES = ('se-quotation',)
+
+
+def normalize_media_url(url: str) -> Optional[str]:
+    """상대 경로를 절대 경로로 변환합니다 (변환할 수 없으면 None)."""
+    if not url:
+        return None
+    if url.startswith('//'):
+        return 'https:' + url
+    elif url.startswith('/'):
+        return 'https://blog.naver.com' + url
+    elif url.startswith('http'):
+        return url
+    return None
+
+
+def upgrade_image_src(img_src: str) -> str:
+    """썸네일 이미지 주소를 w966 고화질 주소로 바꿉니다."""
+    if not img_src:
+        return img_src
+    # 썸네일 패턴 체크: w80, w100, w200 등 작은 크기 (w966 제외)
+    if any(pattern in img_src for pattern in _THUMBNAIL_PATTERNS):
+        base_url = img_src.split('?')[0]
+        if 'postfiles.pstatic.net' in base_url:
+            return base_url + '?type=w966'
+        return base_url
+    # w966이 이미 있으면 그대로 사용 (고화질)
+    if '?type=w966' in img_src:
+        return img_src
+    # 쿼리 파라미터가 없으면 w966 추가 시도
+    if '?' not in img_src and 'postfiles.pstatic.net' in img_src:
+        return img_src + '?type=w966'
+    return img_src
+
+
+def image_url(img) -> Optional[str]:
+    """img 태그(BeautifulSoup Tag 또는 lxml 요소)의 src 또는 data-src에서 이미지 URL을 만듭니다 (data-linkdata 무시)."""
+    img_src = img.get('data-src', '') or img.get('src', '')
+    return normalize_media_url(upgrade_image_src(img_src))
+
+
+class _Marker:
+    """순회가 끝난 뒤 번호가 정해지는 이미지/링크 마커 자리표시자"""
+
+    __slots__ = ('kind', 'index')
+
+    def __init__(self, kind: int, index: int):
+        self.kind = kind
+        self.index = index
+
+
+class _Boundary:
+    """블록 태그의 시작(kind는 'heading', 'quote' 또는 None)과 끝(_BLOCK_END) 표시"""
+
+    __slots__ = ('kind',)
+
+    def __init__(self, kind: Optional[str]):
+        self.kind = kind
+
+
+_BLOCK_END = _Boundary(None)
+
+
+class _LinkText:
+    """하나의 문자열로 합쳐지는 링크 텍스트 (나머지 링크는 뒤에 [링크 삽입N] 마커가 붙음)"""
+
+    __slots__ = ('parts', 'marker')
+
+    def __init__(self, parts: list, marker: Optional[_Marker]):
+        self.parts = parts
+        self.marker = marker
+
+
+class _MarkerWalker:
+    """
+    요소를 한 번 순회하며 텍스트 조각, 마커 자리표시자, URL을 모으는 클래스
+    트리 종류별 자식 순회(walk)는 하위 클래스에서 구현합니다.
+    """
+
+    def __init__(self, blocks: bool = False):
+        """
+        Args:
+            blocks: 블록 리스트를 만들 수 있도록 블록 태그 경계를 함께 기록할지
+        """
+        self.blocks = blocks
+        self.emoji_count = 0
+        self.module_images: List[Optional[str]] = []
+        self.free_images: List[Optional[str]] = []
+        self.oglinks: List[list] = []        # [URL 또는 None, a[href]를 찾았는지]
+        self.free_links: List[Optional[str]] = []
+        self._open_oglinks: List[list] = []  # 순회 중인 oglink 모듈 (URL 링크를 아직 찾지 않은 것 포함)
+
+    def visit(self, tag, name: str, sink: list, sticker: bool, image: bool, silent: bool, link: Optional[str],
+              text: bool = True):
+        """
+        태그 하나를 처리합니다.
+
+        Args:
+            tag: 처리할 태그 (BeautifulSoup Tag 또는 lxml 요소)
+            name: 태그 이름
+            sink: 텍스트 조각과 자리표시자를 모을 리스트
+            sticker: se-module-sticker 안인지
+            image: se-module-image 안인지
+            silent: 결과 텍스트에서 제외되는 영역(oglink 모듈 안)인지 (번호와 URL은 계속 수집)
+            link: 링크 안이면 'module'(모듈 안의 링크) 또는 'free'(나머지 링크), 아니면 None
+            text: 문자열을 텍스트로 사용하는지 (스크립트/스타일/템플릿/루비 주석 안이면 False, 마커는 유지)
+        """
+        if name == 'img':
+            self._image(tag, sink, sticker, image, silent)
+            return
+        if name in _STRING_CONTAINERS:
+            text = False
+
+        kind = None
+        if name == 'div':
+            classes = tag.get('class')
+            if classes:
+                class_str = ' '.join(classes) if isinstance(classes, list) else str(classes)
+                sticker = sticker or 'se-module-sticker' in class_str
+                image = image or 'se-module-image' in class_str
+                # 모듈 안 링크에 들어 있는 oglink는 링크 텍스트로 먼저 바뀌므로 모듈로 처리하지 않음
+                if 'se-module-oglink' in class_str and link != 'module':
+                    self._oglink(tag, sink, sticker, image, silent, link, text)
+                    return
+                if self.blocks:
+                    if any(c in class_str for c in _HEADING_CLASSES):
+                        kind = BLOCK_HEADING
+                    elif any(c in class_str for c in _QUOTE_CLASSES):
+                        kind = BLOCK_QUOTE
+
+        elif name == 'a':
+            if sticker or image:
+                # 모듈 안의 링크: 마커 없이 링크 텍스트만 남김 (텍스트가 없으면 제거)
+                if link is not None or silent:
+                    self.walk(tag, sink, sticker, image, silent, 'module', text)
+                else:
+                    parts = []
+                    self.walk(tag, parts, sticker, image, False, 'module', text)
+                    if parts:
+                        sink.append(_LinkText(parts, None))
+                return
+            if silent:
+                # oglink 모듈 안의 링크: 모듈 URL로 사용할 첫 번째 a[href]
+                if tag.get('href') is not None:
+                    for entry in self._open_oglinks:
+                        if not entry[1]:
+                            href = tag.get('href', '')
+                            entry[0] = normalize_media_url(href) if href else None
+                            entry[1] = True
+                self.walk(tag, sink, sticker, image, True, link, text)
+                return
+            # 나머지 링크: 링크 텍스트 뒤에 [링크 삽입N] (http 링크만 URL 수집)
+            href = tag.get('href', '')
+            self.free_links.append(normalize_media_url(href) if href and href.startswith('http') else None)
+            if link is not None:
+                # 링크 안의 링크는 번호만 받고 텍스트는 바깥 링크 텍스트에 그대로 포함됨
+                self.walk(tag, sink, sticker, image, False, link, text)
+                return
+            marker = _Marker(_FREE_LINK, len(self.free_links) - 1)
+            parts = []
+            self.walk(tag, parts, sticker, image, False, 'free', text)
+            sink.append(_LinkText(parts, marker))
+            return
+
+        if self.blocks and not silent and name in _BLOCK_TAGS:
+            if name in _HEADING_TAGS:
+                kind = BLOCK_HEADING
+            elif name == 'blockquote':
+                kind = BLOCK_QUOTE
+            sink.append(_Boundary(kind))
+            self.walk(tag, sink, sticker, image, silent, link, text)
+            sink.append(_BLOCK_END)
+            return
+
+        self.walk(tag, sink, sticker, image, silent, link, text)
+
+    def walk(self, tag, sink: list, sticker: bool, image: bool, silent: bool, link: Optional[str],
+             text: bool = True):
+        """태그의 자식들을 문서 순서대로 처리합니다."""
+        raise NotImplementedError
+
+    def _image(self, img, sink: list, sticker: bool, image: bool, silent: bool):
+        """img 태그를 이모티콘/이미지 마커로 바꿉니다 (URL이 없어도 번호는 증가)."""
+        if sticker:
+            # 이모티콘은 URL을 수집하지 않음
+            self.emoji_count += 1
+            if not silent:
+                sink.append(_Marker(_STICKER, self.emoji_count - 1))
+        elif image:
+            self.module_images.append(image_url(img))
+            if not silent:
+                sink.append(_Marker(_MODULE_IMAGE, len(self.module_images) - 1))
+        elif not silent:
+            # oglink 모듈 안의 나머지 이미지는 모듈과 함께 제거됨
+            self.free_images.append(image_url(img))
+            sink.append(_Marker(_FREE_IMAGE, len(self.free_images) - 1))
+
+    def _oglink(self, tag, sink: list, sticker: bool, image: bool, silent: bool, link: Optional[str],
+                text: bool):
+        """se-module-oglink 모듈 전체를 [링크 삽입N] 하나로 바꿉니다 (모듈 텍스트 제외)."""
+        entry = [None, False]
+        self.oglinks.append(entry)
+        if not silent:
+            sink.append(_Marker(_OGLINK, len(self.oglinks) - 1))
+        self._open_oglinks.append(entry)
+        try:
+            self.walk(tag, sink, sticker, image, True, link, text)
+        finally:
+            self._open_oglinks.pop()
+
+    def _number(self, marker: _Marker) -> str:
+        """단계 순서대로 매긴 마커 문자열"""
+        kind = marker.kind
+        if kind == _MODULE_IMAGE:
+            return f'[이미지 삽입{marker.index + 1}]'
+        if kind == _FREE_IMAGE:
+            return f'[이미지 삽입{len(self.module_images) + marker.index + 1}]'
+        if kind == _OGLINK:
+            return f'[링크 삽입{marker.index + 1}]'
+        if kind == _STICKER:
+            return f'[이모티콘 삽입{marker.index + 1}]'
+        return f'[링크 삽입{len(self.oglinks) + marker.index + 1}]'
+
+    def render(self, item) -> str:
+        """텍스트 조각 또는 자리표시자를 문자열로 만듭니다."""
+        if isinstance(item, str):
+            return item
+        if isinstance(item, _Marker):
+            return self._number(item)
+        if isinstance(item, _Boundary):
+            return ''
+        link_text = ''.join(self.render(part) for part in item.parts)
+        if item.marker is None:
+            return link_text
+        marker = self._number(item.marker)
+        return f"{link_text}\n{marker}" if link_text else marker
+
+    def _media_block(self, marker: _Marker) -> dict:
+        """마커 자리표시자에 해당하는 이미지/링크/이모티콘 블록"""
+        kind = marker.kind
+        if kind == _STICKER:
+            return {'type': BLOCK_STICKER, 'index': marker.index + 1}
+        if kind == _MODULE_IMAGE:
+            block = {'type': BLOCK_IMAGE, 'index': marker.index + 1}
+            url = self.module_images[marker.index]
+        elif kind == _FREE_IMAGE:
+            block = {'type': BLOCK_IMAGE, 'index': len(self.module_images) + marker.index + 1}
+            url = self.free_images[marker.index]
+        elif kind == _OGLINK:
+            block = {'type': BLOCK_LINK, 'index': marker.index + 1}
+            url = self.oglinks[marker.index][0]
+        else:
+            block = {'type': BLOCK_LINK, 'index': len(self.oglinks) + marker.index + 1}
+            url = self.free_links[marker.index]
+        if url:
+            block['url'] = url
+        return block
+
+    def build_blocks(self, sink: list) -> List[dict]:
+        """
+        순회 결과를 블록 리스트로 만듭니다 (blocks=True로 순회한 경우).
+        문단 텍스트 조각은 결과 텍스트와 같이 줄바꿈으로 이어 붙이고,
+        링크 안의 이미지 등 마커는 링크 블록 앞에 별도 블록으로 둡니다.
+        """
+        blocks: List[dict] = []
+        kinds: List[Optional[str]] = []   # 열려 있는 블록 태그 종류
+        lines: List[str] = []             # 아직 블록으로 만들지 않은 텍스트 조각
+
+        def flush():
+            if lines:
+                kind = next((k for k in reversed(kinds) if k), BLOCK_PARAGRAPH)
+                blocks.append({'type': kind, 'text': '\n'.join(lines)})
+                lines.clear()
+
+        def link_text(item: _LinkText, parts: List[str]):
+            # 링크 텍스트 조각 (안쪽 마커 자리는 줄바꿈으로 구분하고 마커는 블록으로 추가)
+            for part in item.parts:
+                if isinstance(part, str):
+                    parts.append(part)
+                elif isinstance(part, _Marker):
+                    blocks.append(self._media_block(part))
+                    parts.append('\n')
+                elif isinstance(part, _LinkText):
+                    link_text(part, parts)
+
+        def add(item):
+            if isinstance(item, str):
+                lines.append(item)
+            elif isinstance(item, _Boundary):
+                flush()
+                if item is _BLOCK_END:
+                    kinds.pop()
+                else:
+                    kinds.append(item.kind)
+            elif isinstance(item, _Marker):
+                flush()
+                blocks.append(self._media_block(item))
+            else:
+                parts: List[str] = []
+                if item.marker is None:
+                    # 모듈 안 링크: 링크 텍스트가 주변 텍스트와 같은 블록에 들어감
+                    link_text(item, parts)
+                    lines.extend(line for line in ''.join(parts).split('\n') if line)
+                    return
+                flush()
+                link_text(item, parts)
+                block = self._media_block(item.marker)
+                text = '\n'.join(line for line in ''.join(parts).split('\n') if line)
+                if text:
+                    block['text'] = text
+                blocks.append(block)
+
+        for item in sink:
+            add(item)
+        flush()
+        return blocks
+
+    def image_urls(self) -> List[str]:
+        """마커 순서의 이미지 URL 리스트"""
+        return [url for url in self.module_images + self.free_images if url]
+
+    def link_urls(self) -> List[str]:
+        """마커 순서의 링크 URL 리스트"""
+        return [entry[0] for entry in self.oglinks if entry[0]] + [url for url in self.free_links if url]
+
+
+class _SoupMarkerWalker(_MarkerWalker):
+    """BeautifulSoup 트리용 순회"""
+
+    def walk(self, tag, sink: list, sticker: bool, image: bool, silent: bool, link: Optional[str],
+             text: bool = True):
+        use_text = text and not silent
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                self.visit(child, child.name, sink, sticker, image, silent, link, text)
+            elif use_text and not isinstance(child, PreformattedString):
+                # 주석 등은 제외
+                value = child.strip()
+                if value:
+                    sink.append(value)
+
+
+class _LxmlMarkerWalker(_MarkerWalker):
+    """lxml 트리용 순회 (요소의 text와 자식의 tail이 BeautifulSoup의 문자열 노드에 해당)"""
+
+    def walk(self, tag, sink: list, sticker: bool, image: bool, silent: bool, link: Optional[str],
+             text: bool = True):
+        use_text = text and not silent
+        if use_text and tag.text:
+            value = tag.text.strip()
+            if value:
+                sink.append(value)
+        for child in tag:
+            # 주석/처리 지시문은 건너뛰고 뒤따르는 텍스트(tail)만 사용
+            if isinstance(child.tag, str):
+                self.visit(child, child.tag, sink, sticker, image, silent, link, text)
+            if use_text and child.tail:
+                value = child.tail.strip()
+                if value:
+                    sink.append(value)
+
+
+def _result(walker: _MarkerWalker, sink: list) -> tuple:
+    """순회 결과로 (텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플을 만듭니다."""
+    result_text = '\n'.join(text for text in map(walker.render, sink) if text)
+    return (result_text, walker.image_urls(), walker.link_urls())
+
+
+def _fallback_blocks(result_text: str) -> List[dict]:
+    """마커 없이 get_text로 추출한 텍스트의 블록 리스트"""
+    return [{'type': BLOCK_PARAGRAPH, 'text': result_text}] if result_text else []
+
+
+def extract_text_with_media_markers(element: Tag) -> tuple:
+    """
+    요소에서 텍스트를 추출하면서 이미지와 링크 태그 위치에 마커를 삽입합니다 (요소는 변경하지 않음).
+
+    Args:
+        element: BeautifulSoup 요소
+
+    Returns:
+        (텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플
+    """
+    if element is None:
+        return ('', [], [])
+
+    walker = _SoupMarkerWalker()
+    sink: list = []
+    # 요소 자신이 모듈일 수도 있으므로 요소부터 처리
+    walker.visit(element, element.name, sink, False, False, False, None)
+
+    result_text, image_urls, link_urls = _result(walker, sink)
+    # 결과가 비어있으면 원본 요소에서 직접 추출
+    if not result_text:
+        result_text = element.get_text(separator='\n', strip=True)
+    return (result_text, image_urls, link_urls)
+
+
+def extract_media_blocks(element: Tag) -> tuple:
+    """
+    extract_text_with_media_markers와 같은 순회에서 블록 리스트도 함께 만듭니다.
+
+    Args:
+        element: BeautifulSoup 요소
+
+    Returns:
+        (텍스트, 이미지 URL 리스트, 링크 URL 리스트, 블록 리스트) 튜플
+    """
+    if element is None:
+        return ('', [], [], [])
+
+    walker = _SoupMarkerWalker(blocks=True)
+    sink: list = []
+    walker.visit(element, element.name, sink, False, False, False, None)
+
+    result_text, image_urls, link_urls = _result(walker, sink)
+    if not result_text:
+        result_text = element.get_text(separator='\n', strip=True)
+        return (result_text, image_urls, link_urls, _fallback_blocks(result_text))
+    return (result_text, image_urls, link_urls, walker.build_blocks(sink))
+
+
+def _lxml_text(element, parts: list, container: Optional[str], target: Optional[str]):
+    """
+    BeautifulSoup get_text(separator, strip=True)와 같은 텍스트 조각을 모읍니다.
+    문자열은 가장 가까운 문자열 컨테이너 태그(container)가 대상 요소의 종류(target)와 같을 때만 사용합니다
+    (일반 요소는 컨테이너 밖 문자열만, script/template 등은 자기 종류의 문자열만 반환).
+    """
+    include = container == target
+    if include and element.text:
+        value = element.text.strip()
+        if value:
+            parts.append(value)
+    for child in element:
+        if isinstance(child.tag, str):
+            _lxml_text(child, parts, child.tag if child.tag in _STRING_CONTAINERS else container, target)
+        if include and child.tail:
+            value = child.tail.strip()
+            if value:
+                parts.append(value)
+
+
+def extract_text_with_media_markers_lxml(element) -> tuple:
+    """
+    extract_text_with_media_markers의 lxml 요소 버전입니다 (요소는 변경하지 않음).
+
+    Args:
+        element: lxml 요소
+
+    Returns:
+        (텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플
+    """
+    if element is None:
+        return ('', [], [])
+
+    walker = _LxmlMarkerWalker()
+    sink: list = []
+    walker.visit(element, element.tag, sink, False, False, False, None)
+
+    result_text, image_urls, link_urls = _result(walker, sink)
+    if not result_text:
+        result_text = _lxml_fallback_text(element)
+    return (result_text, image_urls, link_urls)
+
+
+def extract_media_blocks_lxml(element) -> tuple:
+    """
+    extract_media_blocks의 lxml 요소 버전입니다 (요소는 변경하지 않음).
+
+    Returns:
+        (텍스트, 이미지 URL 리스트, 링크 URL 리스트, 블록 리스트) 튜플
+    """
+    if element is None:
+        return ('', [], [], [])
+
+    walker = _LxmlMarkerWalker(blocks=True)
+    sink: list = []
+    walker.visit(element, element.tag, sink, False, False, False, None)
+
+    result_text, image_urls, link_urls = _result(walker, sink)
+    if not result_text:
+        result_text = _lxml_fallback_text(element)
+        return (result_text, image_urls, link_urls, _fallback_blocks(result_text))
+    return (result_text, image_urls, link_urls, walker.build_blocks(sink))
+
+
+def _lxml_fallback_text(element) -> str:
+    """마커 추출 결과가 비었을 때 사용할 get_text와 같은 텍스트"""
+    # 원본 트리에서 문자열 종류를 정하는 가장 가까운 컨테이너 태그 (요소 자신 포함)
+    target = element.tag if element.tag in _STRING_CONTAINERS else None
+    container = target or next(
+        (ancestor.tag for ancestor in element.iterancestors() if ancestor.tag in _STRING_CONTAINERS), None
+    )
+    parts: list = []
+    _lxml_text(element, parts, container, target)
+    return '\n'.join(parts)
+
+
+def block_marker(block: dict) -> Optional[str]:
+    """이미지/링크/이모티콘 블록의 마커 문자열 (텍스트 블록이면 None)"""
+    kind = block['type']
+    if kind == BLOCK_IMAGE:
+        return f"[이미지 삽입{block['index']}]"
+    if kind == BLOCK_LINK:
+        return f"[링크 삽입{block['index']}]"
+    if kind == BLOCK_STICKER:
+        return f"[이모티콘 삽입{block['index']}]"
+    return None
+
+
+def map_block_lines(blocks: List[dict], fn: Callable[[str], Optional[str]]) -> List[dict]:
+    """
+    본문 텍스트를 줄 단위로 정리하는 과정(중복 줄 제거, 짧은 줄 제거)을 블록 리스트에도 똑같이 적용합니다.
+    결과 텍스트의 줄 순서대로 fn을 호출하며, 텍스트 줄은 fn의 반환값으로 바꾸고 None이면 제거합니다.
+    마커 줄도 같은 순서로 fn에 전달되지만 (줄 상태를 맞추기 위해) 블록은 항상 유지됩니다.
+
+    Returns:
+        새 블록 리스트 (텍스트가 모두 제거된 텍스트 블록은 제외)
+    """
+    result: List[dict] = []
+    for block in blocks:
+        block = dict(block)
+        text = block.get('text')
+        if text is not None:
+            lines = [line for line in map(fn, text.split('\n')) if line is not None]
+            text = '\n'.join(lines)
+            if text.strip():
+                block['text'] = text
+            else:
+                block.pop('text')
+        if block['type'] in TEXT_BLOCKS:
+            if 'text' in block:
+                result.append(block)
+            continue
+        fn(block_marker(block))
+        result.append(block)
+    return result
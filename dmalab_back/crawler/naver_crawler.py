@@ -4,14 +4,93 @@
 
 import requests
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Callable, Optional
 import re
 import time
 import random
 import os
 import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin, parse_qs
 
+from .async_fetcher import get_async_fetcher
+from .url_resolver import (
+    resolve_post_key,
+    build_variant_url,
+    build_variant_referer,
+    get_variant_memory,
+    normalize_post_url,
+)
+from .single_flight import get_single_flight, get_async_single_flight
+from .stream_parser import (
+    STREAMING_ENABLED,
+    STREAM_CHUNK_SIZE,
+    MODE_CONTENT,
+    MODE_OUTER,
+    StreamedResponse,
+    read_streamed,
+    read_streamed_async,
+)
+from .page_cache import get_page_cache
+from .parse_pool import get_parse_pool
+from .serp_cache import get_serp_cache, normalize_keyword
+from .serp_parser import parse_serp_html
+from .media_markers import extract_media_blocks, extract_text_with_media_markers, map_block_lines
+from .html_backend import BlogPage, HtmlBackend, SoupBackend, get_html_backend
+from .body_scorer import rank_body_candidates
+from .rate_limiter import get_rate_limiter, HostRateLimiter
+from .circuit_breaker import get_circuit_breaker
+
+# 차단 페이지 판별 패턴 (대표적인 차단 문구 + iframe 차단 리다이렉트)
+_BLOCK_PATTERNS = [
+    '해당 블로그는 운영정책 위반으로 접근이 제한되었습니다',
+    'access to this blog has been blocked',
+    'captcha-invitation',
+    'blog.naver.com/section/notice',
+    '본 인증을 완료해 주세요',
+    '보안 인증을 위해',
+    'location.replace("/blocked"',
+    'location.href = "/blocked"',
+    'window.location.replace("/blocked"',
+    'securityNotice',
+]
+# 패턴을 하나의 정규식으로 합쳐 한 번의 스캔으로 판별
+_BLOCK_REGEX = re.compile('|'.join(re.escape(p) for p in _BLOCK_PATTERNS), re.IGNORECASE)
+# 차단 페이지는 작은 안내 페이지이므로 문서 앞부분만 검사
+BLOCK_SCAN_CHARS = int(os.getenv("CRAWLER_BLOCK_SCAN_CHARS", "32768"))
+# 본문 컨테이너 존재 여부
+_CONTENT_CONTAINER_REGEX = re.compile(r'post-view|se-main-container', re.IGNORECASE)
+# 차단으로 보는 HTTP 상태 코드
+BLOCK_STATUS_CODES = (403, 429)
+
+# SERP 파서 선택 ('lxml': XPath 파서, 'legacy': 기존 BeautifulSoup 방식)
+SERP_PARSER = os.getenv("CRAWLER_SERP_PARSER", "lxml")
+
+# 본문 마커 추출 방식 ('walk': 한 번 순회, 'legacy': 기존 재파싱 + 모듈별 find_all 방식)
+MARKER_EXTRACTOR = os.getenv("CRAWLER_MARKER_EXTRACTOR", "walk")
+
+# 본문 추출 방법 3의 후보 선택 방식 ('score': 한 번 순회해 점수로 선택, 'first': 텍스트가 있는 첫 후보)
+BODY_SELECTION = os.getenv("CRAWLER_BODY_SELECTION", "score")
+
+# 본문 추출 결과에 블록 리스트('blocks')를 함께 만들지 여부 (media_markers 참고)
+BODY_BLOCKS = os.getenv("CRAWLER_BODY_BLOCKS", "1") not in ("0", "false", "False")
+
+# 페이지 캐시에 저장하는 본문 추출 결과 형식 버전 (추출 규칙이 바뀌면 올려서 저장된 결과를 무시)
+EXTRACTION_FORMAT = 1
+
+# 검색 결과에 제목이 없는 글의 제목을 동시에 찾을 최대 개수
+TITLE_RESOLVE_CONCURRENCY = int(os.getenv("CRAWLER_TITLE_CONCURRENCY", "4"))
+
+# 백그라운드 새로 고침 태스크 (완료 전에 가비지 컬렉션되지 않도록 보관)
+_background_tasks = set()
+
+# 헤지 요청 설정: 먼저 시도한 페이지(iframe/mobile)가 HEDGE_DELAY초 안에 본문을 주지 않으면
+# 다른 페이지도 함께 요청하고 먼저 도착한 본문을 사용 (asyncio 경로에서만 사용)
+HEDGE_ENABLED = os.getenv("CRAWLER_HEDGE", "0") in ("1", "true", "True")
+HEDGE_DELAY = float(os.getenv("CRAWLER_HEDGE_DELAY", "1.5"))
+
 
 class NaverCrawler:
     """네이버 검색 결과를 크롤링하는 클래스"""
@@ -23,6 +102,13 @@ class NaverCrawler:
         self.session = requests.Session()
         # 실제 브라우저처럼 보이도록 헤더 설정 (차단 방지)
         self._update_headers()
+        # 세션 상태 (세션 풀에서 세션 선택/교체에 사용)
+        self.pool_slot: Optional[int] = None
+        self.last_used = 0.0
+        self.request_count = 0
+        self.block_count = 0
+        self.error_count = 0
+        self.block_score = 0.0
         
     def _update_headers(self):
         """헤더 업데이트 (User-Agent 로테이션)"""
@@ -53,39 +139,401 @@ class NaverCrawler:
         """
         네이버 차단 페이지 여부를 판별합니다.
         단순히 '차단'이라는 단어만으로 오탐하지 않도록 대표적인 패턴을 확인합니다.
+        모든 패턴을 합친 정규식으로 문서 앞부분(BLOCK_SCAN_CHARS)만 한 번 스캔합니다.
         """
-        lowered = html_text.lower()
-        # 대표적인 차단 문구/패턴
-        block_patterns = [
-            '해당 블로그는 운영정책 위반으로 접근이 제한되었습니다',
-            'access to this blog has been blocked',
-            'captcha-invitation',
-            'blog.naver.com/section/notice',
-            '본 인증을 완료해 주세요',
-            '보안 인증을 위해'
-        ]
-        # iframe 차단 페이지: window.location.replace 등 리다이렉트
-        redirect_patterns = [
-            'location.replace("/blocked"',
-            'location.href = "/blocked"',
-            'window.location.replace("/blocked"',
-            'securityNotice'
-        ]
+        if not html_text:
+            return False
+        return _BLOCK_REGEX.search(html_text, 0, BLOCK_SCAN_CHARS) is not None
+    
+    def _record_response(self, url: str, status_code: int, html_text: Optional[str]) -> bool:
+        """
+        응답을 서킷 브레이커에 기록합니다.
+        
+        Returns:
+            차단 응답 여부
+        """
+        host = HostRateLimiter.host_of(url)
+        breaker = get_circuit_breaker()
+        blocked = status_code in BLOCK_STATUS_CODES or (
+            status_code == 200 and self._is_blocked_html(html_text)
+        )
+        self.request_count += 1
+        if blocked:
+            breaker.record_block(host)
+            self.block_count += 1
+            self.block_score += 1.0
+        elif status_code < 400:
+            breaker.record_success(host)
+            # 정상 응답이 이어지면 차단 점수를 서서히 낮춤
+            self.block_score *= 0.8
+        elif status_code >= 500:
+            # 서버 오류: 차단은 아니지만 시험 요청이었다면 다시 쿨다운
+            breaker.record_error(host)
+        else:
+            # 404/410 등: 차단 여부를 알 수 없으므로 시험 요청 자리만 비워 다음 요청이 다시 확인하게 함
+            breaker.release_probe(host)
+        return blocked
+    
+    def _record_error(self, url: str):
+        """네트워크 오류를 서킷 브레이커와 세션 상태에 기록합니다."""
+        get_circuit_breaker().record_error(HostRateLimiter.host_of(url))
+        self.error_count += 1
+    
+    def _record_cancel(self, url: str):
+        """취소된 요청(헤지 요청에서 진 쪽)을 정리합니다 (차단/오류로 기록하지 않음)."""
+        get_circuit_breaker().release_probe(HostRateLimiter.host_of(url))
+    
+    def _before_request(self, url: str):
+        """서킷 브레이커 확인(차단 중이면 CircuitOpenError)과 호스트별 속도 제한을 적용합니다."""
+        slowdown = get_circuit_breaker().before_request(HostRateLimiter.host_of(url))
+        if slowdown:
+            time.sleep(slowdown)
+        get_rate_limiter().acquire(url)
+    
+    async def _before_request_async(self, url: str):
+        """_before_request의 asyncio 버전입니다."""
+        slowdown = get_circuit_breaker().before_request(HostRateLimiter.host_of(url))
+        try:
+            if slowdown:
+                await asyncio.sleep(slowdown)
+            await get_rate_limiter().acquire_async(url)
+        except asyncio.CancelledError:
+            self._record_cancel(url)
+            raise
+    
+    def _session_get(self, url: str, **kwargs):
+        """
+        세션으로 GET 요청을 보냅니다.
+        서킷 브레이커 확인(차단 중이면 CircuitOpenError) → 호스트별 속도 제한 → 요청 → 차단 여부 기록 순으로 처리합니다.
+        """
+        self._before_request(url)
+        try:
+            response = self.session.get(url, **kwargs)
+        except Exception:
+            self._record_error(url)
+            raise
+        response.encoding = 'utf-8'
+        self._record_response(url, response.status_code, response.text if response.status_code == 200 else None)
+        return response
+    
+    def _session_get_streaming(self, url: str, mode: str = MODE_CONTENT, **kwargs):
+        """
+        _session_get의 스트리밍 버전입니다.
+        응답을 조각 단위로 증분 파싱하다가 필요한 요소(mode)가 나오면 다운로드를 멈춥니다.
+        남은 응답이 CRAWLER_STREAM_DRAIN_BYTES 안이면 끝까지 읽어 keep-alive 커넥션을 재사용하고,
+        더 길어 중간에 멈추면 커넥션을 닫고 truncated=True로 표시합니다 (페이지 캐시에는 partial 항목으로 저장).
+        CRAWLER_STREAMING=0이면 _session_get과 동일하게 동작합니다.
+        
+        Args:
+            url: 요청 URL
+            mode: MODE_CONTENT(se-main-container 종료) 또는 MODE_OUTER(mainFrame src 발견)
+            
+        Returns:
+            StreamedResponse (status_code, url, headers, text, frame_src 속성 제공)
+        """
+        if not STREAMING_ENABLED:
+            return self._session_get(url, **kwargs)
+        
+        self._before_request(url)
+        try:
+            response = self.session.get(url, stream=True, **kwargs)
+            try:
+                if response.status_code == 200:
+                    reader = read_streamed(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), mode)
+                    streamed = StreamedResponse(
+                        response.status_code, response.url, response.headers, reader.text,
+                        frame_src=reader.frame_src, truncated=not reader.complete, bytes_read=reader.bytes_read
+                    )
+                else:
+                    response.encoding = 'utf-8'
+                    streamed = StreamedResponse(response.status_code, response.url, response.headers, response.text)
+            finally:
+                response.close()
+        except Exception:
+            self._record_error(url)
+            raise
+        self._record_response(url, streamed.status_code, streamed.text if streamed.status_code == 200 else None)
+        return streamed
+    
+    async def _fetcher_get(self, url: str, headers: Optional[dict] = None, params: Optional[dict] = None):
+        """
+        _session_get의 asyncio 버전입니다.
+        커넥션은 공유 AsyncFetcher의 keep-alive 풀을, 쿠키는 이 크롤러의 session.cookies를 사용하며
+        응답은 이 크롤러의 상태 점수(_record_response)에 반영됩니다.
+        """
+        await self._before_request_async(url)
+        try:
+            response = await get_async_fetcher().get(url, headers=headers, params=params, cookies=self.session.cookies)
+        except asyncio.CancelledError:
+            self._record_cancel(url)
+            raise
+        except Exception:
+            self._record_error(url)
+            raise
+        response.encoding = 'utf-8'
+        self._record_response(url, response.status_code, response.text if response.status_code == 200 else None)
+        return response
+    
+    async def _fetcher_get_streaming(self, url: str, mode: str = MODE_CONTENT, headers: Optional[dict] = None):
+        """_session_get_streaming의 asyncio 버전입니다."""
+        if not STREAMING_ENABLED:
+            return await self._fetcher_get(url, headers=headers)
+        
+        await self._before_request_async(url)
+        try:
+            async with get_async_fetcher().stream(url, headers=headers, cookies=self.session.cookies) as response:
+                if response.status_code == 200:
+                    reader = await read_streamed_async(response.aiter_bytes(STREAM_CHUNK_SIZE), mode)
+                    streamed = StreamedResponse(
+                        response.status_code, str(response.url), response.headers, reader.text,
+                        frame_src=reader.frame_src, truncated=not reader.complete, bytes_read=reader.bytes_read
+                    )
+                else:
+                    await response.aread()
+                    response.encoding = 'utf-8'
+                    streamed = StreamedResponse(response.status_code, str(response.url), response.headers, response.text)
+        except asyncio.CancelledError:
+            self._record_cancel(url)
+            raise
+        except Exception:
+            self._record_error(url)
+            raise
+        self._record_response(url, streamed.status_code, streamed.text if streamed.status_code == 200 else None)
+        return streamed
+    
+    def _get_mainframe_url(self, soup) -> Optional[str]:
+        """
+        블로그 첫 페이지에서 mainFrame iframe의 절대 URL을 찾습니다.
+        
+        Returns:
+            iframe URL (없으면 None)
+        """
+        iframe = soup.find('iframe', id=lambda x: x and 'mainframe' in str(x).lower())
+        if not iframe or not iframe.get('src'):
+            return None
+        
+        return self._resolve_mainframe_src(iframe.get('src'))
+    
+    def _resolve_mainframe_src(self, iframe_src: str) -> str:
+        """mainFrame iframe의 src를 절대 URL로 변환합니다."""
+        if iframe_src.startswith('//'):
+            iframe_url = 'https:' + iframe_src.lstrip('/')
+        elif iframe_src.startswith('http'):
+            iframe_url = iframe_src
+        else:
+            iframe_url = urljoin('https://blog.naver.com/', iframe_src.lstrip('/'))
+        
+        print(f"[DEBUG] mainFrame iframe 발견, src: {iframe_src}")
+        print(f"[DEBUG] iframe 요청 URL: {iframe_url}")
+        return iframe_url
+    
+    def _needs_mobile_fallback(self, html_text: str) -> bool:
+        """본문 컨테이너(post-view/se-main-container)가 없어 모바일 페이지가 필요한지 확인합니다."""
+        return _CONTENT_CONTAINER_REGEX.search(html_text or '') is None
+    
+    def _get_mobile_url(self, final_url: str) -> Optional[tuple]:
+        """
+        최종 URL에서 blogId/logNo를 추출하여 모바일 페이지 URL을 만듭니다.
+        
+        Returns:
+            (모바일 URL, blogId) 튜플 (추출할 수 없으면 None)
+        """
+        blog_id = None
+        log_no = None
         
-        for pattern in block_patterns:
-            if pattern.lower() in lowered:
-                return True
+        # 경로에서 추출
+        parsed_path = urlparse(final_url).path.strip('/').split('/')
+        if len(parsed_path) >= 2:
+            blog_id = parsed_path[0]
+            log_no = parsed_path[-1]
         
-        for pattern in redirect_patterns:
-            if pattern.lower() in lowered:
-                return True
+        # 쿼리에서 추출 (PostView.naver?blogId=...&logNo=...)
+        parsed_query = parse_qs(urlparse(final_url).query)
+        if 'blogId' in parsed_query:
+            blog_id = parsed_query['blogId'][0]
+        if 'logNo' in parsed_query:
+            log_no = parsed_query['logNo'][0]
         
-        return False
+        if blog_id and log_no:
+            return (f"https://m.blog.naver.com/{blog_id}/{log_no}", blog_id)
+        return None
+    
+    def _is_content_page(self, html_text: str) -> bool:
+        """본문 컨테이너가 있고 차단 페이지가 아닌지 확인합니다."""
+        return not self._needs_mobile_fallback(html_text) and not self._is_blocked_html(html_text)
     
     def _fetch_blog_page(self, url: str) -> Optional[dict]:
         """
         블로그 본문을 포함한 HTML과 파싱 결과를 반환합니다.
-        필요 시 iframe(mainFrame)과 모바일 페이지까지 추적합니다.
+        같은 글을 동시에 요청하면 한 번만 수집하고, 나머지는 HTML을 공유받아 각자 파싱합니다
+        (본문 추출 과정에서 soup이 변경되므로 soup 자체는 공유하지 않음).
+        soup은 처음 사용할 때 만들어집니다 (BlogPage).
+        """
+        page, shared = get_single_flight().do(('page', normalize_post_url(url)), self._load_blog_page, url)
+        if shared and page:
+            print(f"[DEBUG] 진행 중인 동일 글 요청 결과를 공유합니다: {url}")
+            page = page.fresh()
+        return page
+    
+    def _load_blog_page(self, url: str) -> Optional[dict]:
+        """
+        블로그 본문을 포함한 페이지를 수집합니다.
+        URL에서 blogId/logNo를 추출할 수 있으면 본문이 있는 페이지를 바로 요청하고,
+        실패하거나 추출할 수 없으면 첫 페이지 → iframe → 모바일 순으로 추적합니다.
+        blogId/logNo 단위로 디스크 캐시(data/page_cache)를 먼저 확인합니다.
+        """
+        post_key = resolve_post_key(url)
+        if not post_key:
+            return self._fetch_blog_page_chain(url)
+        
+        page_cache = get_page_cache()
+        entry = page_cache.get(post_key)
+        if entry:
+            if page_cache.is_fresh(entry):
+                page_cache.record('hits')
+                print(f"[DEBUG] 페이지 캐시 사용: {post_key[0]}/{post_key[1]} ({entry['source']})")
+                return self._page_from_cache(entry, post_key=post_key)
+            page = self._revalidate_cached_page(post_key, entry)
+            if page:
+                return page
+        else:
+            page_cache.record('misses')
+        
+        page = self._fetch_post_direct(post_key)
+        if not page:
+            print("[DEBUG] 본문 페이지 직접 요청 실패, 첫 페이지부터 다시 추적합니다.")
+            page = self._fetch_blog_page_chain(url)
+        self._store_page(post_key, page)
+        return page
+    
+    def _page_from_cache(self, entry: dict, soup: Optional[BeautifulSoup] = None,
+                         post_key: Optional[tuple] = None) -> BlogPage:
+        """캐시 항목을 _fetch_blog_page 반환 형식으로 변환합니다 (저장된 본문 추출 결과 포함)."""
+        page = BlogPage(
+            html=entry['html'],
+            final_url=entry['final_url'],
+            source=entry['source'],
+            etag=entry.get('etag'),
+            last_modified=entry.get('last_modified'),
+            partial=entry.get('partial', False)
+        )
+        if soup is not None:
+            page['soup'] = soup
+        if post_key is not None:
+            page['post_key'] = post_key
+        if entry.get('extracted'):
+            page['extracted'] = entry['extracted']
+        return page
+    
+    def _store_page(self, post_key: tuple, page: Optional[dict]):
+        """본문 수집에 성공한 페이지를 캐시에 저장합니다 (본문 추출 결과는 추출 후 함께 저장)."""
+        if not page or not self._is_content_page(page['html']):
+            return
+        page['post_key'] = post_key
+        get_page_cache().put(
+            post_key, page['html'], page['source'], str(page['final_url']),
+            etag=page.get('etag'), last_modified=page.get('last_modified'),
+            partial=page.get('partial', False)
+        )
+    
+    def _revalidate_cached_page(self, post_key: tuple, entry: dict) -> Optional[dict]:
+        """
+        TTL이 지난 캐시 항목을 조건부 요청(If-None-Match/If-Modified-Since)으로 재검증합니다.
+        
+        Returns:
+            304면 캐시 페이지, 200이면 새 페이지 (실패하면 None)
+        """
+        page_cache = get_page_cache()
+        try:
+            headers = {
+                'Referer': build_variant_referer(entry['source'], *post_key),
+                **page_cache.conditional_headers(entry)
+            }
+            response = self._session_get_streaming(entry['final_url'], MODE_CONTENT, headers=headers, timeout=15)
+            
+            if response.status_code == 304:
+                page_cache.record('revalidated')
+                entry = page_cache.touch(
+                    post_key, entry,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+                print(f"[DEBUG] 페이지 캐시 재검증 완료 (304): {post_key[0]}/{post_key[1]}")
+                return self._page_from_cache(entry, post_key=post_key)
+            
+            if response.status_code == 200:
+                response.encoding = 'utf-8'
+                html_text = response.text
+                if self._is_content_page(html_text):
+                    page_cache.record('refreshed')
+                    page = BlogPage(
+                        html=html_text,
+                        final_url=response.url,
+                        source=entry['source'],
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                        partial=getattr(response, 'truncated', False)
+                    )
+                    self._store_page(post_key, page)
+                    print(f"[DEBUG] 페이지 캐시 갱신 (200): {post_key[0]}/{post_key[1]}")
+                    return page
+            
+            print(f"[DEBUG] 페이지 캐시 재검증 실패: HTTP {response.status_code}")
+        except Exception as e:
+            print(f"[DEBUG] 페이지 캐시 재검증 중 오류: {e}")
+        
+        page_cache.record('revalidate_failed')
+        return None
+    
+    def _fetch_post_direct(self, post_key: tuple) -> Optional[dict]:
+        """
+        blogId/logNo로 본문이 들어 있는 페이지(iframe/mobile)를 직접 요청합니다.
+        블로그별로 지난번 성공한 페이지 종류를 먼저 시도합니다.
+        
+        Args:
+            post_key: (blogId, logNo) 튜플
+            
+        Returns:
+            _fetch_blog_page와 동일한 딕셔너리 (실패하면 None)
+        """
+        blog_id, log_no = post_key
+        variant_memory = get_variant_memory()
+        
+        for source in variant_memory.order_for(blog_id):
+            variant_url = build_variant_url(source, blog_id, log_no)
+            try:
+                self.session.headers.update({'Referer': build_variant_referer(source, blog_id, log_no)})
+                response = self._session_get_streaming(variant_url, MODE_CONTENT, timeout=15)
+                
+                if response.status_code != 200:
+                    print(f"[DEBUG] {source} 페이지 요청 실패: HTTP {response.status_code}")
+                    continue
+                
+                response.encoding = 'utf-8'
+                html_text = response.text
+                if not self._is_content_page(html_text):
+                    print(f"[DEBUG] {source} 페이지에 본문이 없거나 차단되었습니다: {variant_url}")
+                    continue
+                
+                variant_memory.record(blog_id, source)
+                print(f"[DEBUG] {source} 페이지에서 본문 수신 완료 (길이: {len(html_text)} 문자)")
+                return BlogPage(
+                    html=html_text,
+                    final_url=response.url,
+                    source=source,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    partial=getattr(response, 'truncated', False)
+                )
+            except Exception as e:
+                print(f"[DEBUG] {source} 페이지 요청 중 오류 ({variant_url}): {e}")
+        
+        return None
+    
+    def _fetch_blog_page_chain(self, url: str) -> Optional[dict]:
+        """
+        첫 페이지 → iframe(mainFrame) → 모바일 페이지 순으로 추적하여
+        블로그 본문을 포함한 HTML과 파싱 결과를 반환합니다.
         """
         try:
             original_url = url
@@ -93,17 +541,13 @@ class NaverCrawler:
             
             # 네이버 리다이렉트 URL 처리
             if 'naver.com/search.naver' in current_url or 'search.naver.com' in current_url:
-                time.sleep(random.uniform(1, 2))
-                response = self.session.get(current_url, timeout=15, allow_redirects=True)
+                response = self._session_get(current_url, timeout=15, allow_redirects=True)
                 current_url = response.url
             
-            # 요청 전 지연 (차단 방지)
-            time.sleep(random.uniform(1, 3))
-            
             # Referer 업데이트 (통합검색에서 이동한 것으로 설정)
             self.session.headers.update({'Referer': 'https://search.naver.com/'})
             
-            response = self.session.get(current_url, timeout=15)
+            response = self._session_get_streaming(current_url, MODE_OUTER, timeout=15)
             
             if response.status_code != 200:
                 print(f"[ERROR] 블로그 페이지 접속 실패: HTTP {response.status_code}")
@@ -113,7 +557,9 @@ class NaverCrawler:
             response.encoding = 'utf-8'
             
             html_text = response.text
-            soup = BeautifulSoup(html_text, 'lxml')
+            partial = getattr(response, 'truncated', False)
+            # soup은 첫 페이지에서 iframe src를 찾을 때만 생성 (최종 페이지 soup은 처음 사용할 때 생성)
+            soup = None
             final_url = response.url
             source = 'main'
             
@@ -122,32 +568,25 @@ class NaverCrawler:
                 print("[WARN] 블로그 첫 페이지에서 차단 패턴이 감지되었지만, iframe/모바일 페이지를 추가로 확인합니다.")
             
             # iframe(mainFrame) 추적
-            iframe = soup.find('iframe', id=lambda x: x and 'mainframe' in str(x).lower())
-            if iframe and iframe.get('src'):
-                iframe_src = iframe.get('src')
-                if iframe_src.startswith('//'):
-                    iframe_url = 'https:' + iframe_src.lstrip('/')
-                elif iframe_src.startswith('http'):
-                    iframe_url = iframe_src
-                else:
-                    iframe_url = urljoin('https://blog.naver.com/', iframe_src.lstrip('/'))
-                
-                print(f"[DEBUG] mainFrame iframe 발견, src: {iframe_src}")
-                print(f"[DEBUG] iframe 요청 URL: {iframe_url}")
-                
-                time.sleep(random.uniform(1, 2))
+            if getattr(response, 'frame_src', None):
+                iframe_url = self._resolve_mainframe_src(response.frame_src)
+            else:
+                soup = BeautifulSoup(html_text, 'lxml')
+                iframe_url = self._get_mainframe_url(soup)
+            if iframe_url:
                 
                 # Referer를 원본 블로그 URL로 설정
                 referer_url = final_url if final_url else original_url
                 self.session.headers.update({'Referer': referer_url})
                 
-                iframe_response = self.session.get(iframe_url, timeout=15)
+                iframe_response = self._session_get_streaming(iframe_url, MODE_CONTENT, timeout=15)
                 
                 if iframe_response.status_code == 200:
                     iframe_response.raise_for_status()
                     iframe_response.encoding = 'utf-8'
                     html_text = iframe_response.text
-                    soup = BeautifulSoup(html_text, 'lxml')
+                    partial = getattr(iframe_response, 'truncated', False)
+                    soup = None
                     final_url = iframe_response.url
                     source = 'iframe'
                     print(f"[DEBUG] iframe 응답 수신 완료 (길이: {len(html_text)} 문자)")
@@ -158,37 +597,21 @@ class NaverCrawler:
                     print(f"[ERROR] iframe 요청 실패: HTTP {iframe_response.status_code}")
             
             # 필요 시 모바일 페이지로 재시도
-            html_lower = html_text.lower()
-            if ('post-view' not in html_lower) and ('se-main-container' not in html_lower):
-                blog_id = None
-                log_no = None
-                
-                # 경로에서 추출
-                parsed_path = urlparse(final_url).path.strip('/').split('/')
-                if len(parsed_path) >= 2:
-                    blog_id = parsed_path[0]
-                    log_no = parsed_path[-1]
-                
-                # 쿼리에서 추출 (PostView.naver?blogId=...&logNo=...)
-                parsed_query = parse_qs(urlparse(final_url).query)
-                if 'blogId' in parsed_query:
-                    blog_id = parsed_query['blogId'][0]
-                if 'logNo' in parsed_query:
-                    log_no = parsed_query['logNo'][0]
-                
-                if blog_id and log_no:
-                    mobile_url = f"https://m.blog.naver.com/{blog_id}/{log_no}"
+            if self._needs_mobile_fallback(html_text):
+                mobile = self._get_mobile_url(final_url)
+                if mobile:
+                    mobile_url, blog_id = mobile
                     print(f"[DEBUG] 모바일 페이지로 재시도: {mobile_url}")
                     
-                    time.sleep(random.uniform(1, 2))
                     self.session.headers.update({'Referer': f'https://blog.naver.com/{blog_id}'})
-                    mobile_response = self.session.get(mobile_url, timeout=15)
+                    mobile_response = self._session_get_streaming(mobile_url, MODE_CONTENT, timeout=15)
                     
                     if mobile_response.status_code == 200:
                         mobile_response.raise_for_status()
                         mobile_response.encoding = 'utf-8'
                         html_text = mobile_response.text
-                        soup = BeautifulSoup(html_text, 'lxml')
+                        partial = getattr(mobile_response, 'truncated', False)
+                        soup = None
                         final_url = mobile_response.url
                         source = 'mobile'
                         print(f"[DEBUG] 모바일 페이지 응답 수신 완료 (길이: {len(html_text)} 문자)")
@@ -201,12 +624,11 @@ class NaverCrawler:
                 else:
                     print("[DEBUG] 모바일 페이지 재시도를 위한 blogId/logNo를 추출할 수 없습니다.")
             
-            return {
-                'html': html_text,
-                'soup': soup,
-                'final_url': final_url,
-                'source': source
-            }
+            page = BlogPage(html=html_text, final_url=final_url, source=source, partial=partial)
+            if soup is not None:
+                # iframe 추적에 사용한 첫 페이지 soup 재사용 (그 외에는 처음 사용할 때 생성)
+                page['soup'] = soup
+            return page
         
         except Exception as e:
             print(f"[ERROR] 블로그 페이지 수집 실패 ({url}): {e}")
@@ -214,214 +636,843 @@ class NaverCrawler:
             traceback.print_exc()
             return None
     
-    def get_top_n_blog_info(self, keyword: str, n: int = 3) -> list:
+    async def _fetch_blog_page_async(self, url: str) -> Optional[dict]:
         """
-        네이버 통합검색에서 상위 N개 블로그 글의 제목과 URL을 반환합니다
+        _fetch_blog_page의 asyncio 버전입니다.
+        공유 커넥션 풀(AsyncFetcher)을 사용하며, 지연은 이벤트 루프를 막지 않습니다.
+        """
+        page, shared = await get_async_single_flight().do(
+            ('page', normalize_post_url(url)), self._load_blog_page_async, url
+        )
+        if shared and page:
+            print(f"[DEBUG] 진행 중인 동일 글 요청 결과를 공유합니다: {url}")
+            page = page.fresh()
+        return page
+    
+    async def fetch_current_page_async(self, url: str) -> Optional[dict]:
+        """
+        글의 지금 페이지를 네트워크로 확인합니다 (지난 처리 결과를 재사용해도 되는지 판단할 때 사용).
+        페이지 캐시에 있으면 TTL과 관계없이 저장된 ETag/Last-Modified로 조건부 요청을 보내(304면 캐시 사용,
+        200이면 새 페이지로 캐시 갱신) 확인하고, 캐시에 없으면 새로 수집합니다.
         
-        Args:
-            keyword: 검색할 키워드
-            n: 가져올 블로그 글 개수 (기본값: 3)
-            
         Returns:
-            [{'title': str, 'url': str}, ...] 형태의 리스트
+            _fetch_blog_page와 동일한 딕셔너리 (확인하지 못하면 None)
+        """
+        post_key = resolve_post_key(url)
+        if post_key:
+            loop = asyncio.get_event_loop()
+            entry = await loop.run_in_executor(None, get_page_cache().get, post_key)
+            if entry:
+                return await self._revalidate_cached_page_async(post_key, entry)
+        return await self._fetch_blog_page_async(url)
+    
+    async def extract_current_body_async(self, url: str) -> Optional[dict]:
         """
+        fetch_current_page_async로 확인한 지금 페이지에서 본문을 추출합니다
+        (304로 재검증된 글은 페이지 캐시에 저장된 추출 결과를 사용).
+        
+        Returns:
+            extract_blog_body_with_media와 동일한 딕셔너리 (확인하지 못하면 None)
+        """
+        page = await self.fetch_current_page_async(url)
+        if not page:
+            return None
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._extract_body_from_page, page)
+    
+    async def _load_blog_page_async(self, url: str) -> Optional[dict]:
+        """_load_blog_page의 asyncio 버전입니다."""
+        post_key = resolve_post_key(url)
+        if not post_key:
+            return await self._fetch_blog_page_chain_async(url)
+        
+        loop = asyncio.get_event_loop()
+        page_cache = get_page_cache()
+        entry = await loop.run_in_executor(None, page_cache.get, post_key)
+        if entry:
+            if page_cache.is_fresh(entry):
+                page_cache.record('hits')
+                print(f"[DEBUG] 페이지 캐시 사용: {post_key[0]}/{post_key[1]} ({entry['source']})")
+                return await loop.run_in_executor(None, self._page_from_cache, entry, None, post_key)
+            page = await self._revalidate_cached_page_async(post_key, entry)
+            if page:
+                return page
+        else:
+            page_cache.record('misses')
+        
+        page = await self._fetch_post_direct_async(post_key)
+        if not page:
+            print("[DEBUG] 본문 페이지 직접 요청 실패, 첫 페이지부터 다시 추적합니다.")
+            page = await self._fetch_blog_page_chain_async(url)
+        await loop.run_in_executor(None, self._store_page, post_key, page)
+        return page
+    
+    async def _revalidate_cached_page_async(self, post_key: tuple, entry: dict) -> Optional[dict]:
+        """_revalidate_cached_page의 asyncio 버전입니다."""
+        page_cache = get_page_cache()
+        loop = asyncio.get_event_loop()
         try:
-            # 네이버 통합검색 URL 생성
-            params = {
-                'query': keyword,
-                'where': 'nexearch',
-                'sm': 'top_hty',
-                'fbm': '0',
-                'ie': 'utf8'
+            headers = {
+                **self.headers,
+                'Referer': build_variant_referer(entry['source'], *post_key),
+                **page_cache.conditional_headers(entry)
             }
+            response = await self._fetcher_get_streaming(entry['final_url'], MODE_CONTENT, headers=headers)
+            
+            if response.status_code == 304:
+                page_cache.record('revalidated')
+                entry = await loop.run_in_executor(
+                    None, page_cache.touch, post_key, entry,
+                    response.headers.get('ETag'), response.headers.get('Last-Modified')
+                )
+                print(f"[DEBUG] 페이지 캐시 재검증 완료 (304): {post_key[0]}/{post_key[1]}")
+                return await loop.run_in_executor(None, self._page_from_cache, entry, None, post_key)
+            
+            if response.status_code == 200:
+                response.encoding = 'utf-8'
+                html_text = response.text
+                if self._is_content_page(html_text):
+                    page_cache.record('refreshed')
+                    page = BlogPage(
+                        html=html_text,
+                        final_url=str(response.url),
+                        source=entry['source'],
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                        partial=getattr(response, 'truncated', False)
+                    )
+                    await loop.run_in_executor(None, self._store_page, post_key, page)
+                    print(f"[DEBUG] 페이지 캐시 갱신 (200): {post_key[0]}/{post_key[1]}")
+                    return page
+            
+            print(f"[DEBUG] 페이지 캐시 재검증 실패: HTTP {response.status_code}")
+        except Exception as e:
+            print(f"[DEBUG] 페이지 캐시 재검증 중 오류: {e}")
+        
+        page_cache.record('revalidate_failed')
+        return None
+    
+    async def _fetch_post_direct_async(self, post_key: tuple) -> Optional[dict]:
+        """
+        _fetch_post_direct의 asyncio 버전입니다.
+        헤지 모드(CRAWLER_HEDGE=1)에서는 먼저 시도한 페이지가 HEDGE_DELAY초 안에 본문을 주지 않으면
+        다음 페이지를 함께 요청하고, 먼저 도착한 본문을 사용한 뒤 나머지 요청은 취소합니다.
+        """
+        blog_id, log_no = post_key
+        variant_memory = get_variant_memory()
+        order = variant_memory.order_for(blog_id)
+        
+        if HEDGE_ENABLED and len(order) > 1:
+            fetched = await self._fetch_variants_hedged_async(blog_id, log_no, order)
+        else:
+            fetched = None
+            for source in order:
+                fetched = await self._fetch_variant_async(blog_id, log_no, source)
+                if fetched is not None:
+                    break
+        
+        if fetched is None:
+            return None
+        
+        source, response, html_text = fetched
+        # 기록이 바뀌면 파일을 다시 쓰므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, variant_memory.record, blog_id, source)
+        print(f"[DEBUG] {source} 페이지에서 본문 수신 완료 (길이: {len(html_text)} 문자)")
+        return BlogPage(
+            html=html_text,
+            final_url=str(response.url),
+            source=source,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            partial=getattr(response, 'truncated', False)
+        )
+    
+    async def _fetch_variant_async(self, blog_id: str, log_no: str, source: str) -> Optional[tuple]:
+        """
+        본문 페이지 하나(iframe/mobile)를 요청합니다.
+        
+        Returns:
+            (source, 응답, HTML) 튜플 (본문이 없거나 실패하면 None)
+        """
+        variant_url = build_variant_url(source, blog_id, log_no)
+        try:
+            response = await self._fetcher_get_streaming(
+                variant_url,
+                MODE_CONTENT,
+                headers={**self.headers, 'Referer': build_variant_referer(source, blog_id, log_no)}
+            )
             
-            # 요청 전 지연 (차단 방지)
-            time.sleep(random.uniform(1, 3))
+            if response.status_code != 200:
+                print(f"[DEBUG] {source} 페이지 요청 실패: HTTP {response.status_code}")
+                return None
             
-            response = self.session.get(
-                self.base_url, 
-                params=params, 
-                timeout=15
-            )
-            response.raise_for_status()
             response.encoding = 'utf-8'
-            
-            # HTML 소스에서 blog.naver.com이 포함된 부분 찾기
             html_text = response.text
+            if not self._is_content_page(html_text):
+                print(f"[DEBUG] {source} 페이지에 본문이 없거나 차단되었습니다: {variant_url}")
+                return None
             
-            if 'blog.naver.com' not in html_text.lower():
-                print("[ERROR] HTML 소스에 blog.naver.com이 없습니다.")
-                return []
+            return source, response, html_text
+        except Exception as e:
+            print(f"[DEBUG] {source} 페이지 요청 중 오류 ({variant_url}): {e}")
+            return None
+    
+    async def _fetch_variants_hedged_async(self, blog_id: str, log_no: str, order: list) -> Optional[tuple]:
+        """
+        본문 페이지들을 헤지 방식으로 요청합니다.
+        앞 요청이 HEDGE_DELAY초를 넘기거나 실패하면 다음 페이지 요청을 추가로 시작하고,
+        가장 먼저 도착한 본문을 돌려줍니다.
+        
+        Returns:
+            _fetch_variant_async와 동일한 튜플 (모두 실패하면 None)
+        """
+        pending = {asyncio.ensure_future(self._fetch_variant_async(blog_id, log_no, order[0]))}
+        started = 1
+        try:
+            while pending:
+                timeout = HEDGE_DELAY if started < len(order) else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    fetched = task.result()
+                    if fetched is not None:
+                        if started > 1:
+                            print(f"[DEBUG] 헤지 요청 중 {fetched[0]} 페이지가 먼저 도착했습니다.")
+                        return fetched
+                
+                if started < len(order) and (not done or not pending):
+                    if not done:
+                        print(f"[DEBUG] {order[started - 1]} 페이지 응답이 {HEDGE_DELAY}초를 넘어 {order[started]} 페이지도 요청합니다.")
+                    pending.add(asyncio.ensure_future(self._fetch_variant_async(blog_id, log_no, order[started])))
+                    started += 1
+            return None
+        finally:
+            # 진 쪽 요청은 취소 (연결은 스트림 컨텍스트가 정리)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _fetch_blog_page_chain_async(self, url: str) -> Optional[dict]:
+        """_fetch_blog_page_chain의 asyncio 버전입니다."""
+        try:
+            loop = asyncio.get_event_loop()
+            original_url = url
+            current_url = url
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'lxml')
-            all_links = soup.find_all('a', href=True)
+            # 네이버 리다이렉트 URL 처리
+            if 'naver.com/search.naver' in current_url or 'search.naver.com' in current_url:
+                response = await self._fetcher_get(current_url, headers=self.headers)
+                current_url = str(response.url)
             
-            blog_list = []
-            seen_urls = set()  # 중복 URL 방지
+            # Referer: 통합검색에서 이동한 것으로 설정
+            response = await self._fetcher_get_streaming(
+                current_url, MODE_OUTER, headers={**self.headers, 'Referer': 'https://search.naver.com/'}
+            )
             
-            # 상위 N개 블로그 글 URL 찾기
-            for link in all_links:
-                if len(blog_list) >= n:
-                    break
-                    
-                href = link.get('href', '')
-                
-                # blog.naver.com 링크 찾기
-                is_blog_link = 'blog.naver.com' in href.lower()
+            if response.status_code != 200:
+                print(f"[ERROR] 블로그 페이지 접속 실패: HTTP {response.status_code}")
+                return None
+            
+            response.encoding = 'utf-8'
+            html_text = response.text
+            partial = getattr(response, 'truncated', False)
+            # soup은 첫 페이지에서 iframe src를 찾을 때만 생성 (최종 페이지 soup은 처음 사용할 때 생성)
+            soup = None
+            final_url = str(response.url)
+            source = 'main'
+            
+            # 차단 여부 확인
+            if self._is_blocked_html(html_text):
+                print("[WARN] 블로그 첫 페이지에서 차단 패턴이 감지되었지만, iframe/모바일 페이지를 추가로 확인합니다.")
+            
+            # iframe(mainFrame) 추적
+            if getattr(response, 'frame_src', None):
+                iframe_url = self._resolve_mainframe_src(response.frame_src)
+            else:
+                soup = await loop.run_in_executor(None, BeautifulSoup, html_text, 'lxml')
+                iframe_url = self._get_mainframe_url(soup)
+            if iframe_url:
                 
-                if not is_blog_link:
-                    continue
+                # Referer를 원본 블로그 URL로 설정
+                referer_url = final_url if final_url else original_url
+                iframe_response = await self._fetcher_get_streaming(
+                    iframe_url, MODE_CONTENT, headers={**self.headers, 'Referer': referer_url}
+                )
                 
-                # 광고 링크 필터링 (광고는 특정 클래스나 구조를 가짐)
-                parent = link.find_parent(['div', 'li', 'article', 'section'])
-                if parent:
-                    # 광고 관련 클래스나 속성 확인
-                    parent_classes = parent.get('class', [])
-                    parent_id = parent.get('id', '')
-                    parent_str = str(parent_classes) + ' ' + str(parent_id)
+                if iframe_response.status_code == 200:
+                    iframe_response.encoding = 'utf-8'
+                    html_text = iframe_response.text
+                    partial = getattr(iframe_response, 'truncated', False)
+                    soup = None
+                    final_url = str(iframe_response.url)
+                    source = 'iframe'
+                    print(f"[DEBUG] iframe 응답 수신 완료 (길이: {len(html_text)} 문자)")
                     
-                    # 광고 관련 키워드 확인 (네이버 광고 표시 패턴)
-                    ad_keywords = ['ad', 'advertisement', 'sponsored', 'promotion', '광고', 'ad_area', 'ad_bx', 'ad_wrap']
-                    is_ad = any(keyword.lower() in parent_str.lower() for keyword in ad_keywords)
+                    if self._is_blocked_html(html_text):
+                        print("[WARN] iframe 응답에서 차단 패턴이 감지되었습니다. 모바일 페이지를 확인합니다.")
+                else:
+                    print(f"[ERROR] iframe 요청 실패: HTTP {iframe_response.status_code}")
+            
+            # 필요 시 모바일 페이지로 재시도
+            if self._needs_mobile_fallback(html_text):
+                mobile = self._get_mobile_url(final_url)
+                if mobile:
+                    mobile_url, blog_id = mobile
+                    print(f"[DEBUG] 모바일 페이지로 재시도: {mobile_url}")
                     
-                    if is_ad:
-                        continue  # 광고는 건너뛰기
-                
-                # URL 정리
-                if href.startswith('/'):
-                    href = 'https://blog.naver.com' + href
-                elif not href.startswith('http'):
-                    continue
-                
-                # PostView나 하위 경로가 있는 실제 글 링크인지 확인
-                from urllib.parse import urlparse
-                parsed = urlparse(href)
-                path_parts = parsed.path.strip('/').split('/')
-                
-                # 실제 글 링크인지 확인
-                is_post_link = False
-                if len(path_parts) > 1:  # 하위 경로가 있음
-                    is_post_link = True
-                elif 'postview' in href.lower() or 'post' in href.lower():
-                    is_post_link = True
-                
-                if not is_post_link:
-                    continue
-                
-                # 중복 URL 체크
-                if href in seen_urls:
-                    continue
-                seen_urls.add(href)
-                
-                # 블로그 글 제목 추출
-                blog_title = None
-                
-                # 방법 1: sds-comps-text-type-headline1 클래스를 가진 span에서 제목 찾기 (우선순위 1)
-                parent = link.find_parent(['div', 'li', 'dt', 'dd', 'article', 'section'])
-                if parent:
-                    # headline1 클래스를 가진 span 찾기 (제목용)
-                    headline_span = parent.find('span', class_=lambda x: x and 'sds-comps-text-type-headline1' in str(x))
-                    if headline_span:
-                        # 전체 텍스트 가져오기 (mark 태그 포함, 띄어쓰기 보존)
-                        blog_title = headline_span.get_text(separator=' ', strip=True)
-                        blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                
-                # 방법 2: sds-comps-text-type-headline1이 없으면 다른 sds-comps-text에서 찾기 (body2 제외)
-                if not blog_title or len(blog_title) < 2:
-                    if parent:
-                        sds_spans = parent.find_all('span', class_=lambda x: x and 'sds-comps-text' in str(x))
-                        for sds_span in sds_spans:
-                            class_str = str(sds_span.get('class', []))
-                            if 'sds-comps-text-type-body2' in class_str:
-                                continue
-                            span_text = sds_span.get_text(separator=' ', strip=True)
-                            span_text = re.sub(r'\s+', ' ', span_text).strip()
-                            if span_text and 'blog.naver.com' not in span_text and '›' not in span_text and len(span_text) > 2:
-                                blog_title = span_text
-                                break
-                
-                # 방법 3: se-fs- se-ff-nanummaruburi 클래스를 가진 span에서 찾기
-                if not blog_title or len(blog_title) < 2:
-                    if parent:
-                        se_span = parent.find('span', class_=lambda x: x and 'se-fs-' in str(x) and 'se-ff-nanummaruburi' in str(x))
-                        if se_span:
-                            blog_title = se_span.get_text(separator=' ', strip=True)
-                            blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                
-                # 방법 4: api_txt_lines 클래스를 가진 요소 찾기
-                if not blog_title or len(blog_title) < 2:
-                    title_elem = link.find(['a', 'span', 'strong', 'b'], class_=lambda x: x and 'api_txt_lines' in str(x))
-                    if title_elem:
-                        blog_title = title_elem.get_text(separator=' ', strip=True)
-                        blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                
-                # 방법 5: 부모 요소에서 api_txt_lines 찾기
-                if not blog_title or len(blog_title) < 2:
-                    if not parent:
-                        parent = link.find_parent(['div', 'li', 'dt', 'dd'])
-                    if parent:
-                        title_elem = parent.find(['a', 'span', 'strong', 'b'], class_=lambda x: x and 'api_txt_lines' in str(x))
-                        if title_elem:
-                            blog_title = title_elem.get_text(separator=' ', strip=True)
-                            blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                
-                # 방법 6: 링크 텍스트에서 날짜 제거
-                if not blog_title or len(blog_title) < 2:
-                    link_text = link.get_text(strip=True)
-                    if 'blog.naver.com' not in link_text and '›' not in link_text:
-                        date_pattern = r'\d{4}[.\-]\d{1,2}[.\-]\d{1,2}'
-                        cleaned_text = re.sub(date_pattern, '', link_text).strip()
-                        if cleaned_text and len(cleaned_text) > 2:
-                            blog_title = cleaned_text
-                
-                # 방법 7: data-title, title 속성
-                if not blog_title or len(blog_title) < 2:
-                    for attr in ['data-title', 'title', 'aria-label']:
-                        title_attr = link.get(attr)
-                        if title_attr and len(str(title_attr).strip()) > 2:
-                            blog_title = str(title_attr).strip()
-                            break
-                
-                # 방법 8: 블로그 페이지에서 직접 제목 추출 시도
-                if not blog_title or len(blog_title) < 2:
-                    try:
-                        page = self._fetch_blog_page(href)
-                        if page:
-                            page_soup = page['soup']
-                            se_span = page_soup.find('span', class_=lambda x: x and 'se-fs-' in str(x) and 'se-ff-nanummaruburi' in str(x))
-                            if se_span:
-                                blog_title = se_span.get_text(separator=' ', strip=True)
-                                blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                            
-                            if not blog_title or len(blog_title) < 2:
-                                sds_span = page_soup.find('span', class_=lambda x: x and 'sds-comps-text-type-headline1' in str(x))
-                                if sds_span:
-                                    blog_title = sds_span.get_text(separator=' ', strip=True)
-                                    blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                                else:
-                                    sds_span = page_soup.find('span', class_=lambda x: x and 'sds-comps-text' in str(x))
-                                    if sds_span:
-                                        mark_elem = sds_span.find('mark')
-                                        if mark_elem:
-                                            blog_title = sds_span.get_text(separator=' ', strip=True)
-                                            blog_title = re.sub(r'\s+', ' ', blog_title).strip()
-                    except Exception as e:
-                        print(f"[DEBUG] 블로그 페이지에서 제목 추출 시도 중 오류: {e}")
+                    mobile_response = await self._fetcher_get_streaming(
+                        mobile_url,
+                        MODE_CONTENT,
+                        headers={**self.headers, 'Referer': f'https://blog.naver.com/{blog_id}'}
+                    )
+                    
+                    if mobile_response.status_code == 200:
+                        mobile_response.encoding = 'utf-8'
+                        html_text = mobile_response.text
+                        partial = getattr(mobile_response, 'truncated', False)
+                        soup = None
+                        final_url = str(mobile_response.url)
+                        source = 'mobile'
+                        print(f"[DEBUG] 모바일 페이지 응답 수신 완료 (길이: {len(html_text)} 문자)")
+                        
+                        if self._is_blocked_html(html_text):
+                            print("[ERROR] 모바일 페이지에서도 차단 패턴이 감지되었습니다.")
+                            return None
+                    else:
+                        print(f"[ERROR] 모바일 페이지 요청 실패: HTTP {mobile_response.status_code}")
+                else:
+                    print("[DEBUG] 모바일 페이지 재시도를 위한 blogId/logNo를 추출할 수 없습니다.")
+            
+            page = BlogPage(html=html_text, final_url=final_url, source=source, partial=partial)
+            if soup is not None:
+                # iframe 추적에 사용한 첫 페이지 soup 재사용 (그 외에는 처음 사용할 때 생성)
+                page['soup'] = soup
+            return page
+        
+        except Exception as e:
+            print(f"[ERROR] 블로그 페이지 수집 실패 ({url}): {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    def _build_search_params(self, keyword: str) -> dict:
+        """네이버 통합검색 요청 파라미터를 생성합니다."""
+        return {
+            'query': keyword,
+            'where': 'nexearch',
+            'sm': 'top_hty',
+            'fbm': '0',
+            'ie': 'utf8'
+        }
+    
+    def _iter_serp_candidates(self, html_text: str):
+        """
+        통합검색 HTML에서 블로그 글 후보를 순위 순서대로 반환합니다.
+        SERP 안에서 제목을 찾지 못한 후보는 title=None으로 반환되며,
+        호출 측에서 블로그 페이지를 직접 조회해 제목을 보완합니다.
+        기본으로 lxml XPath 파서(serp_parser)를 사용하고, 실패하면 기존 BeautifulSoup 방식으로 처리합니다.
+        
+        Returns:
+            [(url, title 또는 None), ...] 리스트
+        """
+        if SERP_PARSER != 'legacy':
+            try:
+                return list(parse_serp_html(html_text))
+            except Exception as e:
+                print(f"[WARN] SERP 파서 오류, 기존 방식으로 다시 처리합니다: {e}")
+        return list(self._iter_serp_candidates_legacy(html_text))
+    
+    def _iter_serp_candidates_legacy(self, html_text: str):
+        """
+        _iter_serp_candidates의 기존 BeautifulSoup 구현입니다 (링크마다 부모 요소와 제목 후보를 탐색).
+        
+        Yields:
+            (url, title 또는 None) 튜플
+        """
+        soup = BeautifulSoup(html_text, 'lxml')
+        all_links = soup.find_all('a', href=True)
+        seen_urls = set()  # 중복 URL 방지
+        
+        for link in all_links:
+            href = link.get('href', '')
+            
+            # blog.naver.com 링크 찾기
+            is_blog_link = 'blog.naver.com' in href.lower()
+            
+            if not is_blog_link:
+                continue
+            
+            # 광고 링크 필터링 (광고는 특정 클래스나 구조를 가짐)
+            parent = link.find_parent(['div', 'li', 'article', 'section'])
+            if parent:
+                # 광고 관련 클래스나 속성 확인
+                parent_classes = parent.get('class', [])
+                parent_id = parent.get('id', '')
+                parent_str = str(parent_classes) + ' ' + str(parent_id)
                 
-                if blog_title and len(blog_title) > 2:
-                    if len(blog_title) > 150:
-                        blog_title = blog_title[:150]
-                    blog_list.append({
-                        'title': blog_title,
-                        'url': href
-                    })
+                # 광고 관련 키워드 확인 (네이버 광고 표시 패턴)
+                ad_keywords = ['ad', 'advertisement', 'sponsored', 'promotion', '광고', 'ad_area', 'ad_bx', 'ad_wrap']
+                is_ad = any(keyword.lower() in parent_str.lower() for keyword in ad_keywords)
+                
+                if is_ad:
+                    continue  # 광고는 건너뛰기
+            
+            # URL 정리
+            if href.startswith('/'):
+                href = 'https://blog.naver.com' + href
+            elif not href.startswith('http'):
+                continue
+            
+            # PostView나 하위 경로가 있는 실제 글 링크인지 확인
+            parsed = urlparse(href)
+            path_parts = parsed.path.strip('/').split('/')
+            
+            # 실제 글 링크인지 확인
+            is_post_link = False
+            if len(path_parts) > 1:  # 하위 경로가 있음
+                is_post_link = True
+            elif 'postview' in href.lower() or 'post' in href.lower():
+                is_post_link = True
+            
+            if not is_post_link:
+                continue
+            
+            # 중복 URL 체크
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            
+            # 블로그 글 제목 추출
+            blog_title = None
+            
+            # 방법 1: sds-comps-text-type-headline1 클래스를 가진 span에서 제목 찾기 (우선순위 1)
+            parent = link.find_parent(['div', 'li', 'dt', 'dd', 'article', 'section'])
+            if parent:
+                # headline1 클래스를 가진 span 찾기 (제목용)
+                headline_span = parent.find('span', class_=lambda x: x and 'sds-comps-text-type-headline1' in str(x))
+                if headline_span:
+                    # 전체 텍스트 가져오기 (mark 태그 포함, 띄어쓰기 보존)
+                    blog_title = headline_span.get_text(separator=' ', strip=True)
+                    blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+            
+            # 방법 2: sds-comps-text-type-headline1이 없으면 다른 sds-comps-text에서 찾기 (body2 제외)
+            if not blog_title or len(blog_title) < 2:
+                if parent:
+                    sds_spans = parent.find_all('span', class_=lambda x: x and 'sds-comps-text' in str(x))
+                    for sds_span in sds_spans:
+                        class_str = str(sds_span.get('class', []))
+                        if 'sds-comps-text-type-body2' in class_str:
+                            continue
+                        span_text = sds_span.get_text(separator=' ', strip=True)
+                        span_text = re.sub(r'\s+', ' ', span_text).strip()
+                        if span_text and 'blog.naver.com' not in span_text and '›' not in span_text and len(span_text) > 2:
+                            blog_title = span_text
+                            break
             
-            return blog_list
+            # 방법 3: se-fs- se-ff-nanummaruburi 클래스를 가진 span에서 찾기
+            if not blog_title or len(blog_title) < 2:
+                if parent:
+                    se_span = parent.find('span', class_=lambda x: x and 'se-fs-' in str(x) and 'se-ff-nanummaruburi' in str(x))
+                    if se_span:
+                        blog_title = se_span.get_text(separator=' ', strip=True)
+                        blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+            
+            # 방법 4: api_txt_lines 클래스를 가진 요소 찾기
+            if not blog_title or len(blog_title) < 2:
+                title_elem = link.find(['a', 'span', 'strong', 'b'], class_=lambda x: x and 'api_txt_lines' in str(x))
+                if title_elem:
+                    blog_title = title_elem.get_text(separator=' ', strip=True)
+                    blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+            
+            # 방법 5: 부모 요소에서 api_txt_lines 찾기
+            if not blog_title or len(blog_title) < 2:
+                if not parent:
+                    parent = link.find_parent(['div', 'li', 'dt', 'dd'])
+                if parent:
+                    title_elem = parent.find(['a', 'span', 'strong', 'b'], class_=lambda x: x and 'api_txt_lines' in str(x))
+                    if title_elem:
+                        blog_title = title_elem.get_text(separator=' ', strip=True)
+                        blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+            
+            # 방법 6: 링크 텍스트에서 날짜 제거
+            if not blog_title or len(blog_title) < 2:
+                link_text = link.get_text(strip=True)
+                if 'blog.naver.com' not in link_text and '›' not in link_text:
+                    date_pattern = r'\d{4}[.\-]\d{1,2}[.\-]\d{1,2}'
+                    cleaned_text = re.sub(date_pattern, '', link_text).strip()
+                    if cleaned_text and len(cleaned_text) > 2:
+                        blog_title = cleaned_text
+            
+            # 방법 7: data-title, title 속성
+            if not blog_title or len(blog_title) < 2:
+                for attr in ['data-title', 'title', 'aria-label']:
+                    title_attr = link.get(attr)
+                    if title_attr and len(str(title_attr).strip()) > 2:
+                        blog_title = str(title_attr).strip()
+                        break
+            
+            yield (href, blog_title if blog_title and len(blog_title) >= 2 else None)
+    
+    def _extract_title_from_page(self, page_soup) -> Optional[str]:
+        """블로그 글 페이지에서 제목을 추출합니다 (SERP에 제목이 없을 때 사용)."""
+        blog_title = None
+        se_span = page_soup.find('span', class_=lambda x: x and 'se-fs-' in str(x) and 'se-ff-nanummaruburi' in str(x))
+        if se_span:
+            blog_title = se_span.get_text(separator=' ', strip=True)
+            blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+        
+        if not blog_title or len(blog_title) < 2:
+            sds_span = page_soup.find('span', class_=lambda x: x and 'sds-comps-text-type-headline1' in str(x))
+            if sds_span:
+                blog_title = sds_span.get_text(separator=' ', strip=True)
+                blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+            else:
+                sds_span = page_soup.find('span', class_=lambda x: x and 'sds-comps-text' in str(x))
+                if sds_span:
+                    mark_elem = sds_span.find('mark')
+                    if mark_elem:
+                        blog_title = sds_span.get_text(separator=' ', strip=True)
+                        blog_title = re.sub(r'\s+', ' ', blog_title).strip()
+        return blog_title
+    
+    def get_top_n_blog_info(self, keyword: str, n: int = 3, resolve_titles: bool = True) -> list:
+        """
+        네이버 통합검색에서 상위 N개 블로그 글의 제목과 URL을 반환합니다
+        검색 결과 전체 목록은 키워드별로 SERP 캐시에 저장되어, 같은 키워드는 N과 관계없이 캐시에서 가져옵니다.
+        TTL이 지난 결과는 그대로 사용하면서 백그라운드에서 새로 고칩니다.
+        
+        Args:
+            keyword: 검색할 키워드
+            n: 가져올 블로그 글 개수 (기본값: 3)
+            resolve_titles: True면 검색 결과에 제목이 없는 글의 제목을 블로그 페이지에서 동시에 찾아서 반환,
+                False면 찾지 않고 title=None, title_pending=True로 표시해 바로 반환 (resolve_title로 나중에 보완)
             
+        Returns:
+            [{'title': str, 'url': str}, ...] 형태의 리스트
+        """
+        key = normalize_keyword(keyword)
+        serp_cache = get_serp_cache()
+        entry = serp_cache.get(key)
+        
+        if entry is not None:
+            if serp_cache.is_fresh(entry):
+                serp_cache.record('hits')
+            else:
+                serp_cache.record('stale_hits')
+                self._start_serp_refresh(keyword, key)
+            print(f"[DEBUG] 검색 결과 캐시 사용: '{keyword}' (n={n})")
+        else:
+            serp_cache.record('misses')
+            entry, shared = get_single_flight().do(('serp', key), self._refresh_serp_entry, keyword, key)
+            if shared:
+                print(f"[DEBUG] 진행 중인 동일 검색 결과를 공유합니다: '{keyword}' (n={n})")
+            if entry is None:
+                return []
+        
+        return self._select_top_n(key, entry, n, resolve_titles)
+    
+    def _fetch_serp_candidates(self, keyword: str) -> list:
+        """
+        통합검색을 요청하고 블로그 글 후보 전체를 순위 순서로 반환합니다.
+        
+        Returns:
+            [{'url': str, 'title': str 또는 None}, ...] (title이 None이면 검색 결과에서 제목을 찾지 못한 글)
+        """
+        response = self._session_get(
+            self.base_url, 
+            params=self._build_search_params(keyword), 
+            timeout=15
+        )
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        
+        # HTML 소스에서 blog.naver.com이 포함된 부분 찾기
+        html_text = response.text
+        
+        if 'blog.naver.com' not in html_text.lower():
+            print("[ERROR] HTML 소스에 blog.naver.com이 없습니다.")
+            return []
+        
+        return self._serp_candidates_from_html(html_text)
+    
+    def _serp_candidates_from_html(self, html_text: str) -> list:
+        """검색 결과 HTML에서 SERP 캐시에 저장할 후보 목록을 만듭니다."""
+        return [
+            {'url': href, 'title': blog_title or None}
+            for href, blog_title in self._iter_serp_candidates(html_text)
+        ]
+    
+    def _refresh_serp_entry(self, keyword: str, key: str) -> Optional[dict]:
+        """
+        검색을 새로 요청하고 SERP 캐시에 저장합니다.
+        
+        Returns:
+            캐시 항목 (검색 실패 또는 결과가 없으면 None)
+        """
+        try:
+            candidates = self._fetch_serp_candidates(keyword)
         except Exception as e:
             print(f"오류 발생: {e}")
+            return None
+        if not candidates:
+            return None
+        entry = get_serp_cache().put(key, candidates)
+        return entry or {'keyword': key, 'candidates': candidates, 'fetched_at': time.time()}
+    
+    def _start_serp_refresh(self, keyword: str, key: str):
+        """TTL이 지난 검색 결과를 백그라운드 스레드에서 새로 고칩니다 (별도 세션 사용)."""
+        serp_cache = get_serp_cache()
+        if not serp_cache.begin_refresh(key):
+            return
+        
+        def refresh():
+            entry = None
+            try:
+                entry = NaverCrawler()._refresh_serp_entry(keyword, key)
+            finally:
+                serp_cache.end_refresh(key, entry is not None)
+        
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    def _select_top_n(self, key: str, entry: dict, n: int, resolve_titles: bool = True) -> list:
+        """
+        캐시 항목의 후보 목록에서 상위 N개 블로그 글을 고릅니다.
+        검색 결과에 제목이 없는 글은 블로그 페이지에서 제목을 동시에 찾아 캐시에 함께 저장합니다.
+        """
+        candidates = [dict(candidate) for candidate in entry['candidates']]
+        resolved = False
+        
+        while True:
+            chosen = self._choose_candidates(candidates, n)
+            pending = [candidate for candidate in chosen if candidate['title'] is None]
+            if not resolve_titles or not pending:
+                break
+            
+            # 방법 8: 블로그 페이지에서 직접 제목 추출 (여러 글을 동시에 조회)
+            titles = self._resolve_titles_concurrently([candidate['url'] for candidate in pending])
+            for candidate, blog_title in zip(pending, titles):
+                candidate['title'] = blog_title or ''
+            resolved = True
+        
+        if resolved:
+            get_serp_cache().put(key, candidates, fetched_at=entry['fetched_at'])
+        return [self._blog_info(candidate) for candidate in chosen]
+    
+    @staticmethod
+    def _is_valid_title(blog_title: Optional[str]) -> bool:
+        """결과로 사용할 수 있는 제목인지 확인합니다 (너무 짧은 제목 제외)."""
+        return bool(blog_title) and len(blog_title) > 2
+    
+    def _choose_candidates(self, candidates: list, n: int) -> list:
+        """제목이 있거나 아직 찾지 않은(None) 후보 중 앞에서부터 N개를 고릅니다."""
+        chosen = []
+        for candidate in candidates:
+            if len(chosen) >= n:
+                break
+            if candidate['title'] is None or self._is_valid_title(candidate['title']):
+                chosen.append(candidate)
+        return chosen
+    
+    @staticmethod
+    def _blog_info(candidate: dict) -> dict:
+        """후보를 결과 딕셔너리로 변환합니다 (제목을 아직 찾지 않았으면 title_pending=True)."""
+        blog_title = candidate['title']
+        if blog_title is None:
+            return {'title': None, 'url': candidate['url'], 'title_pending': True}
+        if len(blog_title) > 150:
+            blog_title = blog_title[:150]
+        return {'title': blog_title, 'url': candidate['url']}
+    
+    def _resolve_titles_concurrently(self, urls: list) -> list:
+        """
+        여러 블로그 글의 제목을 스레드로 동시에 찾습니다 (스레드마다 별도 세션 사용).
+        
+        Returns:
+            urls와 같은 순서의 제목 리스트 (찾지 못하면 None)
+        """
+        if len(urls) == 1:
+            return [self._resolve_title(urls[0])]
+        with ThreadPoolExecutor(max_workers=min(len(urls), TITLE_RESOLVE_CONCURRENCY)) as executor:
+            return list(executor.map(lambda url: NaverCrawler()._resolve_title(url), urls))
+    
+    def _resolve_title(self, url: str) -> Optional[str]:
+        """블로그 페이지에서 제목을 찾습니다 (페이지 캐시를 먼저 사용, 찾지 못하면 None)."""
+        try:
+            page = self._fetch_blog_page(url)
+            if page:
+                blog_title = self._extract_title_from_page(page['soup'])
+                if self._is_valid_title(blog_title):
+                    return blog_title
+        except Exception as e:
+            print(f"[DEBUG] 블로그 페이지에서 제목 추출 시도 중 오류: {e}")
+        return None
+    
+    def resolve_title(self, url: str, keyword: Optional[str] = None) -> Optional[str]:
+        """
+        title_pending으로 반환된 글의 제목을 찾습니다.
+        본문을 이미 수집했다면 페이지 캐시에서 바로 찾으며, keyword를 주면 SERP 캐시에도 기록합니다.
+        
+        Args:
+            url: 블로그 글 URL
+            keyword: 검색 키워드 (SERP 캐시 갱신용, 선택)
+            
+        Returns:
+            제목 (찾지 못하면 None)
+        """
+        blog_title = self._resolve_title(url)
+        if keyword:
+            get_serp_cache().set_title(normalize_keyword(keyword), url, blog_title or '')
+        return blog_title
+    
+    async def get_top_n_blog_info_async(self, keyword: str, n: int = 3, resolve_titles: bool = True) -> list:
+        """
+        get_top_n_blog_info의 asyncio 버전입니다.
+        
+        Args:
+            keyword: 검색할 키워드
+            n: 가져올 블로그 글 개수 (기본값: 3)
+            resolve_titles: get_top_n_blog_info와 동일
+            
+        Returns:
+            [{'title': str, 'url': str}, ...] 형태의 리스트
+        """
+        key = normalize_keyword(keyword)
+        serp_cache = get_serp_cache()
+        if serp_cache.in_memory(key):
+            entry = serp_cache.get(key)
+        else:
+            # 디스크 읽기와 JSON 디코딩은 이벤트 루프 밖에서 (한 번 읽으면 메모리에 올라감)
+            entry = await asyncio.get_event_loop().run_in_executor(None, serp_cache.get, key)
+        
+        if entry is not None:
+            if serp_cache.is_fresh(entry):
+                serp_cache.record('hits')
+            else:
+                serp_cache.record('stale_hits')
+                self._start_serp_refresh_async(keyword, key)
+            print(f"[DEBUG] 검색 결과 캐시 사용: '{keyword}' (n={n})")
+        else:
+            serp_cache.record('misses')
+            entry, shared = await get_async_single_flight().do(
+                ('serp', key), self._refresh_serp_entry_async, keyword, key
+            )
+            if shared:
+                print(f"[DEBUG] 진행 중인 동일 검색 결과를 공유합니다: '{keyword}' (n={n})")
+            if entry is None:
+                return []
+        
+        return await self._select_top_n_async(key, entry, n, resolve_titles)
+    
+    async def _fetch_serp_candidates_async(self, keyword: str) -> list:
+        """_fetch_serp_candidates의 asyncio 버전입니다."""
+        response = await self._fetcher_get(
+            self.base_url,
+            headers=self.headers,
+            params=self._build_search_params(keyword)
+        )
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        
+        html_text = response.text
+        
+        if 'blog.naver.com' not in html_text.lower():
+            print("[ERROR] HTML 소스에 blog.naver.com이 없습니다.")
             return []
+        
+        # SERP 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._serp_candidates_from_html, html_text)
+    
+    async def _refresh_serp_entry_async(self, keyword: str, key: str) -> Optional[dict]:
+        """_refresh_serp_entry의 asyncio 버전입니다."""
+        try:
+            candidates = await self._fetch_serp_candidates_async(keyword)
+        except Exception as e:
+            print(f"오류 발생: {e}")
+            return None
+        if not candidates:
+            return None
+        loop = asyncio.get_event_loop()
+        entry = await loop.run_in_executor(None, get_serp_cache().put, key, candidates)
+        return entry or {'keyword': key, 'candidates': candidates, 'fetched_at': time.time()}
+    
+    def _start_serp_refresh_async(self, keyword: str, key: str):
+        """
+        TTL이 지난 검색 결과를 백그라운드 태스크로 새로 고칩니다.
+        요청이 끝나면 self는 풀에 반납되므로 태스크는 풀에서 크롤러를 따로 빌려 사용합니다.
+        """
+        # session_pool이 이 모듈을 import하므로 순환 import를 피해 함수 안에서 import
+        from .session_pool import get_crawler_pool
+        
+        serp_cache = get_serp_cache()
+        if not serp_cache.begin_refresh(key):
+            return
+        
+        async def refresh():
+            entry = None
+            try:
+                async with get_crawler_pool().crawler_async() as crawler:
+                    entry = await crawler._refresh_serp_entry_async(keyword, key)
+            finally:
+                serp_cache.end_refresh(key, entry is not None)
+        
+        task = asyncio.ensure_future(refresh())
+        # 태스크가 끝나기 전에 가비지 컬렉션되지 않도록 참조 유지
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    
+    async def _select_top_n_async(self, key: str, entry: dict, n: int, resolve_titles: bool = True) -> list:
+        """_select_top_n의 asyncio 버전입니다 (제목은 이벤트 루프에서 동시에 조회)."""
+        candidates = [dict(candidate) for candidate in entry['candidates']]
+        resolved = False
+        
+        while True:
+            chosen = self._choose_candidates(candidates, n)
+            pending = [candidate for candidate in chosen if candidate['title'] is None]
+            if not resolve_titles or not pending:
+                break
+            
+            # 방법 8: 블로그 페이지에서 직접 제목 추출 (여러 글을 동시에 조회)
+            semaphore = asyncio.Semaphore(TITLE_RESOLVE_CONCURRENCY)
+            
+            async def resolve(url):
+                async with semaphore:
+                    return await self._resolve_title_async(url)
+            
+            titles = await asyncio.gather(*(resolve(candidate['url']) for candidate in pending))
+            for candidate, blog_title in zip(pending, titles):
+                candidate['title'] = blog_title or ''
+            resolved = True
+        
+        if resolved:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: get_serp_cache().put(key, candidates, fetched_at=entry['fetched_at']))
+        return [self._blog_info(candidate) for candidate in chosen]
+    
+    async def _resolve_title_async(self, url: str) -> Optional[str]:
+        """_resolve_title의 asyncio 버전입니다."""
+        try:
+            page = await self._fetch_blog_page_async(url)
+            if page:
+                # soup 생성과 제목 탐색은 실행기(스레드)에서 처리
+                loop = asyncio.get_event_loop()
+                blog_title = await loop.run_in_executor(None, lambda: self._extract_title_from_page(page['soup']))
+                if self._is_valid_title(blog_title):
+                    return blog_title
+        except Exception as e:
+            print(f"[DEBUG] 블로그 페이지에서 제목 추출 시도 중 오류: {e}")
+        return None
+    
+    async def resolve_title_async(self, url: str, keyword: Optional[str] = None) -> Optional[str]:
+        """resolve_title의 asyncio 버전입니다."""
+        blog_title = await self._resolve_title_async(url)
+        if keyword:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None, get_serp_cache().set_title, normalize_keyword(keyword), url, blog_title or ''
+            )
+        return blog_title
     
     def get_top_1_blog_info(self, keyword: str) -> dict:
         """
@@ -443,10 +1494,7 @@ class NaverCrawler:
                 'ie': 'utf8'
             }
             
-            # 요청 전 지연 (차단 방지)
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(
+            response = self._session_get(
                 self.base_url, 
                 params=params, 
                 timeout=15
@@ -811,6 +1859,7 @@ class NaverCrawler:
         se-module-oglink 내의 링크는 [링크 삽입]을 넣습니다.
         se-module-sticker 내의 이미지는 [이모티콘 삽입]을 넣습니다.
         각 마커는 인덱스 번호가 붙습니다 (예: [이미지 삽입1], [링크 삽입2]).
+        기본으로 파싱된 트리를 한 번만 순회하는 media_markers를 사용하고, 실패하면 기존 방식으로 처리합니다.
         
         Args:
             element: BeautifulSoup 요소
@@ -819,6 +1868,20 @@ class NaverCrawler:
             (텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플
             이미지/링크 마커가 포함된 텍스트와 마커 순서대로 정렬된 URL 리스트
         """
+        if MARKER_EXTRACTOR != 'legacy' and element is not None:
+            try:
+                return extract_text_with_media_markers(element)
+            except Exception as e:
+                print(f"[WARN] 마커 추출 오류, 기존 방식으로 다시 처리합니다: {e}")
+        return self._extract_text_with_media_markers_legacy(element)
+    
+    def _extract_text_with_media_markers_legacy(self, element) -> tuple:
+        """
+        _extract_text_with_media_markers의 기존 구현입니다 (요소를 다시 파싱하고 모듈 종류별로 교체).
+        
+        Returns:
+            (텍스트, 이미지 URL 리스트, 링크 URL 리스트) 튜플
+        """
         if element is None:
             return ('', [], [])
         
@@ -1027,36 +2090,236 @@ class NaverCrawler:
                 'link_urls': List[str]
             } 형태의 딕셔너리 (없으면 None)
         """
+        result, shared = get_single_flight().do(('body', normalize_post_url(url)), self._extract_blog_body_with_media, url)
+        return self._copy_media_result(result) if shared else result
+    
+    @staticmethod
+    def _copy_media_result(result: Optional[dict]) -> Optional[dict]:
+        """공유받은 본문 추출 결과를 호출자별로 복사합니다 (리스트 변경이 서로 영향을 주지 않도록)."""
+        if not result:
+            return result
+        return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+    
+    def _extract_blog_body_with_media(self, url: str) -> Optional[dict]:
+        """extract_blog_body_with_media 내부 구현 (페이지 수집 + 본문 추출)"""
         try:
             page = self._fetch_blog_page(url)
             if not page:
                 print("[ERROR] 블로그 페이지를 가져올 수 없습니다.")
                 return None
             
-            soup = page['soup']
-            html_text = page['html']  # 원본 HTML 텍스트도 가져오기
+            return self._extract_body_from_page(page)
+                
+        except Exception as e:
+            print(f"[ERROR] 본문 텍스트 추출 실패 ({url}): {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    async def extract_blog_body_with_media_async(self, url: str) -> Optional[dict]:
+        """
+        extract_blog_body_with_media의 asyncio 버전입니다.
+        페이지 수집은 이벤트 루프에서, 본문 파싱은 실행기(스레드)에서 처리합니다.
+        
+        Args:
+            url: 블로그 글 URL
+            
+        Returns:
+            extract_blog_body_with_media와 동일한 딕셔너리 (없으면 None)
+        """
+        result, shared = await get_async_single_flight().do(
+            ('body', normalize_post_url(url)), self._extract_blog_body_with_media_async, url
+        )
+        return self._copy_media_result(result) if shared else result
+    
+    async def _extract_blog_body_with_media_async(self, url: str) -> Optional[dict]:
+        """_extract_blog_body_with_media의 asyncio 버전입니다."""
+        try:
+            page = await self._fetch_blog_page_async(url)
+            if not page:
+                print("[ERROR] 블로그 페이지를 가져올 수 없습니다.")
+                return None
+            
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._extract_body_from_page, page)
+                
+        except Exception as e:
+            print(f"[ERROR] 본문 텍스트 추출 실패 ({url}): {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    def _extract_media_text(self, backend: HtmlBackend, element) -> tuple:
+        """
+        백엔드 요소에서 마커와 함께 텍스트를 추출합니다 (bs4 요소는 기존 방식 선택 설정을 따름).
+        
+        Returns:
+            (텍스트, 이미지 URL 리스트, 링크 URL 리스트, 블록 리스트) 튜플
+            (블록을 만들지 않는 설정이거나 기존 방식으로 추출했으면 블록 리스트는 None)
+        """
+        if isinstance(backend, SoupBackend):
+            if BODY_BLOCKS and MARKER_EXTRACTOR != 'legacy' and element is not None:
+                try:
+                    return extract_media_blocks(element)
+                except Exception as e:
+                    print(f"[WARN] 블록 추출 오류, 텍스트만 다시 추출합니다: {e}")
+            return (*self._extract_text_with_media_markers(element), None)
+        if BODY_BLOCKS:
+            return backend.extract_media_blocks(element)
+        return (*backend.extract_text_with_media_markers(element), None)
+    
+    def _extract_body_first_candidate(self, backend: HtmlBackend, root) -> Optional[tuple]:
+        """
+        본문 추출 방법 3의 기존 방식: 선택자 순서대로 후보 div를 하나씩 추출해 보고
+        텍스트가 20자를 넘는 첫 후보를 사용합니다.
+        
+        Returns:
+            _extract_media_text와 같은 튜플 (없으면 None)
+        """
+        body_selectors = [
+            ('id에 post 포함', 'id', 'post'),
+            ('class에 post 포함', 'class', 'post'),
+            ('class에 content 포함', 'class', 'content'),
+            ('class에 article 포함', 'class', 'article'),
+        ]
+        
+        for selector_name, attr, substring in body_selectors:
+            elements = backend.find_all(root, attr, substring, tag='div', lower=True)
+            if elements:
+                print(f"[수집] 방법 3: {selector_name} 요소 발견 ({len(elements)}개)")
+                for idx, elem in enumerate(elements, 1):
+                    _, element_id, class_str = backend.describe(elem)
+                    
+                    # 마커와 함께 이미지/링크 URL 수집
+                    extracted = self._extract_media_text(backend, elem)
+                    text, extracted_images, extracted_links, _ = extracted
+                    if text and len(text.strip()) > 20:  # 최소 길이 체크
+                        print(f"[수집] ✓ 방법 3 성공 - {selector_name}, 요소#{idx}: <div> 태그, ID='{element_id}', 클래스='{class_str}', 텍스트 길이={len(text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
+                        return extracted
+        return None
+    
+    def _extract_body_scored_candidate(self, backend: HtmlBackend, root) -> Optional[tuple]:
+        """
+        본문 추출 방법 3: 문서를 한 번 순회해 후보 div마다 텍스트 길이, 링크 비율, 이미지 수로 점수를 매기고
+        가장 본문다운 후보 하나만 추출합니다 (중첩된 후보를 반복 추출하지 않음).
+        추출 결과가 20자 이하이면 다음 순위 후보를 사용합니다.
+        
+        Returns:
+            _extract_media_text와 같은 튜플 (없으면 None)
+        """
+        candidates = backend.measure_body_candidates(root)
+        ranked = rank_body_candidates(candidates)
+        if not ranked:
+            return None
+        print(f"[수집] 방법 3: 본문 후보 div {len(candidates)}개 중 {len(ranked)}개 점수 계산")
+        
+        for idx, candidate in enumerate(ranked, 1):
+            _, element_id, class_str = backend.describe(candidate.element)
+            
+            # 마커와 함께 이미지/링크 URL 수집
+            extracted = self._extract_media_text(backend, candidate.element)
+            text, extracted_images, extracted_links, _ = extracted
+            if text and len(text.strip()) > 20:  # 최소 길이 체크
+                print(f"[수집] ✓ 방법 3 성공 - 점수 {idx}순위 후보: <div> 태그, ID='{element_id}', 클래스='{class_str}', 점수={candidate.score:.0f}, 링크 비율={candidate.link_density:.2f}, 텍스트 길이={len(text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
+                return extracted
+        return None
+    
+    def _extraction_signature(self, backend: HtmlBackend) -> str:
+        """페이지 캐시에 저장한 본문 추출 결과를 재사용할 수 있는 추출 설정"""
+        return f"{EXTRACTION_FORMAT}:{backend.name}:{MARKER_EXTRACTOR}:{BODY_SELECTION}:{int(BODY_BLOCKS)}"
+    
+    def _extract_body_from_page(self, page: dict, backend: Optional[HtmlBackend] = None) -> Optional[dict]:
+        """
+        수집된 페이지(_fetch_blog_page 결과)에서 본문 텍스트와 미디어 URL을 추출합니다.
+        페이지 캐시에 같은 설정으로 추출한 결과가 저장되어 있으면 파싱하지 않고 그대로 사용하며,
+        캐시된 글을 새로 추출하면 결과를 캐시 항목에 함께 저장합니다.
+        파싱 프로세스 풀(CRAWLER_PARSE_WORKERS)을 설정하면 파싱/추출은 워커 프로세스에서 실행합니다.
+        
+        Args:
+            page: {'html', 'soup', 'final_url', 'source'} 딕셔너리 (캐시된 글은 'post_key', 'extracted' 포함)
+            backend: 사용할 HTML 파서 백엔드 (None이면 CRAWLER_HTML_BACKEND 설정값)
+            
+        Returns:
+            extract_blog_body_with_media와 동일한 딕셔너리 (없으면 None)
+        """
+        backend = backend or get_html_backend()
+        signature = self._extraction_signature(backend)
+        post_key = page.get('post_key')
+        page_cache = get_page_cache()
+        
+        extracted = page.get('extracted')
+        if extracted and extracted.get('signature') == signature and extracted.get('result'):
+            page_cache.record('extract_hits')
+            print(f"[수집] 페이지 캐시에 저장된 본문 추출 결과 사용: {len(extracted['result']['body_text'])}자")
+            return self._copy_media_result(extracted['result'])
+        
+        handled, result = get_parse_pool().extract(page, backend.name)
+        if not handled:
+            result = self._extract_body_from_document(page, backend)
+        if result and post_key:
+            page_cache.set_extracted(post_key, page['html'], {'signature': signature, 'result': result})
+        return result
+    
+    @staticmethod
+    def _line_filter(marker_pattern) -> Callable[[str], Optional[str]]:
+        """
+        본문 줄 중복 제거 함수를 만듭니다 (줄을 순서대로 넣으면 남길 줄, 제거할 줄이면 None을 반환).
+        [이미지 삽입N], [링크 삽입N], [이모티콘 삽입N] 마커는 중복 제거에서 제외하고,
+        빈 줄은 연속되지 않도록 합니다.
+        """
+        seen_lines = set()
+        previous = ['']  # 마지막으로 남긴 줄
+        
+        def keep(line: str) -> Optional[str]:
+            line_stripped = line.strip()
+            if line_stripped:
+                if marker_pattern.match(line_stripped):
+                    kept = line_stripped
+                else:
+                    # 정규화하여 비교 (공백 정리, 소문자 변환)
+                    normalized = re.sub(r'\s+', ' ', line_stripped.lower())
+                    if not normalized or normalized in seen_lines:
+                        return None
+                    seen_lines.add(normalized)
+                    kept = line
+            elif previous[0].strip():  # 빈 줄은 연속되지 않도록
+                kept = ''
+            else:
+                return None
+            previous[0] = kept
+            return kept
+        
+        return keep
+    
+    def _extract_body_from_document(self, page: dict, backend: HtmlBackend) -> Optional[dict]:
+        """_extract_body_from_page의 파싱 + 본문 추출 단계"""
+        try:
+            root = backend.document(page)
+            if root is None:
+                print("[수집] ✗ 모든 방법 실패: HTML을 파싱할 수 없습니다.")
+                return None
             body_text_parts = []
+            # 본문 파트별 블록 리스트 (블록을 만들지 않았으면 None)
+            body_block_parts = []
             
             # 마커 순서대로 수집된 이미지와 링크 URL 리스트
             image_urls = []
             link_urls = []
             
             # 방법 1: se-main-container 클래스를 가진 요소에서 텍스트 추출
-            containers = soup.find_all(class_=lambda x: x and 'se-main-container' in str(x))
+            containers = backend.find_all(root, 'class', 'se-main-container')
             if containers:
                 print(f"[수집] 방법 1: se-main-container 클래스 요소 발견 ({len(containers)}개)")
                 for idx, container in enumerate(containers, 1):
                     # 요소 정보 수집
-                    tag_name = container.name
-                    element_id = container.get('id', '없음')
-                    element_classes = container.get('class', [])
-                    class_str = ' '.join(element_classes) if element_classes else '없음'
+                    tag_name, element_id, class_str = backend.describe(container)
                     
                     # 마커와 함께 이미지/링크 URL 수집
-                    text, extracted_images, extracted_links = self._extract_text_with_media_markers(container)
+                    text, extracted_images, extracted_links, extracted_blocks = self._extract_media_text(backend, container)
                     if text and len(text.strip()) > 0:
                         print(f"[수집] ✓ 방법 1 성공 - 요소#{idx}: <{tag_name}> 태그, ID='{element_id}', 클래스='{class_str}', 텍스트 길이={len(text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
                         body_text_parts.append(text)
+                        body_block_parts.append(extracted_blocks)
                         # 마커 순서대로 URL 추가
                         image_urls.extend(extracted_images)
                         link_urls.extend(extracted_links)
@@ -1065,19 +2328,18 @@ class NaverCrawler:
             
             # 방법 2: post-view{글ID} div에서 텍스트 추출
             if not body_text_parts:
-                post_view_divs = soup.find_all('div', id=lambda x: x and 'post-view' in str(x).lower())
+                post_view_divs = backend.find_all(root, 'id', 'post-view', tag='div', lower=True)
                 if post_view_divs:
                     print(f"[수집] 방법 2: post-view div 요소 발견 ({len(post_view_divs)}개)")
                     for idx, div in enumerate(post_view_divs, 1):
-                        element_id = div.get('id', '없음')
-                        element_classes = div.get('class', [])
-                        class_str = ' '.join(element_classes) if element_classes else '없음'
+                        _, element_id, class_str = backend.describe(div)
                         
                         # 마커와 함께 이미지/링크 URL 수집
-                        text, extracted_images, extracted_links = self._extract_text_with_media_markers(div)
+                        text, extracted_images, extracted_links, extracted_blocks = self._extract_media_text(backend, div)
                         if text and len(text.strip()) > 0:
                             print(f"[수집] ✓ 방법 2 성공 - 요소#{idx}: <div> 태그, ID='{element_id}', 클래스='{class_str}', 텍스트 길이={len(text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
                             body_text_parts.append(text)
+                            body_block_parts.append(extracted_blocks)
                             # 마커 순서대로 URL 추가
                             image_urls.extend(extracted_images)
                             link_urls.extend(extracted_links)
@@ -1086,55 +2348,42 @@ class NaverCrawler:
             
             # 방법 3: 본문 영역으로 보이는 div 찾기 (class나 id 패턴) - fallback
             if not body_text_parts:
-                body_selectors = [
-                    ('id에 post 포함', {'id': lambda x: x and 'post' in str(x).lower()}),
-                    ('class에 post 포함', {'class': lambda x: x and 'post' in str(x).lower()}),
-                    ('class에 content 포함', {'class': lambda x: x and 'content' in str(x).lower()}),
-                    ('class에 article 포함', {'class': lambda x: x and 'article' in str(x).lower()}),
-                ]
-                
-                for selector_name, selector in body_selectors:
-                    elements = soup.find_all('div', **selector)
-                    if elements:
-                        print(f"[수집] 방법 3: {selector_name} 요소 발견 ({len(elements)}개)")
-                        for idx, elem in enumerate(elements, 1):
-                            element_id = elem.get('id', '없음')
-                            element_classes = elem.get('class', [])
-                            class_str = ' '.join(element_classes) if element_classes else '없음'
-                            
-                            # 마커와 함께 이미지/링크 URL 수집
-                            text, extracted_images, extracted_links = self._extract_text_with_media_markers(elem)
-                            if text and len(text.strip()) > 20:  # 최소 길이 체크
-                                print(f"[수집] ✓ 방법 3 성공 - {selector_name}, 요소#{idx}: <div> 태그, ID='{element_id}', 클래스='{class_str}', 텍스트 길이={len(text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
-                                body_text_parts.append(text)
-                                # 마커 순서대로 URL 추가
-                                image_urls.extend(extracted_images)
-                                link_urls.extend(extracted_links)
-                                break
-                        if body_text_parts:
-                            break
+                if BODY_SELECTION == 'first':
+                    extracted = self._extract_body_first_candidate(backend, root)
+                else:
+                    extracted = self._extract_body_scored_candidate(backend, root)
+                if extracted:
+                    text, extracted_images, extracted_links, extracted_blocks = extracted
+                    body_text_parts.append(text)
+                    body_block_parts.append(extracted_blocks)
+                    # 마커 순서대로 URL 추가
+                    image_urls.extend(extracted_images)
+                    link_urls.extend(extracted_links)
             
             # 방법 4: 전체 body에서 스크립트, 스타일, nav 등 제거하고 본문 추출
             if not body_text_parts:
                 print(f"[수집] 방법 4: body 태그에서 본문 추출 시도")
                 # 스크립트, 스타일, 메타 태그 등 제거
-                for script in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                    script.decompose()
+                backend.remove_tags(root, ['script', 'style', 'nav', 'header', 'footer', 'aside'])
                 
-                body = soup.find('body')
-                if body:
-                    body_id = body.get('id', '없음')
-                    body_classes = body.get('class', [])
-                    class_str = ' '.join(body_classes) if body_classes else '없음'
+                body = backend.body(root)
+                if body is not None:
+                    _, body_id, class_str = backend.describe(body)
                     
                     # 마커와 함께 이미지/링크 URL 수집
-                    text, extracted_images, extracted_links = self._extract_text_with_media_markers(body)
+                    text, extracted_images, extracted_links, extracted_blocks = self._extract_media_text(backend, body)
                     # 너무 짧은 라인 제거
-                    lines = [line.strip() for line in text.split('\n') if line.strip() and len(line.strip()) > 5]
+                    def keep_long_line(line: str) -> Optional[str]:
+                        line = line.strip()
+                        return line if line and len(line) > 5 else None
+                    lines = [line for line in map(keep_long_line, text.split('\n')) if line is not None]
                     if lines:
                         final_text = '\n'.join(lines)
                         print(f"[수집] ✓ 방법 4 성공 - <body> 태그, ID='{body_id}', 클래스='{class_str}', 텍스트 길이={len(final_text)}자, 이미지 {len(extracted_images)}개, 링크 {len(extracted_links)}개")
                         body_text_parts.append(final_text)
+                        body_block_parts.append(
+                            map_block_lines(extracted_blocks, keep_long_line) if extracted_blocks is not None else None
+                        )
                         # 마커 순서대로 URL 추가
                         image_urls.extend(extracted_images)
                         link_urls.extend(extracted_links)
@@ -1145,29 +2394,17 @@ class NaverCrawler:
             
             if body_text_parts:
                 print(f"[수집] 최종: {len(body_text_parts)}개의 본문 파트 수집 완료, 중복 제거 및 정리 중...")
-                # 중복 제거: 줄 단위로 중복 제거
-                all_lines = []
-                seen_lines = set()
-                
                 # 마커 패턴 정의 (인덱스 포함)
                 marker_pattern = re.compile(r'^\[(이미지 삽입|링크 삽입|이모티콘 삽입)\d+\]$')
                 
+                # 중복 제거: 줄 단위로 중복 제거
+                keep_line = self._line_filter(marker_pattern)
+                all_lines = []
                 for part in body_text_parts:
-                    lines = part.split('\n')
-                    for line in lines:
-                        line_stripped = line.strip()
-                        if line_stripped:
-                            # [이미지 삽입N], [링크 삽입N], [이모티콘 삽입N] 마커는 중복 제거에서 제외
-                            if marker_pattern.match(line_stripped):
-                                all_lines.append(line_stripped)
-                            else:
-                                # 정규화하여 비교 (공백 정리, 소문자 변환)
-                                normalized = re.sub(r'\s+', ' ', line_stripped.lower())
-                                if normalized and normalized not in seen_lines:
-                                    all_lines.append(line)
-                                    seen_lines.add(normalized)
-                        elif all_lines and all_lines[-1].strip():  # 빈 줄은 연속되지 않도록
-                            all_lines.append('')
+                    for line in part.split('\n'):
+                        kept = keep_line(line)
+                        if kept is not None:
+                            all_lines.append(kept)
                 
                 # 최종 텍스트 생성
                 final_text = '\n'.join(all_lines)
@@ -1177,17 +2414,24 @@ class NaverCrawler:
                 print(f"[수집] ✓ 최종 본문 텍스트 생성 완료: {final_length}자")
                 print(f"[수집] ✓ 이미지 URL {len(image_urls)}개, 링크 URL {len(link_urls)}개 수집 완료")
                 
-                return {
+                result = {
                     'body_text': final_text.strip(),
                     'image_urls': image_urls,
                     'link_urls': link_urls
                 }
+                if body_block_parts and all(blocks is not None for blocks in body_block_parts):
+                    # 블록에도 같은 중복 제거 적용
+                    keep_block_line = self._line_filter(marker_pattern)
+                    result['blocks'] = [
+                        block for blocks in body_block_parts for block in map_block_lines(blocks, keep_block_line)
+                    ]
+                return result
             else:
                 print("[수집] ✗ 모든 방법 실패: 본문 텍스트를 찾을 수 없습니다.")
                 return None
                 
         except Exception as e:
-            print(f"[ERROR] 본문 텍스트 추출 실패 ({url}): {e}")
+            print(f"[ERROR] 본문 텍스트 추출 실패 ({page.get('final_url')}): {e}")
             import traceback
             traceback.print_exc()
             return None
@@ -1206,13 +2450,32 @@ class NaverCrawler:
         Returns:
             저장된 파일 경로 (실패하면 None)
         """
-        try:
-            # 본문 텍스트 추출
-            body_text = self.extract_blog_body_text(url)
-            if not body_text:
-                print("[ERROR] 본문 텍스트를 추출할 수 없습니다.")
-                return None
+        # 본문 텍스트 추출
+        body_text = self.extract_blog_body_text(url)
+        if not body_text:
+            print("[ERROR] 본문 텍스트를 추출할 수 없습니다.")
+            return None
+        
+        return self.write_blog_txt(url, body_text, output_path=output_path, title=title,
+                                   prefix=prefix, output_dir=output_dir)
+    
+    def write_blog_txt(self, url: str, body_text: str, output_path: str = None, title: str = None,
+                       prefix: str = None, output_dir: str = None) -> Optional[str]:
+        """
+        이미 추출한 본문 텍스트를 txt 파일로 저장합니다 (페이지를 다시 요청하지 않음).
+        
+        Args:
+            url: 블로그 글 URL (파일명 생성 및 헤더에 사용)
+            body_text: 저장할 본문 텍스트
+            output_path: 저장할 파일 경로 (None이면 자동 생성)
+            title: 파일 제목에 포함할 제목 (선택사항)
+            prefix: 파일명 접두사 (사용 안 함, 하위 호환성 유지)
+            output_dir: 저장할 디렉토리 경로 (None이면 현재 디렉토리)
             
+        Returns:
+            저장된 파일 경로 (실패하면 None)
+        """
+        try:
             # 출력 경로 생성
             if not output_path:
                 # URL에서 파일명 생성
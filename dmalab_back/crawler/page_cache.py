@@ -0,0 +1,224 @@
+"""
+블로그 글 페이지 디스크 캐시 모듈
+blogId/logNo 단위로 본문 HTML과 응답 검증자(ETag/Last-Modified)를 data/ 아래에 저장하여,
+같은 상위 노출 글을 반복 수집할 때 네트워크 요청을 줄입니다.
+HTML에서 추출한 본문 결과(텍스트, URL, 블록 리스트)도 같은 항목에 저장하여 다시 파싱하지 않습니다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 캐시 설정 (환경 변수로 조정 가능)
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "1") not in ("0", "false", "False")
+PAGE_CACHE_TTL = float(os.getenv("PAGE_CACHE_TTL", "21600"))  # 초 (기본 6시간)
+
+# 통계 항목
+# - hits: TTL 안의 캐시를 그대로 사용
+# - misses: 캐시 없음 (새로 수집)
+# - revalidated: TTL 만료 후 조건부 요청에 304를 받아 캐시 재사용
+# - refreshed: TTL 만료 후 조건부 요청에 새 본문을 받아 캐시 갱신
+# - revalidate_failed: 조건부 요청 실패로 처음부터 다시 수집
+# - extract_hits: 저장된 본문 추출 결과를 사용 (파싱 생략)
+# - extract_stores: 본문 추출 결과 저장
+_STAT_KEYS = ('hits', 'misses', 'revalidated', 'refreshed', 'revalidate_failed', 'stores',
+              'extract_hits', 'extract_stores')
+
+
+class PageCache:
+    """blogId/logNo를 키로 하는 블로그 글 페이지 디스크 캐시"""
+
+    def __init__(self, root: Path, ttl: float = PAGE_CACHE_TTL, enabled: bool = PAGE_CACHE_ENABLED):
+        """
+        Args:
+            root: 캐시 파일을 저장할 디렉토리
+            ttl: 캐시를 재검증 없이 사용할 수 있는 시간 (초)
+            enabled: False면 조회/저장을 하지 않음
+        """
+        self.root = Path(root)
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {key: 0 for key in _STAT_KEYS}
+
+    def _entry_path(self, post_key: Tuple[str, str]) -> Path:
+        """캐시 파일 경로를 반환합니다 ({root}/{blogId}/{logNo}.json)."""
+        blog_id, log_no = post_key
+        safe_blog_id = "".join(c for c in blog_id if c.isalnum() or c in "-_") or "_"
+        return self.root / safe_blog_id / f"{log_no}.json"
+
+    def get(self, post_key: Tuple[str, str], full_body: bool = False) -> Optional[dict]:
+        """
+        캐시 항목을 반환합니다 (만료 여부와 관계없이).
+
+        Args:
+            post_key: (blogId, logNo) 튜플
+            full_body: True면 응답을 끝까지 받은 항목만 반환 (스트리밍 수집이 본문 뒤에서 멈춘 항목은 None)
+
+        Returns:
+            {'html', 'source', 'final_url', 'etag', 'last_modified', 'fetched_at', 'partial'} 딕셔너리 (없으면 None)
+            (본문 추출 결과를 저장했으면 'extracted' 포함)
+        """
+        if not self.enabled:
+            return None
+        path = self._entry_path(post_key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception as e:
+            print(f"[WARN] 페이지 캐시 로드 실패 ({path.name}): {e}")
+            return None
+        if not entry.get('html'):
+            return None
+        if full_body and entry.get('partial'):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """캐시 항목이 TTL 안에 있는지 확인합니다."""
+        return (time.time() - entry.get('fetched_at', 0)) < self.ttl
+
+    def put(self, post_key: Tuple[str, str], html: str, source: str, final_url: str,
+            etag: Optional[str] = None, last_modified: Optional[str] = None,
+            partial: bool = False) -> Optional[dict]:
+        """
+        수집한 페이지를 캐시에 저장합니다.
+
+        Args:
+            post_key: (blogId, logNo) 튜플
+            html: 본문이 들어 있는 페이지 HTML
+            source: 본문을 가져온 페이지 종류 ('main', 'iframe', 'mobile')
+            final_url: 최종 요청 URL (재검증 요청에 사용)
+            etag: 응답 ETag 헤더
+            last_modified: 응답 Last-Modified 헤더
+            partial: 스트리밍 수집이 본문 뒤에서 멈춰 html이 페이지 앞부분만 담고 있는지 여부
+
+        Returns:
+            저장한 캐시 항목 (비활성화 상태면 None)
+        """
+        if not self.enabled:
+            return None
+        entry = {
+            'html': html,
+            'source': source,
+            'final_url': final_url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'partial': partial,
+            'fetched_at': time.time(),
+        }
+        self._write(post_key, entry)
+        self.record('stores')
+        return entry
+
+    def touch(self, post_key: Tuple[str, str], entry: dict,
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> dict:
+        """
+        304 응답을 받은 캐시 항목의 수집 시각(과 검증자)을 갱신합니다.
+
+        Returns:
+            갱신된 캐시 항목
+        """
+        entry = dict(entry)
+        entry['fetched_at'] = time.time()
+        if etag:
+            entry['etag'] = etag
+        if last_modified:
+            entry['last_modified'] = last_modified
+        if self.enabled:
+            self._write(post_key, entry)
+        return entry
+
+    def set_extracted(self, post_key: Tuple[str, str], html: str, extracted: dict) -> bool:
+        """
+        캐시 항목에 본문 추출 결과를 저장합니다.
+        그 사이 다른 HTML로 갱신된 항목에는 저장하지 않습니다 (put은 추출 결과 없이 새로 저장하고, touch는 유지).
+
+        Args:
+            post_key: (blogId, logNo) 튜플
+            html: 추출에 사용한 페이지 HTML
+            extracted: {'signature': 추출 설정, 'result': extract_blog_body_with_media 결과}
+
+        Returns:
+            저장 여부
+        """
+        entry = self.get(post_key)
+        if not entry or entry['html'] != html:
+            return False
+        entry['extracted'] = extracted
+        self._write(post_key, entry)
+        self.record('extract_stores')
+        return True
+
+    def _write(self, post_key: Tuple[str, str], entry: dict):
+        """캐시 파일을 원자적으로 기록합니다 (임시 파일 작성 후 교체)."""
+        path = self._entry_path(post_key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] 페이지 캐시 저장 실패 ({path.name}): {e}")
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """재검증 요청에 사용할 If-None-Match/If-Modified-Since 헤더를 생성합니다."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record(self, stat: str):
+        """통계 카운터를 1 증가시킵니다."""
+        with self._lock:
+            if stat in self._stats:
+                self._stats[stat] += 1
+
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            카운터, 조회 수, 네트워크 없이 처리한 비율(hit_ratio), TTL 등을 담은 딕셔너리
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses'] + stats['revalidated'] + stats['refreshed'] + stats['revalidate_failed']
+        stats['lookups'] = lookups
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['reuse_ratio'] = round((stats['hits'] + stats['revalidated']) / lookups, 4) if lookups else 0.0
+        stats['ttl_seconds'] = self.ttl
+        stats['enabled'] = self.enabled
+        return stats
+
+    def reset_stats(self):
+        """통계 카운터를 초기화합니다."""
+        with self._lock:
+            self._stats = {key: 0 for key in _STAT_KEYS}
+
+
+# 공유 인스턴스 (지연 초기화)
+_page_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> PageCache:
+    """
+    프로세스 공유 PageCache를 반환합니다 (data/page_cache에 저장).
+
+    Returns:
+        PageCache 인스턴스
+    """
+    global _page_cache
+    if _page_cache is None:
+        data_dir = Path(__file__).parent.parent / "data" / "page_cache"
+        _page_cache = PageCache(data_dir)
+    return _page_cache
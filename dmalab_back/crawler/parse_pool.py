@@ -0,0 +1,168 @@
+"""
+본문 파싱 프로세스 풀 모듈
+HTML 파싱과 본문 추출은 CPU 작업이라 GIL을 잡고 있으므로, 스레드 풀(process_blogs, cli)에서 여러 글을 동시에 처리해도
+파싱은 한 번에 하나씩 실행됩니다. 설정(CRAWLER_PARSE_WORKERS)하면 파싱/추출 단계를 별도 프로세스에서 실행합니다.
+HTML은 문자열을 피클로 넘기지 않고 UTF-8 바이트를 공유 메모리에 한 번 복사해 전달하며,
+워커는 NaverCrawler._extract_body_from_document 결과(작은 딕셔너리)만 돌려줍니다.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Optional
+
+# 파싱 워커 프로세스 수 (0이면 사용하지 않고 호출한 스레드에서 파싱)
+PARSE_WORKERS = int(os.getenv("CRAWLER_PARSE_WORKERS", "0"))
+# 이 크기(바이트)보다 작은 HTML은 프로세스 전달 비용이 더 크므로 호출한 스레드에서 파싱
+PARSE_POOL_MIN_BYTES = int(os.getenv("CRAWLER_PARSE_POOL_MIN_BYTES", "16384"))
+
+# 워커 프로세스마다 하나씩 만드는 크롤러 (본문 추출 메서드만 사용)
+_worker_crawler = None
+
+
+def _worker_extract(shm_name: str, size: int, meta: dict, backend_name: str) -> Optional[dict]:
+    """
+    워커 프로세스에서 공유 메모리의 HTML을 읽어 본문을 추출합니다.
+
+    Args:
+        shm_name: HTML 바이트가 들어 있는 공유 메모리 이름
+        size: HTML 바이트 길이
+        meta: 'html'과 'soup'을 제외한 페이지 딕셔너리 항목
+        backend_name: 사용할 HTML 백엔드 이름
+
+    Returns:
+        extract_blog_body_with_media와 동일한 딕셔너리 (없으면 None)
+    """
+    global _worker_crawler
+    from .html_backend import BlogPage, get_html_backend
+    from .naver_crawler import NaverCrawler
+
+    # spawn 워커는 호출한 프로세스의 resource_tracker를 함께 쓰므로 정리(unlink)는 호출한 쪽에서만 함
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        html_text = bytes(shm.buf[:size]).decode('utf-8')
+    finally:
+        shm.close()
+
+    if _worker_crawler is None:
+        _worker_crawler = NaverCrawler()
+    page = BlogPage(meta, html=html_text)
+    return _worker_crawler._extract_body_from_document(page, get_html_backend(backend_name))
+
+
+class ParsePool:
+    """본문 파싱/추출을 실행하는 프로세스 풀"""
+
+    def __init__(self, workers: int = PARSE_WORKERS, min_bytes: int = PARSE_POOL_MIN_BYTES):
+        """
+        Args:
+            workers: 워커 프로세스 수 (0 이하면 비활성화)
+            min_bytes: 프로세스로 넘길 최소 HTML 크기 (바이트)
+        """
+        self.workers = workers
+        self.min_bytes = min_bytes
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._stats = {'submitted': 0, 'inline': 0, 'failed': 0, 'restarts': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """실행기를 만듭니다 (스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor):
+        """워커가 비정상 종료되어 깨진 실행기를 버리고 다음 요청에서 새로 만듭니다."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self._stats['restarts'] += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def record(self, stat: str):
+        """통계 카운터를 1 증가시킵니다."""
+        with self._lock:
+            self._stats[stat] += 1
+
+    def extract(self, page: dict, backend_name: str) -> tuple:
+        """
+        페이지 본문을 워커 프로세스에서 추출합니다 (결과를 기다리는 동안 호출한 스레드는 GIL을 놓음).
+
+        Args:
+            page: _fetch_blog_page 결과 딕셔너리
+            backend_name: 사용할 HTML 백엔드 이름
+
+        Returns:
+            (처리 여부, 추출 결과) 튜플 - 처리 여부가 False면 호출한 스레드에서 직접 추출해야 함
+        """
+        html_text = page['html']
+        if not self.enabled or not html_text or 'soup' in page:
+            return False, None
+        data = html_text.encode('utf-8') if isinstance(html_text, str) else html_text
+        if len(data) < self.min_bytes:
+            self.record('inline')
+            return False, None
+
+        meta = {key: value for key, value in page.items() if key not in ('html', 'soup', 'extracted')}
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        executor = self._get_executor()
+        try:
+            shm.buf[:len(data)] = data
+            future = executor.submit(_worker_extract, shm.name, len(data), meta, backend_name)
+            self.record('submitted')
+            return True, future.result()
+        except BrokenProcessPool as e:
+            print(f"[WARN] 파싱 워커가 비정상 종료되었습니다. 현재 스레드에서 다시 추출합니다: {e}")
+            self.record('failed')
+            self._reset_executor(executor)
+            return False, None
+        except Exception as e:
+            print(f"[WARN] 파싱 워커 오류, 현재 스레드에서 다시 추출합니다: {e}")
+            self.record('failed')
+            return False, None
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def stats(self) -> dict:
+        """풀 설정과 처리 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['workers'] = self.workers
+        stats['min_bytes'] = self.min_bytes
+        stats['enabled'] = self.enabled
+        return stats
+
+    def close(self):
+        """워커 프로세스를 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 공유 인스턴스 (지연 초기화)
+_parse_pool: Optional[ParsePool] = None
+
+
+def get_parse_pool() -> ParsePool:
+    """
+    프로세스 공유 ParsePool을 반환합니다 (CRAWLER_PARSE_WORKERS 설정).
+
+    Returns:
+        ParsePool 인스턴스
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ParsePool()
+    return _parse_pool
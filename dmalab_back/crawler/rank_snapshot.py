@@ -0,0 +1,205 @@
+"""
+키워드별 순위 스냅샷 저장 모듈
+/api/process 실행 결과(순위별 URL과 처리 결과)를 키워드 단위로 data/ 아래에 저장하고,
+다음 실행에서 오늘 순위와 비교해 바뀌지 않은 글은 저장된 결과를 재사용할 수 있게 합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .serp_cache import normalize_keyword
+
+# 저장된 결과를 재사용할 수 있는 최대 나이 (초, 기본 7일)
+RANK_SNAPSHOT_MAX_AGE = float(os.getenv("RANK_SNAPSHOT_MAX_AGE", "604800"))
+
+# 순위 비교 결과
+STATUS_NEW = 'new'          # 지난 스냅샷에 없던 글
+STATUS_SAME = 'same'        # 같은 순위의 같은 글
+STATUS_MOVED = 'moved'      # 순위만 바뀐 글
+
+
+def content_fingerprint(media_result: Optional[dict]) -> Optional[str]:
+    """
+    본문 추출 결과(본문 텍스트, 이미지/링크 URL)의 sha1 해시를 반환합니다 (내용 변경 감지용).
+    HTML 대신 추출 결과를 해시하므로, 스트리밍 수집이 멈춘 위치나 본문 밖(댓글, 스크립트 등)이 달라도 같은 글이면 같은 값입니다.
+
+    Returns:
+        sha1 해시 (본문이 없으면 None)
+    """
+    if not media_result or not media_result.get('body_text'):
+        return None
+    content = {
+        'body_text': media_result['body_text'],
+        'image_urls': list(media_result.get('image_urls') or []),
+        'link_urls': list(media_result.get('link_urls') or []),
+    }
+    return hashlib.sha1(json.dumps(content, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class RankSnapshotStore:
+    """키워드별 마지막 처리 순위와 결과를 저장하는 클래스"""
+
+    def __init__(self, root: Path, max_age: float = RANK_SNAPSHOT_MAX_AGE):
+        """
+        Args:
+            root: 스냅샷 파일을 저장할 디렉토리
+            max_age: 저장된 결과를 재사용할 수 있는 최대 나이 (초)
+        """
+        self.root = Path(root)
+        self.max_age = max_age
+
+    def _snapshot_path(self, key: str) -> Path:
+        """스냅샷 파일 경로를 반환합니다 (키워드 해시를 파일명으로 사용)."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.root / f"{digest}.json"
+
+    def load(self, keyword: str) -> Optional[dict]:
+        """
+        키워드의 마지막 스냅샷을 반환합니다.
+
+        Returns:
+            {'keyword', 'taken_at', 'output_dir', 'settings', 'ranking': [...]} 딕셔너리 (없으면 None)
+        """
+        key = normalize_keyword(keyword)
+        path = self._snapshot_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            print(f"[WARN] 순위 스냅샷 로드 실패 ({path.name}): {e}")
+            return None
+        if snapshot.get('keyword') != key:
+            return None
+        return snapshot
+
+    def save(self, keyword: str, output_dir: str, settings: dict, ranking: List[dict]) -> dict:
+        """
+        이번 실행의 순위와 결과를 저장합니다.
+
+        Args:
+            keyword: 검색 키워드
+            output_dir: 결과 파일이 저장된 출력 디렉토리 (TOP{rank} 하위 디렉토리 포함)
+            settings: 처리 설정 (analyze, top_n, min_length, min_count)
+            ranking: 순위 순서의 [{'rank', 'url', 'title', 'fingerprint', 'processed_at', 'result'}, ...]
+
+        Returns:
+            저장한 스냅샷
+        """
+        key = normalize_keyword(keyword)
+        snapshot = {
+            'keyword': key,
+            'taken_at': time.time(),
+            'output_dir': output_dir,
+            'settings': settings,
+            'ranking': ranking,
+        }
+        path = self._snapshot_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] 순위 스냅샷 저장 실패 ({path.name}): {e}")
+        return snapshot
+
+    @staticmethod
+    def diff(snapshot: Optional[dict], urls: List[str]) -> List[dict]:
+        """
+        오늘 순위를 지난 스냅샷과 비교합니다.
+
+        Args:
+            snapshot: 지난 스냅샷 (없으면 모두 new)
+            urls: 오늘 순위 순서의 글 URL 리스트
+
+        Returns:
+            [{'rank', 'url', 'status', 'previous_rank'}, ...]
+        """
+        previous_ranks: Dict[str, int] = {}
+        if snapshot:
+            for entry in snapshot.get('ranking', []):
+                previous_ranks.setdefault(entry['url'], entry['rank'])
+
+        changes = []
+        for rank, url in enumerate(urls, 1):
+            previous_rank = previous_ranks.get(url)
+            if previous_rank is None:
+                status = STATUS_NEW
+            elif previous_rank == rank:
+                status = STATUS_SAME
+            else:
+                status = STATUS_MOVED
+            changes.append({'rank': rank, 'url': url, 'status': status, 'previous_rank': previous_rank})
+        return changes
+
+    def candidate_entry(self, snapshot: Optional[dict], url: str, settings: dict) -> Optional[dict]:
+        """
+        지난 스냅샷에서 재사용 후보가 되는 글 결과를 찾습니다 (네트워크 확인 전 로컬 조건만 검사).
+        처리 설정이 같고, 성공한 결과이며, 결과 파일이 남아 있고, 너무 오래되지 않았을 때만 후보입니다.
+
+        Returns:
+            스냅샷의 순위 항목 (후보가 아니면 None)
+        """
+        if not snapshot or snapshot.get('settings') != settings:
+            return None
+        entry = next((e for e in snapshot.get('ranking', []) if e['url'] == url), None)
+        if entry is None or not entry.get('result', {}).get('success'):
+            return None
+        if time.time() - entry.get('processed_at', 0) >= self.max_age:
+            return None
+        txt_path = entry['result'].get('txt_path')
+        if not txt_path or not os.path.exists(txt_path):
+            return None
+        return entry
+
+    def reusable_entry(self, snapshot: Optional[dict], url: str, settings: dict,
+                       fingerprint: Optional[str]) -> Optional[dict]:
+        """
+        지난 스냅샷에서 재사용할 수 있는 글 결과를 찾습니다.
+        candidate_entry 조건을 만족하고, 지금 글 내용의 해시가 그때와 같을 때만 재사용합니다.
+
+        Args:
+            snapshot: 지난 스냅샷
+            url: 글 URL
+            settings: 이번 처리 설정
+            fingerprint: 네트워크로 확인한 지금 글 본문의 해시
+                (NaverCrawler.extract_current_body_async 결과의 content_fingerprint, 확인하지 못했으면 None)
+
+        Returns:
+            스냅샷의 순위 항목 (재사용할 수 없으면 None)
+        """
+        entry = self.candidate_entry(snapshot, url, settings)
+        if entry is None:
+            return None
+        if not fingerprint or not entry.get('fingerprint'):
+            return None
+        if fingerprint != entry['fingerprint']:
+            print(f"[DEBUG] 글 내용이 바뀌어 다시 처리합니다: {url}")
+            return None
+        return entry
+
+
+# 공유 인스턴스 (지연 초기화)
+_rank_snapshot_store: Optional[RankSnapshotStore] = None
+
+
+def get_rank_snapshot_store() -> RankSnapshotStore:
+    """
+    프로세스 공유 RankSnapshotStore를 반환합니다 (data/rank_snapshots에 저장).
+
+    Returns:
+        RankSnapshotStore 인스턴스
+    """
+    global _rank_snapshot_store
+    if _rank_snapshot_store is None:
+        data_dir = Path(__file__).parent.parent / "data" / "rank_snapshots"
+        _rank_snapshot_store = RankSnapshotStore(data_dir)
+    return _rank_snapshot_store
@@ -0,0 +1,162 @@
+"""
+호스트별 요청 속도 제한 모듈
+프로세스 전체에서 공유하는 토큰 버킷으로 호스트마다 초당 요청 수와 순간 허용량(burst)을 제한합니다.
+인스턴스마다 무작위로 대기하던 방식을 대체하여, 호스트가 한가할 때는 바로 요청하고
+여러 작업이 몰릴 때만 순서대로 대기합니다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# 호스트별 기본 설정: (초당 요청 수, burst)
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    'search.naver.com': (0.5, 2),
+    'blog.naver.com': (2.0, 4),
+    'm.blog.naver.com': (2.0, 4),
+    'postfiles.pstatic.net': (8.0, 16),
+}
+
+# 목록에 없는 호스트의 기본값
+DEFAULT_RATE = float(os.getenv("CRAWLER_DEFAULT_RATE", "2"))
+DEFAULT_BURST = int(os.getenv("CRAWLER_DEFAULT_BURST", "4"))
+
+
+def _parse_host_limits(spec: str) -> Dict[str, Tuple[float, int]]:
+    """
+    CRAWLER_RATE_LIMITS 환경 변수를 파싱합니다.
+
+    형식: "blog.naver.com=2:4,search.naver.com=0.5:2" (호스트=초당요청수:burst)
+    """
+    limits = {}
+    for item in spec.split(','):
+        item = item.strip()
+        if not item or '=' not in item:
+            continue
+        host, value = item.split('=', 1)
+        try:
+            if ':' in value:
+                rate, burst = value.split(':', 1)
+                limits[host.strip().lower()] = (float(rate), int(burst))
+            else:
+                limits[host.strip().lower()] = (float(value), max(1, int(float(value))))
+        except ValueError:
+            print(f"[WARN] 잘못된 속도 제한 설정을 무시합니다: {item}")
+    return limits
+
+
+class TokenBucket:
+    """
+    예약 방식 토큰 버킷
+    토큰을 먼저 예약하고 대기할 시간을 돌려주므로, 스레드와 asyncio 양쪽에서 같은 버킷을 공유할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: 초당 보충되는 토큰 수 (초당 요청 수)
+            burst: 버킷 최대 용량 (연속으로 바로 보낼 수 있는 요청 수)
+        """
+        self.rate = max(rate, 0.001)
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약합니다.
+
+        Returns:
+            요청 전에 대기해야 하는 시간 (초, 0이면 바로 요청 가능)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # 부족한 토큰이 보충될 때까지 대기 (음수 잔량은 뒤이은 요청의 대기 시간에 누적됨)
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket을 관리하는 속도 제한기"""
+
+    def __init__(self, host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_rate: float = DEFAULT_RATE, default_burst: int = DEFAULT_BURST):
+        """
+        Args:
+            host_limits: {호스트: (초당 요청 수, burst)} (None이면 기본값 + CRAWLER_RATE_LIMITS)
+            default_rate: 목록에 없는 호스트의 초당 요청 수
+            default_burst: 목록에 없는 호스트의 burst
+        """
+        if host_limits is None:
+            host_limits = dict(DEFAULT_HOST_LIMITS)
+            host_limits.update(_parse_host_limits(os.getenv("CRAWLER_RATE_LIMITS", "")))
+        self.host_limits = host_limits
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL에서 호스트를 추출합니다."""
+        return (urlparse(url).hostname or '').lower()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """호스트의 버킷을 반환합니다 (지연 생성)."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        요청을 보내기 전에 호출합니다. 토큰이 없으면 현재 스레드를 대기시킵니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self._bucket(self.host_of(url)).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """acquire의 asyncio 버전입니다 (이벤트 루프를 막지 않음)."""
+        wait = self._bucket(self.host_of(url)).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# 공유 인스턴스 (지연 초기화)
+_rate_limiter: Optional[HostRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    프로세스 공유 HostRateLimiter를 반환합니다 (지연 초기화).
+
+    Returns:
+        HostRateLimiter 인스턴스
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = HostRateLimiter()
+    return _rate_limiter
@@ -0,0 +1,234 @@
+"""
+네이버 통합검색(SERP) 결과 디스크 캐시 모듈
+정규화한 키워드 단위로 검색 결과의 블로그 글 목록 전체(순위 순서)를 data/ 아래에 저장하여,
+/api/search → /api/process → 참조 분석처럼 같은 키워드를 연달아 검색할 때 다시 요청하지 않습니다.
+TTL이 지난 항목은 STALE_TTL 안이면 그대로 사용하면서 백그라운드에서 새로 고칩니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 캐시 설정 (환경 변수로 조정 가능)
+SERP_CACHE_ENABLED = os.getenv("SERP_CACHE_ENABLED", "1") not in ("0", "false", "False")
+SERP_CACHE_TTL = float(os.getenv("SERP_CACHE_TTL", "1800"))  # 초 (기본 30분)
+SERP_CACHE_STALE_TTL = float(os.getenv("SERP_CACHE_STALE_TTL", "86400"))  # 만료 후에도 사용할 최대 나이 (초, 기본 1일)
+
+# 통계 항목
+# - hits: TTL 안의 결과를 그대로 사용
+# - stale_hits: TTL이 지난 결과를 사용하고 백그라운드에서 새로 고침
+# - misses: 캐시 없음 (새로 검색)
+# - refreshes: 백그라운드 새로 고침 성공
+# - refresh_failed: 백그라운드 새로 고침 실패 (기존 결과 유지)
+_STAT_KEYS = ('hits', 'stale_hits', 'misses', 'refreshes', 'refresh_failed', 'stores')
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키로 사용할 키워드를 정규화합니다 (앞뒤 공백 제거, 연속 공백 축약, 소문자)."""
+    return re.sub(r'\s+', ' ', keyword or '').strip().lower()
+
+
+class SerpCache:
+    """정규화한 키워드를 키로 하는 검색 결과 디스크 캐시"""
+
+    def __init__(self, root: Path, ttl: float = SERP_CACHE_TTL, stale_ttl: float = SERP_CACHE_STALE_TTL,
+                 enabled: bool = SERP_CACHE_ENABLED):
+        """
+        Args:
+            root: 캐시 파일을 저장할 디렉토리
+            ttl: 결과를 새로 고치지 않고 사용할 수 있는 시간 (초)
+            stale_ttl: TTL이 지난 결과를 백그라운드 새로 고침과 함께 사용할 수 있는 최대 나이 (초)
+            enabled: False면 조회/저장을 하지 않음
+        """
+        self.root = Path(root)
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._memory: Dict[str, dict] = {}
+        self._refreshing = set()
+        self._stats: Dict[str, int] = {key: 0 for key in _STAT_KEYS}
+
+    def _entry_path(self, key: str) -> Path:
+        """캐시 파일 경로를 반환합니다 (키워드 해시를 파일명으로 사용)."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.root / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        캐시 항목을 반환합니다 (만료 여부와 관계없이, STALE_TTL이 지난 항목은 제외).
+
+        Returns:
+            {'keyword', 'candidates': [{'url', 'title'}, ...], 'fetched_at'} 딕셔너리 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            path = self._entry_path(key)
+            if not path.exists():
+                return None
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except Exception as e:
+                print(f"[WARN] 검색 결과 캐시 로드 실패 ({path.name}): {e}")
+                return None
+            if entry.get('keyword') != key or not entry.get('candidates'):
+                return None
+            with self._lock:
+                self._memory[key] = entry
+        if self.age(entry) >= self.stale_ttl:
+            return None
+        return entry
+
+    def in_memory(self, key: str) -> bool:
+        """항목이 메모리에 올라와 있어 get이 디스크를 읽지 않는지 확인합니다 (이벤트 루프에서 바로 get해도 되는지 판단)."""
+        with self._lock:
+            return key in self._memory
+
+    def age(self, entry: dict) -> float:
+        """캐시 항목의 나이 (초)"""
+        return time.time() - entry.get('fetched_at', 0)
+
+    def is_fresh(self, entry: dict) -> bool:
+        """캐시 항목이 TTL 안에 있는지 확인합니다."""
+        return self.age(entry) < self.ttl
+
+    def put(self, key: str, candidates: List[dict], fetched_at: Optional[float] = None) -> Optional[dict]:
+        """
+        검색 결과 후보 목록 전체를 저장합니다.
+
+        Args:
+            key: 정규화한 키워드
+            candidates: 순위 순서의 [{'url': str, 'title': str 또는 None}, ...]
+                (title이 None이면 아직 제목을 찾지 않은 글, ''이면 제목을 찾지 못해 건너뛰는 글)
+            fetched_at: 검색 시각 (None이면 현재 시각, 제목만 갱신할 때는 기존 값을 전달)
+
+        Returns:
+            저장한 캐시 항목 (비활성화 상태이거나 후보가 없으면 None)
+        """
+        if not self.enabled or not candidates:
+            return None
+        candidates = [dict(candidate) for candidate in candidates]
+        # 새로 고친 목록에서도 이전에 블로그 페이지에서 찾은 제목은 그대로 사용
+        with self._lock:
+            previous = self._memory.get(key)
+        if previous:
+            known_titles = {c['url']: c['title'] for c in previous['candidates'] if c.get('title') is not None}
+            for candidate in candidates:
+                if candidate.get('title') is None and candidate['url'] in known_titles:
+                    candidate['title'] = known_titles[candidate['url']]
+        entry = {
+            'keyword': key,
+            'candidates': candidates,
+            'fetched_at': fetched_at if fetched_at is not None else time.time(),
+        }
+        with self._lock:
+            self._memory[key] = entry
+        self._write(key, entry)
+        self.record('stores')
+        return entry
+
+    def set_title(self, key: str, url: str, title: str):
+        """
+        캐시 항목에서 한 글의 제목만 갱신합니다 (검색 후 본문을 수집하며 제목을 찾은 경우).
+
+        Args:
+            key: 정규화한 키워드
+            url: 블로그 글 URL
+            title: 찾은 제목 (찾지 못했으면 '')
+        """
+        entry = self.get(key)
+        if entry is None:
+            return
+        candidates = [dict(candidate) for candidate in entry['candidates']]
+        for candidate in candidates:
+            if candidate['url'] == url and candidate.get('title') is None:
+                candidate['title'] = title
+                self.put(key, candidates, fetched_at=entry['fetched_at'])
+                return
+
+    def _write(self, key: str, entry: dict):
+        """캐시 파일을 원자적으로 기록합니다 (임시 파일 작성 후 교체)."""
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] 검색 결과 캐시 저장 실패 ({path.name}): {e}")
+
+    def begin_refresh(self, key: str) -> bool:
+        """
+        백그라운드 새로 고침을 시작해도 되는지 확인합니다 (같은 키는 한 번에 하나만).
+
+        Returns:
+            새로 고침을 시작해야 하면 True (끝나면 end_refresh 호출)
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str, success: bool):
+        """백그라운드 새로 고침이 끝났음을 기록합니다."""
+        with self._lock:
+            self._refreshing.discard(key)
+        self.record('refreshes' if success else 'refresh_failed')
+
+    def record(self, stat: str):
+        """통계 카운터를 1 증가시킵니다."""
+        with self._lock:
+            if stat in self._stats:
+                self._stats[stat] += 1
+
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            카운터, 조회 수, 네트워크 없이 처리한 비율(hit_ratio), TTL 등을 담은 딕셔너리
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['refreshing'] = len(self._refreshing)
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['lookups'] = lookups
+        stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else 0.0
+        stats['ttl_seconds'] = self.ttl
+        stats['stale_ttl_seconds'] = self.stale_ttl
+        stats['enabled'] = self.enabled
+        return stats
+
+    def reset_stats(self):
+        """통계 카운터를 초기화합니다."""
+        with self._lock:
+            self._stats = {key: 0 for key in _STAT_KEYS}
+
+
+# 공유 인스턴스 (지연 초기화)
+_serp_cache: Optional[SerpCache] = None
+
+
+def get_serp_cache() -> SerpCache:
+    """
+    프로세스 공유 SerpCache를 반환합니다 (data/serp_cache에 저장).
+
+    Returns:
+        SerpCache 인스턴스
+    """
+    global _serp_cache
+    if _serp_cache is None:
+        data_dir = Path(__file__).parent.parent / "data" / "serp_cache"
+        _serp_cache = SerpCache(data_dir)
+    return _serp_cache
@@ -0,0 +1,426 @@
+"""
+크롤러 세션 풀 모듈
+API 요청마다 NaverCrawler(새 requests.Session, 새 TLS 연결, 빈 쿠키)를 만드는 대신,
+미리 만들어 둔 크롤러를 빌려 쓰고 반납합니다.
+세션별 쿠키는 data/crawler/cookies에 저장되어 서버 재시작 후에도 이어서 사용하며,
+차단 점수가 높아진 세션은 폐기하고 새 세션으로 교체합니다.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .naver_crawler import NaverCrawler
+
+# 세션 풀 설정 (환경 변수로 조정 가능)
+POOL_SIZE = int(os.getenv("CRAWLER_POOL_SIZE", "8"))
+POOL_RETIRE_SCORE = float(os.getenv("CRAWLER_POOL_RETIRE_SCORE", "3"))
+POOL_WARM_CONNECTIONS = os.getenv("CRAWLER_POOL_WARM_CONNECTIONS", "0") in ("1", "true", "True")
+POOL_WARM_URL = "https://blog.naver.com/"
+# 같은 세션의 쿠키 파일을 다시 쓰기까지의 최소 간격 (초, 그 사이의 반납은 마지막 쿠키만 모아 두었다가 저장)
+POOL_COOKIE_SAVE_INTERVAL = float(os.getenv("CRAWLER_POOL_COOKIE_SAVE_INTERVAL", "30"))
+
+
+def _wake_waiter(waiter: asyncio.Future):
+    """반납을 기다리는 future를 깨웁니다 (이벤트 루프 스레드에서 실행)."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class CrawlerSessionPool:
+    """NaverCrawler 인스턴스를 재사용하는 프로세스 공유 풀"""
+
+    def __init__(self, size: int = POOL_SIZE, cookie_dir: Optional[Path] = None,
+                 retire_score: float = POOL_RETIRE_SCORE,
+                 cookie_save_interval: float = POOL_COOKIE_SAVE_INTERVAL):
+        """
+        Args:
+            size: 풀에서 관리할 최대 크롤러 수
+            cookie_dir: 세션별 쿠키를 저장할 디렉토리 (None이면 저장하지 않음)
+            retire_score: 이 차단 점수 이상인 세션은 반납 시 폐기
+            cookie_save_interval: 같은 세션의 쿠키 파일을 다시 쓰기까지의 최소 간격 (초)
+        """
+        self.size = max(size, 1)
+        self.cookie_dir = Path(cookie_dir) if cookie_dir else None
+        self.retire_score = retire_score
+        self._condition = threading.Condition()
+        self._idle: List[NaverCrawler] = []
+        self._free_slots: List[int] = list(range(self.size))
+        self._in_use = 0
+        self._created = 0
+        self._retired = 0
+        self._checkouts = 0
+        self._waits = 0
+        # crawler_async에서 반납을 기다리는 (이벤트 루프, future) 목록
+        self._async_waiters: List[tuple] = []
+        # 쿠키 파일 쓰기는 풀 lock 밖의 전용 스레드 하나에서 순서대로 처리
+        self.cookie_save_interval = cookie_save_interval
+        self._cookie_lock = threading.Lock()
+        self._cookie_pending: Dict[int, list] = {}      # 슬롯별 아직 저장하지 않은 마지막 쿠키
+        self._cookie_scheduled: set = set()             # 쓰기 작업이 대기 중인 슬롯
+        self._cookie_saved_at: Dict[int, float] = {}    # 슬롯별 마지막 저장 시각
+        self._cookie_timers: Dict[int, threading.Timer] = {}  # 저장 간격이 지나면 쓰기를 보낼 타이머
+        self._cookie_writer: Optional[ThreadPoolExecutor] = None
+        self._cookie_retired: set = set()               # 폐기되어 쿠키 파일을 불러오지 않을 슬롯
+
+    # ===== 세션 생성/쿠키 =====
+
+    def _cookie_path(self, slot: int) -> Optional[Path]:
+        """슬롯별 쿠키 파일 경로를 반환합니다."""
+        if not self.cookie_dir:
+            return None
+        return self.cookie_dir / f"session_{slot}.json"
+
+    def _create(self, slot: int) -> NaverCrawler:
+        """슬롯에 새 크롤러를 만들고 저장된 쿠키를 불러옵니다."""
+        crawler = NaverCrawler()
+        crawler.pool_slot = slot
+        path = self._cookie_path(slot)
+        with self._cookie_lock:
+            # 폐기한 세션의 쿠키 파일은 삭제가 끝나지 않았어도 새 세션에 불러오지 않음
+            if slot in self._cookie_retired:
+                self._cookie_retired.discard(slot)
+                path = None
+        if path and path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for cookie in json.load(f):
+                        crawler.session.cookies.set(
+                            cookie['name'], cookie['value'],
+                            domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                            expires=cookie.get('expires'), secure=cookie.get('secure', False)
+                        )
+            except Exception as e:
+                print(f"[WARN] 세션 쿠키 로드 실패 ({path.name}): {e}")
+        self._created += 1
+        return crawler
+
+    @staticmethod
+    def _cookie_snapshot(crawler: NaverCrawler) -> list:
+        """크롤러 세션의 (만료되지 않은) 쿠키를 저장용 리스트로 복사합니다."""
+        now = time.time()
+        return [
+            {
+                'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+                'expires': c.expires, 'secure': c.secure
+            }
+            for c in list(crawler.session.cookies)
+            if not c.expires or c.expires > now
+        ]
+
+    def _write_cookies(self, slot: int, cookies: list):
+        """쿠키 리스트를 슬롯 파일에 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        path = self._cookie_path(slot)
+        if not path:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cookies, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] 세션 쿠키 저장 실패 ({path.name}): {e}")
+
+    def _discard_cookies(self, slot: int):
+        """폐기한 세션의 쿠키 파일을 삭제합니다."""
+        path = self._cookie_path(slot)
+        if path and path.exists():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _submit_cookie_task(self, fn, *args):
+        """쿠키 파일 작업을 전용 스레드에 보냅니다 (_cookie_lock 안에서 호출)."""
+        if self._cookie_writer is None:
+            self._cookie_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cookie-writer")
+        self._cookie_writer.submit(fn, *args)
+
+    def _submit_flush(self, slot: int):
+        """저장 간격이 지난 슬롯의 쓰기를 전용 스레드에 보냅니다 (타이머 스레드에서 실행)."""
+        with self._cookie_lock:
+            if self._cookie_timers.pop(slot, None) is None:
+                return  # flush_cookies에서 이미 처리됨
+            self._submit_cookie_task(self._flush_slot, slot)
+
+    def _flush_slot(self, slot: int):
+        """슬롯에 모아 둔 마지막 쿠키를 파일에 씁니다 (전용 스레드에서 실행)."""
+        with self._cookie_lock:
+            self._cookie_scheduled.discard(slot)
+            cookies = self._cookie_pending.pop(slot, None)
+            if cookies is not None:
+                self._cookie_saved_at[slot] = time.monotonic()
+        if cookies is not None:
+            self._write_cookies(slot, cookies)
+
+    def _save_cookies(self, crawler: NaverCrawler):
+        """
+        크롤러 세션의 쿠키 저장을 예약합니다. 파일 쓰기는 전용 스레드에서 하며,
+        마지막 저장 후 cookie_save_interval이 지나지 않았으면 그때까지 반납된 마지막 쿠키만 모아 한 번에 씁니다.
+        """
+        if not self.cookie_dir:
+            return
+        slot = crawler.pool_slot
+        cookies = self._cookie_snapshot(crawler)
+        with self._cookie_lock:
+            self._cookie_pending[slot] = cookies
+            if slot in self._cookie_scheduled:
+                return
+            self._cookie_scheduled.add(slot)
+            delay = self._cookie_saved_at.get(slot, float('-inf')) + self.cookie_save_interval - time.monotonic()
+            if delay <= 0:
+                self._submit_cookie_task(self._flush_slot, slot)
+            else:
+                timer = threading.Timer(delay, self._submit_flush, (slot,))
+                timer.daemon = True
+                self._cookie_timers[slot] = timer
+                timer.start()
+
+    def _retire_cookies(self, slot: int):
+        """폐기한 세션의 저장 예정 쿠키를 버리고 쿠키 파일 삭제를 예약합니다."""
+        if not self.cookie_dir:
+            return
+        with self._cookie_lock:
+            self._cookie_pending.pop(slot, None)
+            self._cookie_saved_at.pop(slot, None)
+            self._cookie_retired.add(slot)
+            timer = self._cookie_timers.pop(slot, None)
+            if timer is not None:
+                timer.cancel()
+                self._cookie_scheduled.discard(slot)
+            self._submit_cookie_task(self._discard_cookies, slot)
+
+    def flush_cookies(self):
+        """예약/보류 중인 쿠키 저장을 모두 마칠 때까지 기다립니다."""
+        with self._cookie_lock:
+            for timer in self._cookie_timers.values():
+                timer.cancel()
+            self._cookie_timers.clear()
+            writer, self._cookie_writer = self._cookie_writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+        with self._cookie_lock:
+            pending, self._cookie_pending = self._cookie_pending, {}
+            self._cookie_scheduled.clear()
+            for slot in pending:
+                self._cookie_saved_at[slot] = time.monotonic()
+        for slot, cookies in pending.items():
+            self._write_cookies(slot, cookies)
+
+    # ===== 대여/반납 =====
+
+    def checkout(self, timeout: Optional[float] = None) -> NaverCrawler:
+        """
+        크롤러를 빌립니다. 유휴 크롤러 중 차단 점수가 가장 낮은 것을 돌려주고,
+        없으면 빈 슬롯에 새로 만들며, 풀이 가득 차면 반납될 때까지 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Raises:
+            TimeoutError: timeout 안에 크롤러를 빌리지 못한 경우
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._idle and not self._free_slots:
+                self._waits += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("사용 가능한 크롤러 세션이 없습니다.")
+                self._condition.wait(remaining)
+
+            if self._idle:
+                crawler = min(self._idle, key=lambda c: (c.block_score, c.last_used))
+                self._idle.remove(crawler)
+            else:
+                crawler = self._create(self._free_slots.pop(0))
+            self._in_use += 1
+            self._checkouts += 1
+            return crawler
+
+    def try_checkout(self) -> Optional[NaverCrawler]:
+        """기다리지 않고 크롤러를 빌립니다 (없으면 None)."""
+        with self._condition:
+            if not self._idle and not self._free_slots:
+                return None
+        try:
+            return self.checkout(timeout=0)
+        except TimeoutError:
+            return None
+
+    def checkin(self, crawler: NaverCrawler):
+        """
+        크롤러를 반납합니다. 차단 점수가 높으면 세션을 폐기하고 슬롯을 비웁니다.
+        """
+        crawler.last_used = time.time()
+        # 쿠키 저장/세션 종료는 풀 lock 밖에서 (파일 쓰기는 전용 스레드에서)
+        retire = crawler.block_score >= self.retire_score
+        if retire:
+            print(f"[WARN] 차단 점수가 높은 크롤러 세션을 교체합니다 (slot={crawler.pool_slot}, score={crawler.block_score:.1f})")
+            crawler.session.close()
+            self._retire_cookies(crawler.pool_slot)
+        else:
+            self._save_cookies(crawler)
+        with self._condition:
+            self._in_use -= 1
+            if retire:
+                self._free_slots.append(crawler.pool_slot)
+                self._retired += 1
+            else:
+                self._idle.append(crawler)
+            self._condition.notify()
+            async_waiters, self._async_waiters = self._async_waiters, []
+        # 이벤트 루프에서 기다리는 요청을 모두 깨움 (깨어난 요청은 다시 대여를 시도하고, 못 빌리면 다시 기다림)
+        for loop, waiter in async_waiters:
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                pass  # 이미 닫힌 이벤트 루프
+
+    @contextmanager
+    def crawler(self, timeout: Optional[float] = None):
+        """`with pool.crawler() as crawler:` 형태로 크롤러를 빌리고 자동으로 반납합니다."""
+        crawler = self.checkout(timeout=timeout)
+        try:
+            yield crawler
+        finally:
+            self.checkin(crawler)
+
+    async def checkout_async(self, timeout: Optional[float] = None) -> NaverCrawler:
+        """
+        checkout의 asyncio 버전입니다. 풀이 가득 차면 스레드를 점유하지 않고 이벤트 루프에서 반납을 기다립니다
+        (실행기 스레드로 기다리면 크롤러를 반납할 작업까지 실행기를 기다리게 되어 서버가 멈출 수 있음).
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Raises:
+            TimeoutError: timeout 안에 크롤러를 빌리지 못한 경우
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            crawler = self.try_checkout()
+            if crawler is not None:
+                return crawler
+            waiter = loop.create_future()
+            with self._condition:
+                # 등록 전에 반납된 크롤러를 놓치지 않도록 lock 안에서 다시 확인
+                if self._idle or self._free_slots:
+                    continue
+                self._waits += 1
+                self._async_waiters.append((loop, waiter))
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError("사용 가능한 크롤러 세션이 없습니다.")
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    @asynccontextmanager
+    async def crawler_async(self, timeout: Optional[float] = None):
+        """crawler의 asyncio 버전입니다 (풀이 가득 차면 이벤트 루프를 막지 않고 기다림)."""
+        crawler = await self.checkout_async(timeout=timeout)
+        try:
+            yield crawler
+        finally:
+            self.checkin(crawler)
+
+    # ===== 예열/상태 =====
+
+    def warm(self, count: Optional[int] = None, warm_connections: bool = POOL_WARM_CONNECTIONS):
+        """
+        크롤러를 미리 만들어 둡니다 (서버 시작 시 호출).
+
+        Args:
+            count: 미리 만들 크롤러 수 (None이면 풀 크기만큼)
+            warm_connections: True면 각 세션으로 blog.naver.com에 한 번 접속해 연결을 열어 둠
+        """
+        count = min(count or self.size, self.size)
+        crawlers = []
+        for _ in range(count):
+            try:
+                crawlers.append(self.checkout(timeout=0))
+            except TimeoutError:
+                break
+        for crawler in crawlers:
+            if warm_connections:
+                try:
+                    crawler._session_get(POOL_WARM_URL, timeout=10)
+                except Exception as e:
+                    print(f"[WARN] 세션 예열 요청 실패: {e}")
+            self.checkin(crawler)
+        print(f"[INFO] 크롤러 세션 {len(crawlers)}개를 준비했습니다.")
+
+    def status(self) -> dict:
+        """
+        풀 상태와 세션별 상태 점수를 반환합니다.
+
+        Returns:
+            크기, 사용 중/유휴 수, 누적 생성/폐기/대기 횟수, 유휴 세션별 요청/차단/오류 수와 차단 점수
+        """
+        with self._condition:
+            return {
+                'size': self.size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'created': self._created,
+                'retired': self._retired,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'sessions': [
+                    {
+                        'slot': c.pool_slot,
+                        'requests': c.request_count,
+                        'blocks': c.block_count,
+                        'errors': c.error_count,
+                        'block_score': round(c.block_score, 2),
+                        'cookies': len(c.session.cookies),
+                    }
+                    for c in sorted(self._idle, key=lambda c: c.pool_slot)
+                ],
+            }
+
+    def close(self):
+        """유휴 세션의 쿠키를 저장하고 연결을 닫습니다 (서버 종료 시 호출)."""
+        with self._condition:
+            idle = list(self._idle)
+        for crawler in idle:
+            if self.cookie_dir:
+                with self._cookie_lock:
+                    self._cookie_pending[crawler.pool_slot] = self._cookie_snapshot(crawler)
+            crawler.session.close()
+        self.flush_cookies()
+
+
+# 공유 인스턴스 (지연 초기화)
+_crawler_pool: Optional[CrawlerSessionPool] = None
+_crawler_pool_lock = threading.Lock()
+
+
+def get_crawler_pool() -> CrawlerSessionPool:
+    """
+    프로세스 공유 CrawlerSessionPool을 반환합니다 (쿠키는 data/crawler/cookies에 저장).
+
+    Returns:
+        CrawlerSessionPool 인스턴스
+    """
+    global _crawler_pool
+    if _crawler_pool is None:
+        with _crawler_pool_lock:
+            if _crawler_pool is None:
+                cookie_dir = Path(__file__).parent.parent / "data" / "crawler" / "cookies"
+                _crawler_pool = CrawlerSessionPool(cookie_dir=cookie_dir)
+    return _crawler_pool
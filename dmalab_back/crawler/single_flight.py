@@ -0,0 +1,129 @@
+"""
+동일 요청 병합(single-flight) 모듈
+같은 키(검색어/글 URL)로 동시에 들어온 요청은 하나만 실제로 실행하고,
+나머지는 그 결과를 함께 기다려 받습니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """진행 중인 요청 하나"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """스레드용 single-flight (requests 기반 동기 크롤링)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            key: 요청을 구분하는 키
+            fn: 실제로 실행할 함수
+
+        Returns:
+            (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """asyncio용 single-flight (AsyncFetcher 기반 비동기 크롤링)"""
+
+    def __init__(self):
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, coro_fn: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        SingleFlight.do의 asyncio 버전입니다.
+        먼저 시작한 요청이 취소되면 기다리던 요청 중 하나가 이어서 실행합니다.
+
+        Args:
+            key: 요청을 구분하는 키
+            coro_fn: 실제로 실행할 코루틴 함수
+
+        Returns:
+            (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        while True:
+            future = self._futures.get(loop_key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # 먼저 시작한 요청이 취소됨: 다시 시도
+                    continue
+                raise
+
+        future = loop.create_future()
+        self._futures[loop_key] = future
+        try:
+            result = await coro_fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없어도 경고가 남지 않도록 예외를 조회 처리
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._futures.get(loop_key) is future:
+                del self._futures[loop_key]
+
+
+# 공유 인스턴스
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 공유 SingleFlight를 반환합니다."""
+    return _single_flight
+
+
+def get_async_single_flight() -> AsyncSingleFlight:
+    """프로세스 공유 AsyncSingleFlight를 반환합니다."""
+    return _async_single_flight
@@ -0,0 +1,147 @@
+"""
+스트리밍 HTML 수집 모듈
+응답 바이트를 받는 대로 lxml 증분 파서(HTMLPullParser)에 넣고,
+필요한 요소를 확인하는 즉시 다운로드를 멈춥니다.
+- 바깥 페이지(blog.naver.com/{id}/{no}): mainFrame iframe의 src
+- 본문 페이지(PostView/모바일): se-main-container가 닫히는 시점
+"""
+
+import codecs
+import os
+from typing import Iterable, AsyncIterable, Optional
+
+from lxml import etree
+
+# 스트리밍 수집 사용 여부 (0이면 응답 전체를 받아 처리)
+STREAMING_ENABLED = os.getenv("CRAWLER_STREAMING", "1") not in ("0", "false", "False")
+STREAM_CHUNK_SIZE = int(os.getenv("CRAWLER_STREAM_CHUNK_SIZE", "16384"))
+# 필요한 요소를 찾은 뒤에도 남은 응답이 이 크기(바이트) 안이면 끝까지 읽음
+# (끝까지 읽은 응답만 keep-alive 커넥션을 재사용할 수 있고, 전체 본문으로 캐시할 수 있음)
+STREAM_DRAIN_BYTES = int(os.getenv("CRAWLER_STREAM_DRAIN_BYTES", "65536"))
+
+# 수집 모드
+MODE_CONTENT = 'content'  # se-main-container가 닫히면 중단
+MODE_OUTER = 'outer'      # mainFrame iframe src를 찾거나 se-main-container가 닫히면 중단
+
+
+class StreamedResponse:
+    """
+    스트리밍으로 받은 응답
+    requests.Response/httpx.Response와 같은 이름의 속성(status_code, url, headers, text)을 제공하여
+    기존 처리 코드를 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, status_code: int, url: str, headers, text: str,
+                 frame_src: Optional[str] = None, truncated: bool = False, bytes_read: int = 0):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.text = text
+        self.encoding = 'utf-8'
+        # 바깥 페이지에서 찾은 mainFrame iframe src (없으면 None)
+        self.frame_src = frame_src
+        # 응답을 끝까지 읽지 않고 멈췄는지 여부 (True면 text는 앞부분만 담은 HTML)
+        self.truncated = truncated
+        self.bytes_read = bytes_read
+
+    def raise_for_status(self):
+        """HTTP 오류 상태면 예외를 발생시킵니다."""
+        if self.status_code >= 400:
+            raise IOError(f"HTTP {self.status_code}: {self.url}")
+
+
+class _IncrementalPageReader:
+    """바이트 조각을 증분 파싱하며 중단 시점을 판단하는 클래스"""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8')
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._text_parts = []
+        self._target = None
+        self.frame_src: Optional[str] = None
+        self.done = False       # 필요한 요소를 찾음
+        self.complete = False   # 응답을 끝까지 읽음
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        바이트 조각을 추가합니다.
+
+        Returns:
+            더 이상 받을 필요가 없으면 True
+        """
+        self.bytes_read += len(chunk)
+        self._text_parts.append(self._decoder.decode(chunk))
+        if self.mode is None or self.done:
+            return self.done
+        try:
+            self._parser.feed(chunk)
+            events = self._parser.read_events()
+            for event, element in events:
+                if not isinstance(element.tag, str):
+                    continue
+                if event == 'start':
+                    if self.mode == MODE_OUTER and element.tag == 'iframe' and 'mainframe' in (element.get('id') or '').lower():
+                        if element.get('src'):
+                            self.frame_src = element.get('src')
+                            self.done = True
+                            break
+                    if self._target is None and 'se-main-container' in (element.get('class') or ''):
+                        self._target = element
+                elif event == 'end' and element is self._target:
+                    self.done = True
+                    break
+        except etree.LxmlError:
+            # 증분 파싱이 실패하면 끝까지 받아서 기존 방식으로 처리
+            self.mode = None
+        return self.done
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 HTML 텍스트"""
+        return ''.join(self._text_parts) + self._decoder.decode(b'', final=self.complete)
+
+
+def read_streamed(chunks: Iterable[bytes], mode: str, drain_bytes: int = STREAM_DRAIN_BYTES) -> _IncrementalPageReader:
+    """
+    바이트 조각을 읽다가 필요한 요소가 나오면 멈춥니다.
+    멈춘 뒤 drain_bytes까지는 파싱 없이 더 읽어, 그 안에 응답이 끝나면 끝까지 읽은 것으로 처리합니다.
+
+    Args:
+        chunks: 응답 바이트 조각 (requests의 iter_content 등)
+        mode: MODE_CONTENT 또는 MODE_OUTER
+        drain_bytes: 요소를 찾은 뒤 더 읽을 최대 바이트 수
+
+    Returns:
+        읽기를 마친 _IncrementalPageReader (끝까지 읽었으면 complete=True)
+    """
+    reader = _IncrementalPageReader(mode)
+    drained = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if reader.done:
+            if drained >= drain_bytes:
+                return reader
+            drained += len(chunk)
+        reader.feed(chunk)
+    reader.complete = True
+    return reader
+
+
+async def read_streamed_async(chunks: AsyncIterable[bytes], mode: str,
+                              drain_bytes: int = STREAM_DRAIN_BYTES) -> _IncrementalPageReader:
+    """read_streamed의 asyncio 버전입니다 (httpx aiter_bytes 등)."""
+    reader = _IncrementalPageReader(mode)
+    drained = 0
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        if reader.done:
+            if drained >= drain_bytes:
+                return reader
+            drained += len(chunk)
+        reader.feed(chunk)
+    reader.complete = True
+    return reader
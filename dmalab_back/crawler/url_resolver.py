@@ -0,0 +1,188 @@
+"""
+네이버 블로그 글 URL 해석 모듈
+어떤 형태의 URL이 들어와도 blogId/logNo를 먼저 추출하여,
+본문(se-main-container)이 실제로 들어 있는 페이지를 한 번에 요청할 수 있게 합니다.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, unquote
+
+# 본문이 들어 있는 페이지 종류
+# - iframe: 데스크톱 PostView (mainFrame iframe이 가리키는 페이지)
+# - mobile: 모바일 글 페이지
+VARIANT_SOURCES = ('iframe', 'mobile')
+
+# 글 번호는 숫자로만 구성됨
+_LOG_NO_PATTERN = re.compile(r'^\d+$')
+
+# 검색 리다이렉트 URL에서 실제 목적지를 담는 쿼리 파라미터
+_REDIRECT_PARAMS = ('u', 'url', 'target', 'redirect_url')
+
+# 블로그 ID로 쓰일 수 없는 경로 (네이버 블로그 시스템 경로)
+_RESERVED_PATHS = {'postview.naver', 'postview.nhn', 'postlist.naver', 'postlist.nhn', 'section', 'blogid'}
+
+
+def resolve_post_key(url: str) -> Optional[Tuple[str, str]]:
+    """
+    블로그 글 URL에서 (blogId, logNo)를 추출합니다.
+
+    지원 형식:
+        - https://blog.naver.com/{blogId}/{logNo}
+        - https://m.blog.naver.com/{blogId}/{logNo}
+        - https://blog.naver.com/PostView.naver?blogId=...&logNo=...
+        - https://blog.naver.com/{blogId}?Redirect=Log&logNo=...
+        - 검색 리다이렉트 URL (u=, url= 파라미터에 위 형식이 인코딩된 경우)
+
+    Args:
+        url: 블로그 글 URL
+
+    Returns:
+        (blogId, logNo) 튜플 (추출할 수 없으면 None)
+    """
+    if not url:
+        return None
+
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return None
+
+    host = (parsed.netloc or '').lower()
+    query = parse_qs(parsed.query)
+
+    # 검색 리다이렉트 URL: 목적지 URL을 꺼내 재귀적으로 해석
+    if 'blog.naver.com' not in host:
+        for param in _REDIRECT_PARAMS:
+            if param in query:
+                target = unquote(query[param][0])
+                if target and target != url:
+                    return resolve_post_key(target)
+        return None
+
+    blog_id = query.get('blogId', [None])[0]
+    log_no = query.get('logNo', [None])[0]
+
+    path_parts = [p for p in parsed.path.strip('/').split('/') if p]
+    if path_parts and path_parts[0].lower() not in _RESERVED_PATHS:
+        if not blog_id:
+            blog_id = path_parts[0]
+        if not log_no and len(path_parts) >= 2:
+            log_no = path_parts[1]
+
+    if blog_id and log_no and _LOG_NO_PATTERN.match(log_no):
+        return (blog_id, log_no)
+    return None
+
+
+def normalize_post_url(url: str) -> str:
+    """
+    블로그 글 URL을 정규화된 형태(https://blog.naver.com/{blogId}/{logNo})로 변환합니다.
+    해석할 수 없는 URL은 그대로 반환합니다.
+    """
+    post_key = resolve_post_key(url)
+    if not post_key:
+        return url
+    return f"https://blog.naver.com/{post_key[0]}/{post_key[1]}"
+
+
+def build_variant_url(source: str, blog_id: str, log_no: str) -> str:
+    """
+    본문이 들어 있는 페이지 종류별 URL을 생성합니다.
+
+    Args:
+        source: 'iframe' 또는 'mobile'
+        blog_id: 블로그 ID
+        log_no: 글 번호
+    """
+    if source == 'mobile':
+        return f"https://m.blog.naver.com/{blog_id}/{log_no}"
+    return (
+        f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+        f"&redirect=Dlog&widgetTypeCall=true&directAccess=false"
+    )
+
+
+def build_variant_referer(source: str, blog_id: str, log_no: str) -> str:
+    """페이지 종류별로 실제 브라우저가 보내는 Referer를 생성합니다."""
+    if source == 'mobile':
+        return f"https://blog.naver.com/{blog_id}"
+    return f"https://blog.naver.com/{blog_id}/{log_no}"
+
+
+class VariantMemory:
+    """블로그별로 지난번에 본문 수집에 성공한 페이지 종류를 기억하는 클래스"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: 기록을 저장할 JSON 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Dict[str, str] = {}
+        self._load()
+
+    def _load(self):
+        """저장된 기록을 불러옵니다."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._records = {k: v for k, v in data.items() if v in VARIANT_SOURCES}
+        except Exception as e:
+            print(f"[WARN] 페이지 종류 기록 로드 실패: {e}")
+
+    def _save(self):
+        """기록을 파일에 원자적으로 저장합니다 (lock을 잡은 상태에서 호출, 임시 파일 작성 후 교체)."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._records, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[WARN] 페이지 종류 기록 저장 실패: {e}")
+
+    def order_for(self, blog_id: str) -> List[str]:
+        """지난번 성공한 페이지 종류를 먼저 시도하도록 순서를 반환합니다."""
+        with self._lock:
+            preferred = self._records.get(blog_id)
+        if preferred == 'mobile':
+            return ['mobile', 'iframe']
+        return ['iframe', 'mobile']
+
+    def record(self, blog_id: str, source: str):
+        """본문 수집에 성공한 페이지 종류를 기록합니다."""
+        if source not in VARIANT_SOURCES:
+            return
+        with self._lock:
+            if self._records.get(blog_id) == source:
+                return
+            self._records[blog_id] = source
+            self._save()
+
+
+# 공유 인스턴스 (지연 초기화)
+_variant_memory: Optional[VariantMemory] = None
+
+
+def get_variant_memory() -> VariantMemory:
+    """
+    프로세스 공유 VariantMemory를 반환합니다 (data/crawler/variant_memory.json에 저장).
+
+    Returns:
+        VariantMemory 인스턴스
+    """
+    global _variant_memory
+    if _variant_memory is None:
+        data_dir = Path(__file__).parent.parent / "data" / "crawler"
+        _variant_memory = VariantMemory(data_dir / "variant_memory.json")
+    return _variant_memory
@@ -0,0 +1,85 @@
+"""
+형태소 분석 워커 풀 벤치마크
+고정 글(tests/fixtures/posts)의 본문을 반복해 만든 긴 글 여러 개를 스레드 풀에서 동시에 분석할 때,
+현재 프로세스의 공유 분석기를 쓰는 경우와 분석 워커 프로세스(1/2/4/8개)를 쓰는 경우의 전체 시간을 비교합니다.
+워커 수만큼 CPU 코어가 있어야 병렬 효과가 나타납니다 (결과 첫 줄의 CPU 수 참고).
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_analyzer_pool [글 수] [반복 배수]
+    (워커 프로세스의 초기화 로그도 함께 출력되므로 결과 표만 보려면 | grep -E "^(CPU|방식|현재|워커)")
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzer.analyzer_pool import AnalyzerPool, PooledAnalyzer
+from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from crawler.html_backend import BlogPage
+from crawler.naver_crawler import NaverCrawler
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "posts"
+# process_blogs/cli와 같이 스레드 풀에서 글을 동시에 분석
+THREADS = 8
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def _corpus(count: int, copies: int) -> list:
+    """고정 글 본문을 반복해 분석할 글 count개를 만듭니다."""
+    crawler = NaverCrawler()
+    texts = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for path in sorted(FIXTURE_DIR.glob("*.html")):
+            page = BlogPage(html=path.read_text(encoding="utf-8"),
+                            final_url='https://blog.naver.com/bench/1', source='iframe')
+            result = crawler._extract_body_from_page(page)
+            if result:
+                texts.append(result['body_text'])
+    return ['\n'.join(texts[i % len(texts)] for _ in range(copies)) for i in range(count)]
+
+
+def _run(analyzer: MorphemeAnalyzer, texts: list) -> tuple:
+    """스레드 풀에서 모든 글을 분석하고 (전체 시간(초), 결과 리스트)를 반환합니다."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(
+                lambda text: analyzer.analyze_keywords(text, min_length=2, min_count=2), texts
+            ))
+    return time.perf_counter() - start, results
+
+
+def main(count: int = 16, copies: int = 5):
+    texts = _corpus(count, copies)
+    total_chars = sum(len(text) for text in texts)
+    local = MorphemeAnalyzer(use_konlpy=True)
+    local.warm()
+    print(f"CPU {os.cpu_count()}개, 글 {count}개 (총 {total_chars}자), 스레드 {THREADS}개, 분석기 {local.backend_name}")
+
+    baseline, expected = _run(local, texts)
+    print(f"\n{'방식':<14} {'전체(s)':>8} {'글당(ms)':>9} {'배율':>6}")
+    print(f"{'현재 프로세스':<14} {baseline:>8.2f} {baseline / count * 1000:>9.1f} {1.0:>5.2f}x")
+    for workers in WORKER_COUNTS:
+        pooled = PooledAnalyzer(AnalyzerPool(workers=workers))
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                pooled.warm()  # 워커 프로세스 시작/예열 (시간에서 제외)
+            elapsed, results = _run(pooled, texts)
+        finally:
+            pooled.close()
+        assert results == expected, "워커 분석 결과가 현재 프로세스 결과와 다릅니다"
+        label = f"워커 {workers}개"
+        print(f"{label:<14} {elapsed:>8.2f} {elapsed / count * 1000:>9.1f} {baseline / elapsed:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 16,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
@@ -0,0 +1,62 @@
+"""
+HTML 백엔드 벤치마크
+고정 글 HTML(tests/fixtures/posts)과 이를 반복해 만든 긴 글에서 파싱 + 본문 추출(_extract_body_from_page)
+시간을 bs4 백엔드와 lxml 백엔드로 비교합니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_html_backend [반복 횟수]
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.html_backend import BlogPage, get_html_backend
+from crawler.naver_crawler import NaverCrawler
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "posts"
+
+
+def _long_post(copies: int) -> str:
+    """SE3 글의 본문을 반복해 긴 글 HTML을 만듭니다."""
+    html_text = (FIXTURE_DIR / "se3_post.html").read_text(encoding="utf-8")
+    start = html_text.index('<div class="se-main-container">') + len('<div class="se-main-container">')
+    end = html_text.index('<div class="post_footer">')
+    return html_text[:start] + html_text[start:end] * copies + html_text[end:]
+
+
+def _per_page_ms(crawler: NaverCrawler, backend, html_text: str, repeat: int) -> float:
+    """페이지 하나의 파싱 + 본문 추출 평균 시간 (밀리초, 로그 출력 제외)"""
+    def run():
+        page = BlogPage(html=html_text, final_url='https://blog.naver.com/bench/1', source='iframe')
+        return crawler._extract_body_from_page(page, backend)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()  # 예열
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(repeat: int = 20):
+    crawler = NaverCrawler()
+    soup_backend, lxml_backend = get_html_backend('bs4'), get_html_backend('lxml')
+
+    samples = [(fixture.stem, fixture.read_text(encoding="utf-8")) for fixture in sorted(FIXTURE_DIR.glob("*.html"))]
+    samples.append(('se3_post x50', _long_post(50)))
+
+    print(f"{'fixture':<16} {'KB':>6} {'bs4(ms)':>9} {'lxml(ms)':>9} {'배율':>6}")
+    for name, html_text in samples:
+        soup_ms = _per_page_ms(crawler, soup_backend, html_text, repeat)
+        lxml_ms = _per_page_ms(crawler, lxml_backend, html_text, repeat)
+        print(f"{name:<16} {len(html_text.encode('utf-8')) / 1024:>6.0f} {soup_ms:>9.2f} {lxml_ms:>9.2f} "
+              f"{soup_ms / lxml_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
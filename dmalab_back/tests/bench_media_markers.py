@@ -0,0 +1,67 @@
+"""
+본문 마커 추출 벤치마크
+고정 글 HTML(tests/fixtures/posts)과 이를 반복해 만든 이미지가 많은 긴 글에서
+기존 방식(재파싱 + 모듈별 find_all/find_parent)과 한 번 순회 방식의 추출 시간을 비교합니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_media_markers [반복 횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from crawler.media_markers import extract_text_with_media_markers
+from crawler.naver_crawler import NaverCrawler
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "posts"
+
+
+def _body_element(soup):
+    """본문 추출 방법 1/2와 같은 순서로 본문 요소를 찾습니다."""
+    container = soup.find(class_=lambda x: x and 'se-main-container' in str(x))
+    if container is None:
+        container = soup.find('div', id=lambda x: x and 'post-view' in str(x).lower())
+    return container if container is not None else soup.body
+
+
+def _long_post(copies: int) -> str:
+    """SE3 글의 본문 컴포넌트를 반복해 긴 글 HTML을 만듭니다."""
+    soup = BeautifulSoup((FIXTURE_DIR / "se3_post.html").read_text(encoding="utf-8"), "lxml")
+    container = _body_element(soup)
+    components = ''.join(str(child) for child in container.contents)
+    return f'<html><body><div class="se-main-container">{components * copies}</div></body></html>'
+
+
+def _per_call_ms(extract, element, repeat: int) -> float:
+    """추출 한 번에 걸린 평균 시간 (밀리초)"""
+    extract(element)  # 예열
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract(element)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(repeat: int = 20):
+    legacy = NaverCrawler()._extract_text_with_media_markers_legacy
+
+    samples = [(fixture.stem, fixture.read_text(encoding="utf-8")) for fixture in sorted(FIXTURE_DIR.glob("*.html"))]
+    samples.append(('se3_post x50', _long_post(50)))
+
+    print(f"{'fixture':<16} {'KB':>6} {'이미지':>6} {'링크':>4} {'legacy(ms)':>11} {'walk(ms)':>9} {'배율':>6}")
+    for name, html_text in samples:
+        element = _body_element(BeautifulSoup(html_text, "lxml"))
+        result = extract_text_with_media_markers(element)
+        assert result == legacy(element), f"{name}: 추출 결과가 다릅니다."
+        legacy_ms = _per_call_ms(legacy, element, repeat)
+        walk_ms = _per_call_ms(extract_text_with_media_markers, element, repeat)
+        print(f"{name:<16} {len(html_text.encode('utf-8')) / 1024:>6.0f} {len(result[1]):>6} {len(result[2]):>4} "
+              f"{legacy_ms:>11.2f} {walk_ms:>9.2f} {legacy_ms / walk_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
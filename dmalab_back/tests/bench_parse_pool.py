@@ -0,0 +1,87 @@
+"""
+파싱 프로세스 풀 벤치마크
+긴 글 여러 개(고정 SE3 글을 반복해 만든 HTML)를 스레드 풀에서 동시에 본문 추출할 때,
+스레드에서 직접 파싱하는 경우와 파싱 프로세스 풀(1/2/4/8 워커)을 사용하는 경우의 전체 시간을 비교합니다.
+워커 수만큼 CPU 코어가 있어야 병렬 효과가 나타납니다 (결과 첫 줄의 CPU 수 참고).
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_parse_pool [글 수] [반복 배수]
+    (워커 프로세스의 수집 로그도 함께 출력되므로 결과 표만 보려면 | grep -E "^(CPU|\[bs4\]|\[lxml\])")
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler import naver_crawler
+from crawler.html_backend import BlogPage, get_html_backend
+from crawler.naver_crawler import NaverCrawler
+from crawler.parse_pool import ParsePool
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "posts"
+# process_blogs/cli와 같이 스레드 풀에서 글을 동시에 처리
+THREADS = 8
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def _long_post(copies: int, seed: int) -> str:
+    """SE3 글의 본문을 반복해 긴 글 HTML을 만듭니다 (글마다 내용이 조금씩 다름)."""
+    html_text = (FIXTURE_DIR / "se3_post.html").read_text(encoding="utf-8")
+    start = html_text.index('<div class="se-main-container">') + len('<div class="se-main-container">')
+    end = html_text.index('<div class="post_footer">')
+    body = ''.join(html_text[start:end].replace('제주', f'제주{seed}-{i}') for i in range(copies))
+    return html_text[:start] + body + html_text[end:]
+
+
+def _run(posts: list, backend) -> tuple:
+    """스레드 풀에서 모든 글의 본문을 추출하고 (전체 시간(초), 결과 리스트)를 반환합니다."""
+    crawler = NaverCrawler()
+
+    def extract(html_text: str):
+        page = BlogPage(html=html_text, final_url='https://blog.naver.com/bench/1', source='iframe')
+        return crawler._extract_body_from_page(page, backend)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(extract, posts))
+    return time.perf_counter() - start, results
+
+
+def main(count: int = 12, copies: int = 20):
+    posts = [_long_post(copies, seed) for seed in range(count)]
+    size_kb = sum(len(post.encode('utf-8')) for post in posts) / 1024
+    print(f"CPU {os.cpu_count()}개, 글 {count}개 (총 {size_kb:.0f}KB), 스레드 {THREADS}개")
+
+    for backend_name in ('bs4', 'lxml'):
+        backend = get_html_backend(backend_name)
+        baseline, expected = _run(posts, backend)
+        print(f"\n[{backend_name}] {'방식':<14} {'전체(s)':>8} {'글당(ms)':>9} {'배율':>6}")
+        print(f"[{backend_name}] {'스레드만':<14} {baseline:>8.2f} {baseline / count * 1000:>9.1f} {1.0:>5.2f}x")
+        for workers in WORKER_COUNTS:
+            pool = ParsePool(workers=workers, min_bytes=0)
+            original = naver_crawler.get_parse_pool
+            naver_crawler.get_parse_pool = lambda: pool
+            try:
+                _run(posts[:workers], backend)  # 워커 프로세스 시작/예열
+                elapsed, results = _run(posts, backend)
+            finally:
+                naver_crawler.get_parse_pool = original
+                pool.close()
+            assert results == expected, "프로세스 풀 결과가 스레드 결과와 다릅니다"
+            label = f"프로세스 {workers}개"
+            print(f"[{backend_name}] {label:<14} {elapsed:>8.2f} {elapsed / count * 1000:>9.1f} "
+                  f"{baseline / elapsed:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 12,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
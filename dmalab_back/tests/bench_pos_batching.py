@@ -0,0 +1,66 @@
+"""
+품사 태깅 호출 횟수 벤치마크
+참고 글 10개 코퍼스(고정 글 본문을 반복해 만든 2000자 초과 글)에서 글마다 pos 호출(Python↔JVM 왕복)이 몇 번 일어나는지 셉니다.
+- 원문 문장 수: 원문을 문장 부호/줄바꿈으로 나눈 수 (문장마다 호출한다면 필요한 왕복 수)
+- 기존 분기 호출: 기존 2000자 초과 분기가 전처리된 텍스트를 나눈 수 (전처리에서 문장 부호/줄바꿈이 공백이 되므로 1)
+konlpy(Java)가 설치되어 있으면 실제 pos 호출 횟수와 분석 시간도 측정합니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_pos_batching [반복 배수]
+"""
+
+import contextlib
+import io
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from tests.bench_analyzer_pool import _corpus
+
+POSTS = 10
+SENTENCE_PATTERN = re.compile(r'[.!?。！？\n]+')
+
+
+def _sentences(text: str) -> int:
+    return sum(1 for sentence in SENTENCE_PATTERN.split(text) if sentence.strip())
+
+
+def main(copies: int = 20):
+    texts = _corpus(POSTS, copies)
+    analyzer = MorphemeAnalyzer(use_konlpy=True)
+
+    print(f"참고 글 {POSTS}개, 분석기 {analyzer.backend_name}")
+    print(f"{'글':>3} {'전처리(자)':>10} {'원문 문장 수':>12} {'기존 분기 호출':>14}")
+    for index, text in enumerate(texts, start=1):
+        # 분석 범위는 max_text_length(10000자)까지
+        cleaned = analyzer._preprocess_text(text, markers=False)[:10000]
+        print(f"{index:>3} {len(cleaned):>10} {_sentences(text):>12} {_sentences(cleaned):>14}")
+
+    if not analyzer.use_konlpy:
+        print("\n[INFO] konlpy(Java)를 사용할 수 없어 실제 호출 횟수와 분석 시간은 측정하지 않았습니다.")
+        return
+
+    analyzer.warm()
+    calls = 0
+    pos = analyzer._pos
+
+    def counting_pos(text, **kwargs):
+        nonlocal calls
+        calls += 1
+        return pos(text, **kwargs)
+
+    analyzer._pos = counting_pos
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for text in texts:
+            analyzer.analyze_keywords(text, min_length=2, min_count=2, markers=False)
+        elapsed = time.perf_counter() - start
+    print(f"\npos 호출 {calls}회, 전체 {elapsed:.2f}s, 글당 {elapsed / POSTS * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,48 @@
+"""
+SERP 파싱 벤치마크
+고정 SERP HTML(tests/fixtures/serp)을 기존 BeautifulSoup 방식과 lxml XPath 파서로 반복 파싱해
+SERP 한 페이지당 파싱 시간을 비교합니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_serp_parser [반복 횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.naver_crawler import NaverCrawler
+from crawler.serp_parser import parse_serp_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "serp"
+
+
+def _per_page_ms(parse, html_text: str, repeat: int) -> float:
+    """한 페이지 파싱에 걸린 평균 시간 (밀리초)"""
+    parse(html_text)  # 예열
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(html_text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(repeat: int = 20):
+    crawler = NaverCrawler()
+    legacy = lambda html_text: list(crawler._iter_serp_candidates_legacy(html_text))
+    compiled = lambda html_text: list(parse_serp_html(html_text))
+
+    print(f"{'fixture':<20} {'KB':>6} {'후보':>4} {'legacy(ms)':>11} {'lxml(ms)':>9} {'배율':>6}")
+    for fixture in sorted(FIXTURE_DIR.glob("*.html")):
+        html_text = fixture.read_text(encoding="utf-8")
+        candidates = compiled(html_text)
+        assert candidates == legacy(html_text), f"{fixture.name}: 파싱 결과가 다릅니다."
+        legacy_ms = _per_page_ms(legacy, html_text, repeat)
+        compiled_ms = _per_page_ms(compiled, html_text, repeat)
+        print(f"{fixture.stem:<20} {len(html_text.encode('utf-8')) / 1024:>6.0f} {len(candidates):>4} "
+              f"{legacy_ms:>11.2f} {compiled_ms:>9.2f} {legacy_ms / compiled_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
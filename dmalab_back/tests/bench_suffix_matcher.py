@@ -0,0 +1,74 @@
+"""
+조사/어미 판별 마이크로 벤치마크
+고정 글 단어와 조사/어미를 붙여 만든 단어에서 토큰 하나당 판별 시간(나노초)을
+패턴별 re.search/re.sub 방식(기존)과 한 번 컴파일한 정규식/접미사 방식으로 비교하고,
+간단한 키워드 추출(_extract_keywords_simple) 전체 시간도 비교합니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.bench_suffix_matcher [반복 횟수]
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from tests.test_morpheme_analyzer import (
+    POST_DIR,
+    _legacy_has_josa,
+    _legacy_is_ending_word,
+    _legacy_remove_josa,
+    _suffix_corpus,
+)
+
+
+def _per_token_ns(fn, words: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for word in words:
+            fn(word)
+    return (time.perf_counter() - start) / (repeat * len(words)) * 1e9
+
+
+def main(repeat: int = 20):
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = MorphemeAnalyzer(use_konlpy=False)
+    texts = [path.read_text(encoding="utf-8") for path in sorted(POST_DIR.glob("*.html"))]
+    corpus = ' '.join(analyzer._preprocess_text(text) for text in texts)
+    words = _suffix_corpus(corpus)
+    print(f"단어 {len(words)}개, 반복 {repeat}회")
+
+    print(f"\n{'판별':<16} {'기존(ns)':>9} {'컴파일(ns)':>10} {'배율':>6}")
+    for name, legacy, compiled in (
+        ('_is_ending_word', _legacy_is_ending_word, analyzer._is_ending_word),
+        ('_has_josa', _legacy_has_josa, analyzer._has_josa),
+        ('_remove_josa', _legacy_remove_josa, analyzer._remove_josa),
+    ):
+        old = _per_token_ns(legacy, words, repeat)
+        new = _per_token_ns(compiled, words, repeat)
+        print(f"{name:<16} {old:>9.0f} {new:>10.0f} {old / new:>5.1f}x")
+
+    text = '\n'.join(texts) * 20
+    tokens = len(analyzer._preprocess_text(text).split())
+
+    def extract_ms() -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            analyzer._extract_keywords_simple(text, 2)
+        return (time.perf_counter() - start) / repeat * 1000
+
+    new = extract_ms()
+    with mock.patch.object(MorphemeAnalyzer, '_is_ending_word', lambda self, w: _legacy_is_ending_word(w)), \
+            mock.patch.object(MorphemeAnalyzer, '_has_josa', lambda self, w: _legacy_has_josa(w)), \
+            mock.patch.object(MorphemeAnalyzer, '_remove_josa', lambda self, w: _legacy_remove_josa(w)):
+        old = extract_ms()
+    print(f"\n_extract_keywords_simple (토큰 {tokens}개): 기존 {old:.1f}ms, 컴파일 {new:.1f}ms ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,55 @@
+"""
+파서 일치 테스트용 실제 페이지 저장 스크립트
+실제 블로그 글(SE3/SE2/모바일) 또는 통합검색 HTML을 tests/fixtures 아래에 저장합니다.
+저장한 파일은 test_media_markers, test_html_backend, test_serp_parser 일치 테스트에 자동으로 포함됩니다.
+
+사용법 (dmalab_back 디렉토리에서):
+    python -m tests.save_fixture post <블로그 글 URL>
+    python -m tests.save_fixture serp <키워드>
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.naver_crawler import NaverCrawler
+from crawler.url_resolver import resolve_post_key
+
+FIXTURE_ROOT = Path(__file__).parent / "fixtures"
+
+
+def save_post(url: str) -> Path:
+    """블로그 글 페이지(본문이 들어 있는 최종 페이지)를 posts/{source}_{blogId}_{logNo}.html로 저장합니다."""
+    page = NaverCrawler()._fetch_blog_page(url)
+    if not page:
+        raise SystemExit(f"[ERROR] 블로그 페이지를 가져올 수 없습니다: {url}")
+    post_key = resolve_post_key(str(page['final_url'])) or resolve_post_key(url)
+    name = '_'.join(post_key) if post_key else hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+    path = FIXTURE_ROOT / "posts" / f"{page['source']}_{name}.html"
+    path.write_text(page['html'], encoding='utf-8')
+    return path
+
+
+def save_serp(keyword: str) -> Path:
+    """통합검색 HTML을 serp/serp_{키워드 해시}.html로 저장합니다."""
+    crawler = NaverCrawler()
+    response = crawler._session_get(crawler.base_url, params=crawler._build_search_params(keyword), timeout=15)
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    path = FIXTURE_ROOT / "serp" / f"serp_{hashlib.sha1(keyword.encode('utf-8')).hexdigest()[:12]}.html"
+    path.write_text(response.text, encoding='utf-8')
+    return path
+
+
+def main(argv: list):
+    if len(argv) != 2 or argv[0] not in ('post', 'serp'):
+        raise SystemExit(__doc__)
+    kind, target = argv
+    path = save_post(target) if kind == 'post' else save_serp(target)
+    print(f"[INFO] 저장 완료: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
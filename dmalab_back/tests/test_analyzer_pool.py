@@ -0,0 +1,59 @@
+"""
+형태소 분석 워커 풀 테스트
+워커 프로세스에서 분석한 결과가 현재 프로세스 분석 결과와 같은지,
+워커가 비정상 종료되면 새 워커로 다시 분석하는지 확인합니다.
+"""
+
+import os
+import signal
+from pathlib import Path
+
+import pytest
+
+from analyzer import morpheme_analyzer
+from analyzer.analyzer_pool import AnalyzerPool, PooledAnalyzer
+from analyzer.morpheme_analyzer import MorphemeAnalyzer
+
+TEXT = (Path(__file__).parent / "fixtures" / "posts" / "skin_post.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def pooled():
+    analyzer = PooledAnalyzer(AnalyzerPool(workers=2))
+    analyzer.warm()
+    yield analyzer
+    analyzer.close()
+
+
+def test_pooled_results_match_in_process(pooled):
+    local = MorphemeAnalyzer(use_konlpy=True)
+    assert pooled.analyze_keywords(TEXT, min_length=2, min_count=2) == \
+        local.analyze_keywords(TEXT, min_length=2, min_count=2)
+    assert pooled.get_keyword_ranking(TEXT, top_n=5) == local.get_keyword_ranking(TEXT, top_n=5)
+    stats = pooled.pool.stats()
+    assert stats['completed'] == 2 and stats['pending'] == 0
+
+
+def test_long_text_chunks_are_spread_across_workers(pooled, monkeypatch):
+    monkeypatch.setattr(morpheme_analyzer, "CHUNK_CHARS", 200)
+    text = TEXT * 5
+    chunks = pooled.text_chunks(text)
+    assert len(chunks) > 2
+    local = MorphemeAnalyzer(use_konlpy=True)
+    assert pooled.analyze_keywords(text, min_length=2, min_count=2) == \
+        local.analyze_keywords(text, min_length=2, min_count=2)
+    per_worker = pooled.pool.stats()['per_worker']
+    assert sum(w['completed'] for w in per_worker) == len(chunks)
+    assert all(w['completed'] > 0 for w in per_worker)
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason="SIGKILL 필요")
+def test_crashed_worker_is_restarted(pooled):
+    expected = pooled.analyze_keywords(TEXT, min_length=2)
+    worker = pooled.pool.stats()['per_worker'][0]
+    os.kill(worker['pid'], signal.SIGKILL)
+    # 종료된 워커(#0)로 보낸 작업이 다른 워커에서 다시 실행되어야 함
+    assert [pooled.analyze_keywords(TEXT, min_length=2) for _ in range(3)] == [expected] * 3
+    stats = pooled.pool.stats()
+    assert stats['restarts'] == 1
+    assert stats['per_worker'][0]['failed'] == 1
@@ -0,0 +1,54 @@
+"""
+비동기 수집 쿠키 테스트
+공유 AsyncFetcher로 보낸 요청이 크롤러 세션의 쿠키를 보내고 받으며(리다이렉트 포함), 세션끼리 쿠키가 섞이지 않는지 확인합니다.
+"""
+
+import asyncio
+import functools
+
+import httpx
+
+from crawler import async_fetcher
+from crawler.async_fetcher import AsyncFetcher
+from crawler.naver_crawler import NaverCrawler
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    cookie = request.headers.get('Cookie', '')
+    if request.url.path == '/start':
+        return httpx.Response(
+            302, headers={'Location': '/final', 'Set-Cookie': 'hop=1; Domain=blog.naver.com; Path=/'}
+        )
+    return httpx.Response(
+        200, text=cookie, headers={'Set-Cookie': 'seen=yes; Domain=blog.naver.com; Path=/'}
+    )
+
+
+def _fetcher(monkeypatch) -> AsyncFetcher:
+    transport = httpx.MockTransport(_handler)
+    monkeypatch.setattr(async_fetcher.httpx, 'AsyncClient', functools.partial(httpx.AsyncClient, transport=transport))
+    return AsyncFetcher()
+
+
+def test_fetch_uses_session_cookies(monkeypatch):
+    fetcher = _fetcher(monkeypatch)
+    first, second = NaverCrawler(), NaverCrawler()
+    first.session.cookies.set('NID', 'first', domain='blog.naver.com')
+
+    async def scenario():
+        response = await fetcher.get('https://blog.naver.com/start', cookies=first.session.cookies)
+        other = await fetcher.get('https://blog.naver.com/final', cookies=second.session.cookies)
+        async with fetcher.stream('https://blog.naver.com/final', cookies=first.session.cookies) as streamed:
+            await streamed.aread()
+        await fetcher.aclose()
+        return response, other, streamed
+
+    response, other, streamed = asyncio.run(scenario())
+    # 리다이렉트에서 받은 쿠키와 세션 쿠키를 최종 요청에 보냄
+    assert 'NID=first' in response.text and 'hop=1' in response.text
+    assert [r.status_code for r in response.history] == [302]
+    assert first.session.cookies.get('seen') == 'yes'
+    # 다른 세션의 쿠키는 보내지 않음
+    assert other.text == ''
+    assert second.session.cookies.get('NID') is None
+    assert 'seen=yes' in streamed.text
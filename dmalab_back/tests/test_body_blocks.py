@@ -0,0 +1,87 @@
+"""
+본문 블록 리스트 테스트
+블록이 본문 텍스트/URL 리스트와 맞는지, 두 백엔드에서 같은지, 블록 분석 결과가 텍스트 분석과 같은지,
+페이지 캐시에 저장한 추출 결과를 다시 파싱하지 않고 사용하는지 확인합니다.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from analyzer.morpheme_analyzer import MorphemeAnalyzer
+from crawler import naver_crawler
+from crawler.html_backend import BlogPage, get_html_backend
+from crawler.media_markers import block_marker
+from crawler.naver_crawler import NaverCrawler
+from crawler.page_cache import PageCache
+
+FIXTURE_ROOT = Path(__file__).parent / "fixtures" / "posts"
+# oglink 모듈 안에 숨은 이미지/링크(마커 없이 URL만 수집)가 없는 글
+PLAIN_POSTS = ['se3_post', 'se2_post', 'mobile_post', 'skin_post']
+MARKER_PATTERN = re.compile(r'\[(?:이미지|링크|이모티콘) 삽입\d+\]')
+
+
+def _page(html_text: str, **extra) -> BlogPage:
+    return BlogPage(html=html_text, final_url='https://blog.naver.com/test/1', source='iframe', **extra)
+
+
+def _extract(name: str, backend_name: str = 'bs4') -> dict:
+    html_text = (FIXTURE_ROOT / f"{name}.html").read_text(encoding="utf-8")
+    return NaverCrawler()._extract_body_from_page(_page(html_text), get_html_backend(backend_name))
+
+
+@pytest.mark.parametrize("name", PLAIN_POSTS)
+def test_blocks_follow_body_text(name):
+    result = _extract(name)
+    blocks = result['blocks']
+    assert result == _extract(name, 'lxml')
+
+    # 마커 순서와 텍스트 순서가 본문 텍스트와 같음 (링크 텍스트에 붙은 마커는 블록에서 분리됨)
+    body_text = result['body_text']
+    assert [block_marker(block) for block in blocks if block_marker(block)] == MARKER_PATTERN.findall(body_text)
+    texts = [line for block in blocks if block.get('text') for line in block['text'].split('\n')]
+    assert texts == [line for line in MARKER_PATTERN.sub('\n', body_text).split('\n') if line.strip()]
+
+    # 번호순으로 정렬한 블록 URL이 URL 리스트와 같음
+    for kind, urls in (('image', result['image_urls']), ('link', result['link_urls'])):
+        ordered = sorted((block for block in blocks if block['type'] == kind), key=lambda block: block['index'])
+        assert [block['url'] for block in ordered if 'url' in block] == urls
+
+
+def test_blocks_keep_headings_quotes_and_stickers():
+    kinds = {block['type'] for block in _extract('mobile_post')['blocks']}
+    assert {'paragraph', 'quote', 'image', 'link', 'sticker'} <= kinds
+    assert any(block['type'] == 'heading' for block in _extract('se3_post')['blocks'])
+
+
+@pytest.mark.parametrize("name", PLAIN_POSTS)
+def test_block_analysis_matches_text_analysis(name):
+    analyzer = MorphemeAnalyzer(use_konlpy=False)
+    result = _extract(name)
+    assert analyzer.analyze_blocks(result['blocks']) == analyzer.analyze_keywords(result['body_text'])
+
+
+def test_page_cache_reuses_extraction(tmp_path, monkeypatch):
+    """캐시된 글은 한 번 추출한 결과를 캐시 항목에 저장하고 다음에는 파싱하지 않음"""
+    cache = PageCache(tmp_path, enabled=True)
+    monkeypatch.setattr(naver_crawler, 'get_page_cache', lambda: cache)
+    html_text = (FIXTURE_ROOT / "se3_post.html").read_text(encoding="utf-8")
+    post_key = ('test', '1')
+    cache.put(post_key, html_text, 'iframe', 'https://blog.naver.com/test/1')
+
+    crawler = NaverCrawler()
+    first = crawler._extract_body_from_page(_page(html_text, post_key=post_key))
+    assert cache.get(post_key)['extracted']['result'] == first
+
+    def fail(*args, **kwargs):
+        raise AssertionError("다시 파싱하면 안 됨")
+
+    monkeypatch.setattr(NaverCrawler, '_extract_body_from_document', fail)
+    page = crawler._page_from_cache(cache.get(post_key), post_key=post_key)
+    assert crawler._extract_body_from_page(page) == first
+    assert cache.stats()['extract_hits'] == 1
+
+    # HTML이 바뀌면 이전 추출 결과는 저장되지 않음
+    cache.put(post_key, html_text + ' ', 'iframe', 'https://blog.naver.com/test/1')
+    assert 'extracted' not in cache.get(post_key)
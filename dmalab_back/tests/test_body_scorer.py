@@ -0,0 +1,68 @@
+"""
+본문 후보 점수 테스트
+방법 3에서 점수로 고른 본문 루트가 메뉴/댓글/사이드바를 뺀 안쪽 본문 div인지,
+마커 추출이 한 번만 실행되는지, 두 백엔드의 후보 통계가 같은지 확인합니다.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from crawler import naver_crawler
+from crawler.body_scorer import rank_body_candidates
+from crawler.html_backend import BlogPage, get_html_backend
+from crawler.naver_crawler import NaverCrawler
+
+SKIN_POST = Path(__file__).parent / "fixtures" / "posts" / "skin_post.html"
+
+
+def _page(html_text: str) -> BlogPage:
+    return BlogPage(html=html_text, final_url='https://blog.naver.com/test/1', source='iframe')
+
+
+def _stats(candidates):
+    return [(c.order, c.text_length, c.link_text_length, c.images, c.links) for c in candidates]
+
+
+def test_candidate_stats_match_across_backends():
+    html_text = SKIN_POST.read_text(encoding="utf-8")
+    soup_backend, lxml_backend = get_html_backend('bs4'), get_html_backend('lxml')
+    soup_candidates = soup_backend.measure_body_candidates(soup_backend.document(_page(html_text)))
+    lxml_candidates = lxml_backend.measure_body_candidates(lxml_backend.document(_page(html_text)))
+    assert _stats(soup_candidates) == _stats(lxml_candidates)
+    assert [soup_backend.describe(c.element) for c in soup_candidates] == \
+        [lxml_backend.describe(c.element) for c in lxml_candidates]
+
+
+@pytest.mark.parametrize("backend_name", ['bs4', 'lxml'])
+def test_scored_selection_extracts_inner_article_once(backend_name, monkeypatch):
+    """중첩된 후보 중 안쪽 본문 div 하나만 추출해야 함"""
+    backend = get_html_backend(backend_name)
+    calls = []
+    original = NaverCrawler._extract_media_text
+
+    def counting(self, backend, element):
+        calls.append(backend.describe(element))
+        return original(self, backend, element)
+
+    monkeypatch.setattr(naver_crawler, 'BODY_SELECTION', 'score')
+    monkeypatch.setattr(NaverCrawler, '_extract_media_text', counting)
+    result = NaverCrawler()._extract_body_from_page(_page(SKIN_POST.read_text(encoding="utf-8")), backend)
+
+    assert calls == [('div', '없음', 'article_body')]
+    assert result['body_text'].startswith('지난 주말에')
+    for noise in ('방문자1', '최근 글', '#여행', '방명록'):
+        assert noise not in result['body_text']
+    assert len(result['image_urls']) == 2
+    assert result['link_urls'] == ['https://map.naver.com/p/entry/place/1234']
+
+
+def test_rank_skips_link_heavy_candidates():
+    html_text = (
+        '<html><body><div class="content_menu"><a href="/1">링크만 잔뜩 있는 메뉴 영역입니다 첫째</a>'
+        '<a href="/2">링크만 잔뜩 있는 메뉴 영역입니다 둘째</a></div>'
+        '<div class="post_body">짧은 본문이지만 링크가 없는 실제 글 내용입니다.</div></body></html>'
+    )
+    backend = get_html_backend('bs4')
+    ranked = rank_body_candidates(backend.measure_body_candidates(backend.document(_page(html_text))))
+    assert backend.describe(ranked[0].element)[2] == 'post_body'
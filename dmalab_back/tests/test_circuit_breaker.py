@@ -0,0 +1,51 @@
+"""
+서킷 브레이커 테스트
+시험 요청(half-open)이 차단/성공이 아닌 응답(404 등)을 받아도 서킷이 half-open에 멈추지 않는지 확인합니다.
+"""
+
+import pytest
+
+from crawler import circuit_breaker, naver_crawler
+from crawler.circuit_breaker import STATE_CLOSED, STATE_OPEN, CircuitBreaker, CircuitOpenError
+from crawler.naver_crawler import NaverCrawler
+
+URL = 'https://blog.naver.com/test/1'
+HOST = 'blog.naver.com'
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    monkeypatch.setattr(circuit_breaker, '_circuit_breaker', breaker)
+    monkeypatch.setattr(naver_crawler, 'get_circuit_breaker', lambda: breaker)
+    return breaker
+
+
+def _open_and_cool_down(crawler, breaker, monkeypatch):
+    """차단 응답으로 서킷을 열고 쿨다운이 끝난 시점으로 이동합니다."""
+    crawler._record_response(URL, 403, None)
+    assert breaker.status()[HOST]['state'] == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+    now = circuit_breaker.time.time()
+    monkeypatch.setattr(circuit_breaker.time, 'time', lambda: now + 61)
+
+
+@pytest.mark.parametrize("status_code", [404, 410])
+def test_not_found_probe_allows_next_request(breaker, monkeypatch, status_code):
+    crawler = NaverCrawler()
+    _open_and_cool_down(crawler, breaker, monkeypatch)
+    breaker.before_request(HOST)  # 시험 요청
+    crawler._record_response(URL, status_code, None)
+    # 다음 요청이 새 시험 요청으로 허용되고, 정상 응답이면 서킷이 닫힘
+    assert breaker.before_request(HOST) == 0.0
+    crawler._record_response(URL, 200, '<html><body>ok</body></html>')
+    assert breaker.status()[HOST]['state'] == STATE_CLOSED
+
+
+def test_server_error_probe_reopens_circuit(breaker, monkeypatch):
+    crawler = NaverCrawler()
+    _open_and_cool_down(crawler, breaker, monkeypatch)
+    breaker.before_request(HOST)
+    crawler._record_response(URL, 503, None)
+    assert breaker.status()[HOST]['state'] == STATE_OPEN
@@ -0,0 +1,61 @@
+"""
+HTML 백엔드 일치 테스트
+bs4 백엔드와 lxml 백엔드가 고정 글/SERP HTML에서 같은 본문 텍스트와 이미지/링크 URL 리스트를 돌려주는지 확인합니다.
+"""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from crawler.html_backend import BlogPage, get_html_backend
+from crawler.naver_crawler import NaverCrawler
+
+FIXTURE_ROOT = Path(__file__).parent / "fixtures"
+FIXTURES = sorted(FIXTURE_ROOT.glob("posts/*.html")) + sorted(FIXTURE_ROOT.glob("serp/*.html"))
+
+
+def _page(html_text: str) -> BlogPage:
+    return BlogPage(html=html_text, final_url='https://blog.naver.com/test/1', source='iframe')
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: f"{path.parent.name}/{path.stem}")
+def test_body_extraction_matches_across_backends(fixture):
+    """본문 추출 결과(방법 1~4 선택 포함)가 백엔드와 관계없이 같아야 함"""
+    html_text = fixture.read_text(encoding="utf-8")
+    crawler = NaverCrawler()
+    expected = crawler._extract_body_from_page(_page(html_text), get_html_backend('bs4'))
+    assert expected is not None
+    assert crawler._extract_body_from_page(_page(html_text), get_html_backend('lxml')) == expected
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: f"{path.parent.name}/{path.stem}")
+def test_media_markers_match_across_backends(fixture):
+    """모든 요소에서 마커 텍스트와 URL 리스트가 같아야 함 (두 트리의 요소는 문서 순서로 대응)"""
+    html_text = fixture.read_text(encoding="utf-8")
+    soup_backend, lxml_backend = get_html_backend('bs4'), get_html_backend('lxml')
+    soup_elements = BeautifulSoup(html_text, 'lxml').find_all(True)
+    lxml_elements = [e for e in lxml_backend.document(_page(html_text)).iter() if isinstance(e.tag, str)]
+    assert [e.name for e in soup_elements] == [e.tag for e in lxml_elements]
+    for soup_element, lxml_element in zip(soup_elements, lxml_elements):
+        assert (lxml_backend.extract_text_with_media_markers(lxml_element)
+                == soup_backend.extract_text_with_media_markers(soup_element)), str(soup_element)[:300]
+
+
+def test_body_page_fallback_removes_layout_tags():
+    """방법 4(body 전체)에서 제거한 태그 앞뒤 텍스트가 합쳐지지 않아야 함"""
+    html_text = (
+        '<html><body><nav>메뉴 링크 모음</nav>첫 번째 본문 줄<script>var x = 1;</script>'
+        '두 번째 본문 줄<footer>저작권 표시 문구</footer></body></html>'
+    )
+    crawler = NaverCrawler()
+    result = crawler._extract_body_from_page(_page(html_text), get_html_backend('lxml'))
+    assert result['body_text'] == '첫 번째 본문 줄\n두 번째 본문 줄'
+    assert result == crawler._extract_body_from_page(_page(html_text), get_html_backend('bs4'))
+
+
+def test_blog_page_builds_soup_lazily():
+    page = _page('<html><body><p>본문</p></body></html>')
+    assert 'soup' not in page
+    assert page['soup'].p.get_text() == '본문'
+    assert 'soup' in page and 'soup' not in page.fresh()
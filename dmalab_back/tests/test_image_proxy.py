@@ -0,0 +1,53 @@
+"""
+이미지 프록시 테스트
+/api/image-proxy가 속도 제한 토큰을 이벤트 루프에서 비동기로 한 번만 받고, 다운로드/저장은 실행기에서 하는지 확인합니다.
+"""
+
+import asyncio
+import threading
+
+from api import app as app_module
+
+IMAGE_URL = 'https://postfiles.pstatic.net/test/image.jpg'
+
+
+class _FakeLimiter:
+    def __init__(self):
+        self.async_calls = 0
+
+    def acquire(self, url):
+        raise AssertionError("이벤트 루프를 막는 acquire가 호출되었습니다")
+
+    async def acquire_async(self, url):
+        self.async_calls += 1
+        return 0.0
+
+
+class _FakeResponse:
+    headers = {'Content-Type': 'image/jpeg'}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield b'jpeg-bytes'
+
+
+def test_proxy_image_waits_async_and_downloads_in_executor(tmp_path, monkeypatch):
+    limiter = _FakeLimiter()
+    threads = []
+
+    def fake_get(url, **kwargs):
+        threads.append(threading.current_thread())
+        return _FakeResponse()
+
+    monkeypatch.setattr(app_module, 'NAVER_CRAWLER_DIR', tmp_path)
+    monkeypatch.setattr(app_module, 'get_rate_limiter', lambda: limiter)
+    monkeypatch.setattr(app_module.requests, 'get', fake_get)
+
+    response = asyncio.run(app_module.proxy_image(IMAGE_URL))
+
+    assert limiter.async_calls == 1
+    assert threads and threads[0] is not threading.main_thread()
+    assert (tmp_path / "images").exists()
+    assert response.path.endswith('.jpg')
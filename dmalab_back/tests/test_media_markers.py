@@ -0,0 +1,46 @@
+"""
+본문 마커 추출 일치 테스트
+한 번 순회하는 media_markers가 기존 재파싱 방식과 같은 텍스트, 마커 번호, URL 리스트를 돌려주는지 확인합니다.
+"""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from crawler.media_markers import extract_text_with_media_markers
+from crawler.naver_crawler import NaverCrawler
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "posts"
+FIXTURES = sorted(FIXTURE_DIR.glob("*.html"))
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_media_markers_match_legacy(fixture):
+    """고정 글 HTML의 모든 요소에서 기존 방식과 결과가 같아야 함 (요소 자체가 모듈인 경우 포함)"""
+    soup = BeautifulSoup(fixture.read_text(encoding="utf-8"), "lxml")
+    crawler = NaverCrawler()
+    for element in [soup.body] + soup.body.find_all(True):
+        expected = crawler._extract_text_with_media_markers_legacy(element)
+        assert extract_text_with_media_markers(element) == expected, str(element)[:300]
+
+
+def test_media_markers_number_by_stage():
+    """모듈 이미지와 oglink가 문서 순서와 관계없이 먼저 번호를 받아야 함 (기존 단계 순서)"""
+    html = (
+        '<div><img src="https://cdn.example.com/free.png"><a href="https://free.example.com/">글</a>'
+        '<div class="se-module se-module-image"><img src="https://postfiles.pstatic.net/a.jpg?type=w80"></div>'
+        '<div class="se-module se-module-oglink"><a href="//og.example.com/">og</a></div></div>'
+    )
+    element = BeautifulSoup(html, "lxml").div
+    text, image_urls, link_urls = extract_text_with_media_markers(element)
+    assert text.split('\n') == ['[이미지 삽입2]', '글', '[링크 삽입2]', '[이미지 삽입1]', '[링크 삽입1]']
+    assert image_urls == ['https://postfiles.pstatic.net/a.jpg?type=w966', 'https://cdn.example.com/free.png']
+    assert link_urls == ['https://og.example.com/', 'https://free.example.com/']
+
+
+def test_media_markers_do_not_modify_tree():
+    soup = BeautifulSoup((FIXTURE_DIR / "se3_post.html").read_text(encoding="utf-8"), "lxml")
+    before = str(soup)
+    extract_text_with_media_markers(soup.find(class_="se-main-container"))
+    assert str(soup) == before
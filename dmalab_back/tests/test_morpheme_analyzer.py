@@ -0,0 +1,97 @@
+"""
+형태소 분석기 테스트
+긴 텍스트를 조각으로 나눠 분석한 빈도가 전체를 한 번에 분석한 빈도와 같은지,
+한 번 컴파일한 조사/어미 판별이 패턴별 re.search/re.sub로 판별하던 기존 결과와 같은지 확인합니다.
+"""
+
+import itertools
+import re
+from pathlib import Path
+
+import pytest
+
+from analyzer import morpheme_analyzer
+from analyzer.morpheme_analyzer import MorphemeAnalyzer, split_text_chunks
+
+POST_DIR = Path(__file__).parent / "fixtures" / "posts"
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return MorphemeAnalyzer(use_konlpy=False)
+
+
+@pytest.fixture(scope="module")
+def corpus(analyzer):
+    return ' '.join(
+        analyzer._preprocess_text(path.read_text(encoding="utf-8")) for path in sorted(POST_DIR.glob("*.html"))
+    )
+
+
+@pytest.mark.parametrize("max_chars", [30, 100, 1000])
+def test_split_text_chunks_keeps_words(corpus, max_chars):
+    chunks = split_text_chunks(corpus, max_chars)
+    assert ' '.join(chunks) == corpus
+    assert all(len(chunk) <= max_chars for chunk in chunks)
+
+
+def test_split_text_chunks_short_and_empty():
+    assert split_text_chunks("가 나", 10) == ["가 나"]
+    assert split_text_chunks("가 나", 0) == ["가 나"]
+    assert split_text_chunks("   ", 10) == []
+    # 공백 없이 max_chars보다 긴 단어는 그대로 자름
+    assert split_text_chunks("가나다라 마", 2) == ["가나", "다라", "마"]
+
+
+def test_chunked_counts_match_whole_text(analyzer, corpus, monkeypatch):
+    text = corpus * 3
+    whole = analyzer.count_keywords(text)
+    monkeypatch.setattr(morpheme_analyzer, "CHUNK_CHARS", 300)
+    chunks = analyzer.text_chunks(text)
+    assert len(chunks) > 1
+    merged = sum((analyzer.count_keywords(chunk, markers=False) for chunk in chunks), morpheme_analyzer.Counter())
+    assert merged == whole
+    assert list(merged) == list(whole)
+
+
+def _legacy_is_ending_word(word):
+    return any(re.search(pattern, word) for pattern in MorphemeAnalyzer.ENDING_PATTERNS)
+
+
+def _legacy_has_josa(word):
+    return any(re.search(pattern, word) for pattern in MorphemeAnalyzer.JOSA_PATTERNS)
+
+
+def _legacy_remove_josa(word):
+    original_word = word
+    for pattern in MorphemeAnalyzer.JOSA_PATTERNS:
+        word = re.sub(pattern, '', word)
+    word = word.strip()
+    return word if word else original_word
+
+
+def _suffix_corpus(corpus):
+    """고정 글 단어 + 어간 뒤에 조사/어미를 1~2개 붙인 단어 (조사만 있는 단어 포함)"""
+    suffixes = [p[:-1] for p in MorphemeAnalyzer.JOSA_PATTERNS]
+    suffixes += ['습니다', '합니다', '해야', '하는', '되는', '있는', '없는', '한', '할', '해', '하다', '되다', '없다']
+    stems = ['', '학교', '홈페이지', '제작', '이', '가나', 'SEO', '2024']
+    words = set(re.findall(r'[\w가-힣]+', corpus))
+    for stem in stems:
+        for count in (1, 2):
+            for combo in itertools.product(suffixes, repeat=count):
+                words.add(stem + ''.join(combo))
+    return sorted(words)
+
+
+def test_suffix_matcher_matches_legacy_patterns(analyzer, corpus):
+    words = _suffix_corpus(corpus)
+    assert len(words) > 1000
+    for word in words:
+        assert analyzer._is_ending_word(word) == _legacy_is_ending_word(word), word
+        assert analyzer._has_josa(word) == _legacy_has_josa(word), word
+        assert analyzer._remove_josa(word) == _legacy_remove_josa(word), word
+
+
+def test_stopwords_are_shared(analyzer):
+    assert isinstance(MorphemeAnalyzer.STOPWORDS, frozenset)
+    assert MorphemeAnalyzer(use_konlpy=False).STOPWORDS is analyzer.STOPWORDS
@@ -0,0 +1,105 @@
+"""
+순위 스냅샷 재사용 테스트
+지난 결과는 조건부 요청으로 글 내용이 그대로인지 확인한 뒤에만 재사용하고, 같은 URL이라도 내용이 바뀌면 다시 처리하는지 확인합니다.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from crawler import naver_crawler
+from crawler.naver_crawler import NaverCrawler
+from crawler.page_cache import PageCache
+from crawler.html_backend import BlogPage
+from crawler.rank_snapshot import RankSnapshotStore, content_fingerprint
+
+URL = 'https://blog.naver.com/test/223000000001'
+POST_KEY = ('test', '223000000001')
+SETTINGS = {'analyze': True, 'top_n': 20, 'min_length': 2, 'min_count': 1}
+ORIGINAL_HTML = (Path(__file__).parent / "fixtures" / "posts" / "se3_post.html").read_text(encoding="utf-8")
+CHANGED_HTML = ORIGINAL_HTML.replace('제주', '부산')
+# 본문은 같고 본문 뒤(꼬리)만 다르거나, 스트리밍 수집이 본문 뒤의 다른 위치에서 멈춘 페이지
+LONG_TAIL_HTML = ORIGINAL_HTML.replace('</body>', '<script>var ts = 1700000000;</script></body>')
+TRUNCATED_HTML = ORIGINAL_HTML[:ORIGINAL_HTML.index('<div class="post_footer">') + 10]
+
+
+def _fingerprint(html: str) -> str:
+    """처리할 때 스냅샷에 저장하는 것과 같은 본문 해시"""
+    page = BlogPage(html=html, final_url=URL, source='iframe')
+    return content_fingerprint(NaverCrawler()._extract_body_from_page(page))
+
+
+class _Response:
+    """_fetcher_get_streaming 응답 대용"""
+
+    def __init__(self, status_code: int, text: str = '', headers: dict = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.url = URL
+        self.encoding = None
+
+
+@pytest.fixture
+def page_cache(tmp_path, monkeypatch):
+    cache = PageCache(tmp_path / "page_cache", ttl=3600)
+    monkeypatch.setattr(naver_crawler, 'get_page_cache', lambda: cache)
+    cache.put(POST_KEY, ORIGINAL_HTML, 'iframe', URL, etag='"v1"')
+    return cache
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    txt_path = tmp_path / "blog.txt"
+    txt_path.write_text("본문", encoding="utf-8")
+    return {
+        'settings': SETTINGS,
+        'ranking': [{
+            'rank': 1, 'url': URL, 'fingerprint': _fingerprint(ORIGINAL_HTML),
+            'processed_at': time.time(), 'result': {'success': True, 'txt_path': str(txt_path)},
+        }],
+    }
+
+
+def _revalidated_entry(monkeypatch, snapshot, response: _Response) -> tuple:
+    """조건부 요청 응답을 response로 바꿔 재사용 여부를 확인합니다 ((재사용 항목, 보낸 헤더) 반환)."""
+    sent = {}
+
+    async def fake_get(url, mode=None, headers=None):
+        sent.update(headers or {})
+        return response
+
+    crawler = NaverCrawler()
+    monkeypatch.setattr(crawler, '_fetcher_get_streaming', fake_get)
+    current = asyncio.run(crawler.extract_current_body_async(URL))
+    entry = RankSnapshotStore(Path('.')).reusable_entry(snapshot, URL, SETTINGS, content_fingerprint(current))
+    return entry, sent
+
+
+def test_unchanged_page_is_reused(page_cache, snapshot, monkeypatch):
+    # 캐시가 TTL 안에 있어도 네트워크로 확인함
+    entry, sent = _revalidated_entry(monkeypatch, snapshot, _Response(304))
+    assert sent['If-None-Match'] == '"v1"'
+    assert entry is snapshot['ranking'][0]
+
+
+def test_changed_page_is_recomputed(page_cache, snapshot, monkeypatch):
+    entry, _ = _revalidated_entry(monkeypatch, snapshot, _Response(200, CHANGED_HTML, {'ETag': '"v2"'}))
+    assert entry is None
+    # 새 내용으로 캐시가 갱신되어 다시 처리할 때 사용됨
+    assert page_cache.get(POST_KEY)['html'] == CHANGED_HTML
+    assert page_cache.get(POST_KEY)['etag'] == '"v2"'
+
+
+@pytest.mark.parametrize('html', [LONG_TAIL_HTML, TRUNCATED_HTML], ids=['long_tail', 'truncated'])
+def test_same_body_with_different_html_is_reused(page_cache, snapshot, monkeypatch, html):
+    assert html != ORIGINAL_HTML
+    entry, _ = _revalidated_entry(monkeypatch, snapshot, _Response(200, html, {'ETag': '"v2"'}))
+    assert entry is snapshot['ranking'][0]
+
+
+def test_unverified_page_is_recomputed(page_cache, snapshot, monkeypatch):
+    entry, _ = _revalidated_entry(monkeypatch, snapshot, _Response(503))
+    assert entry is None
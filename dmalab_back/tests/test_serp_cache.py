@@ -0,0 +1,79 @@
+"""
+검색 결과 캐시 테스트
+get_top_n_blog_info_async가 디스크에만 있는 캐시 항목을 이벤트 루프 밖에서 읽고, 그 뒤로는 메모리에서 바로 사용하는지 확인합니다.
+백그라운드 새로 고침이 요청의 크롤러 대신 풀에서 따로 빌린 크롤러를 쓰는지도 확인합니다.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from crawler import naver_crawler, session_pool
+from crawler.naver_crawler import NaverCrawler
+from crawler.serp_cache import SerpCache, normalize_keyword
+from crawler.session_pool import CrawlerSessionPool
+
+KEYWORD = '제주 여행'
+CANDIDATES = [
+    {'url': f'https://blog.naver.com/test/22300000000{i}', 'title': f'제주 여행 {i}'}
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def serp_cache(tmp_path, monkeypatch):
+    # 다른 인스턴스로 저장해 디스크에만 있는 항목을 만듦
+    SerpCache(tmp_path).put(normalize_keyword(KEYWORD), CANDIDATES)
+    cache = SerpCache(tmp_path)
+    monkeypatch.setattr(naver_crawler, 'get_serp_cache', lambda: cache)
+    return cache
+
+
+def test_disk_read_runs_off_the_event_loop(serp_cache, monkeypatch):
+    threads = []
+    original = serp_cache.get
+
+    def tracking_get(key):
+        threads.append(threading.current_thread())
+        return original(key)
+
+    monkeypatch.setattr(serp_cache, 'get', tracking_get)
+    crawler = NaverCrawler()
+
+    async def scenario():
+        first = await crawler.get_top_n_blog_info_async(KEYWORD, n=2, resolve_titles=False)
+        second = await crawler.get_top_n_blog_info_async(KEYWORD, n=2, resolve_titles=False)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert [blog['url'] for blog in first] == [c['url'] for c in CANDIDATES[:2]]
+    assert first == second
+    # 첫 조회(디스크)는 실행기 스레드에서, 두 번째 조회(메모리)는 이벤트 루프 스레드에서
+    assert threads[0] is not threading.main_thread()
+    assert threads[1] is threading.main_thread()
+    assert serp_cache.stats()['hits'] == 2
+
+
+def test_background_refresh_checks_out_its_own_crawler(serp_cache, monkeypatch):
+    pool = CrawlerSessionPool(size=1)
+    monkeypatch.setattr(session_pool, 'get_crawler_pool', lambda: pool)
+    used = []
+
+    async def fake_refresh(self, keyword, key):
+        used.append(pool.status()['in_use'])
+        return {'keyword': key, 'candidates': CANDIDATES}
+
+    monkeypatch.setattr(NaverCrawler, '_refresh_serp_entry_async', fake_refresh)
+    request_crawler = pool.checkout()
+
+    async def scenario():
+        request_crawler._start_serp_refresh_async(KEYWORD, normalize_keyword(KEYWORD))
+        # 요청이 끝나 풀에 반납된 뒤에도 새로 고침은 풀에서 빌린 크롤러로 진행
+        pool.checkin(request_crawler)
+        await asyncio.gather(*naver_crawler._background_tasks)
+
+    asyncio.run(scenario())
+    # 새로 고치는 동안 크롤러가 풀에서 대여 중이었음
+    assert used == [1]
+    assert pool.status()['in_use'] == 0
@@ -0,0 +1,35 @@
+"""
+SERP 파서 일치 테스트
+lxml XPath 파서(serp_parser)가 기존 BeautifulSoup 방식과 같은 후보 목록을 돌려주는지 확인합니다.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from crawler.naver_crawler import NaverCrawler
+from crawler.serp_parser import parse_serp_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "serp"
+FIXTURES = sorted(FIXTURE_DIR.glob("*.html"))
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_serp_parser_matches_legacy(fixture):
+    """고정 SERP HTML에서 URL, 순서, 제목(None 포함)이 기존 방식과 같아야 함"""
+    html_text = fixture.read_text(encoding="utf-8")
+    expected = list(NaverCrawler()._iter_serp_candidates_legacy(html_text))
+    assert expected, "fixture에 블로그 글 후보가 없습니다."
+    assert list(parse_serp_html(html_text)) == expected
+
+
+def test_serp_parser_skips_ads_and_duplicates():
+    """광고 영역 링크와 같은 URL의 반복 링크는 제외되어야 함"""
+    html_text = (FIXTURE_DIR / "serp_sds.html").read_text(encoding="utf-8")
+    urls = [url for url, _ in parse_serp_html(html_text)]
+    assert len(urls) == len(set(urls))
+    assert not any("adshop" in url for url in urls)
+
+
+def test_serp_parser_empty_html():
+    assert list(parse_serp_html("")) == []
@@ -0,0 +1,117 @@
+"""
+크롤러 세션 풀 테스트
+풀이 가득 찼을 때 crawler_async가 실행기 스레드 없이 이벤트 루프에서 반납을 기다리는지 확인합니다.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from crawler.session_pool import CrawlerSessionPool
+
+
+def test_async_checkout_waits_for_checkin():
+    pool = CrawlerSessionPool(size=1)
+    held = pool.checkout()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        waiting = asyncio.ensure_future(pool.checkout_async())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        # 다른 스레드에서 반납해도 기다리던 요청이 깨어남
+        await loop.run_in_executor(None, pool.checkin, held)
+        return await asyncio.wait_for(waiting, 1)
+
+    crawler = asyncio.run(scenario())
+    assert crawler is held
+    assert pool.status()['waits'] == 1
+    pool.checkin(crawler)
+
+
+def test_async_checkout_timeout():
+    pool = CrawlerSessionPool(size=1)
+    held = pool.checkout()
+    with pytest.raises(TimeoutError):
+        asyncio.run(pool.checkout_async(timeout=0.05))
+    pool.checkin(held)
+    assert pool.status()['idle'] == 1
+
+
+def test_async_checkout_does_not_use_threads():
+    pool = CrawlerSessionPool(size=1)
+    held = pool.checkout()
+
+    async def scenario():
+        before = threading.active_count()
+        waiters = [asyncio.ensure_future(pool.checkout_async()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        # 기다리는 동안 스레드가 늘지 않음
+        assert threading.active_count() == before
+        crawler = held
+        for _ in waiters:
+            pool.checkin(crawler)
+            done, _pending = await asyncio.wait(
+                [w for w in waiters if not w.done()], return_when=asyncio.FIRST_COMPLETED
+            )
+            crawler = done.pop().result()
+        pool.checkin(crawler)
+
+    asyncio.run(scenario())
+    assert pool.status()['in_use'] == 0
+
+
+def _cookie_file(tmp_path, slot=0):
+    return tmp_path / f"session_{slot}.json"
+
+
+def test_checkin_saves_cookies_off_thread(tmp_path):
+    pool = CrawlerSessionPool(size=1, cookie_dir=tmp_path, cookie_save_interval=0)
+    crawler = pool.checkout()
+    crawler.session.cookies.set('NID', 'first', domain='.naver.com')
+    pool.checkin(crawler)
+    pool.flush_cookies()
+    assert json.loads(_cookie_file(tmp_path).read_text(encoding='utf-8'))[0]['value'] == 'first'
+
+    # 새 풀에서 같은 슬롯을 만들면 저장된 쿠키를 불러옴
+    restored = CrawlerSessionPool(size=1, cookie_dir=tmp_path).checkout()
+    assert restored.session.cookies.get('NID') == 'first'
+
+
+def test_cookie_saves_are_debounced(tmp_path, monkeypatch):
+    pool = CrawlerSessionPool(size=1, cookie_dir=tmp_path, cookie_save_interval=60)
+    writes = []
+    original = pool._write_cookies
+    monkeypatch.setattr(pool, '_write_cookies', lambda slot, cookies: (writes.append(cookies), original(slot, cookies)))
+
+    for value in ('a', 'b', 'c'):
+        crawler = pool.checkout()
+        crawler.session.cookies.set('NID', value, domain='.naver.com')
+        pool.checkin(crawler)
+        if value == 'a':
+            pool.flush_cookies()  # 첫 저장이 끝날 때까지 기다림
+    # 간격 안의 반납은 쓰지 않고 마지막 쿠키만 남김
+    assert len(writes) == 1
+    pool.close()
+    assert len(writes) == 2
+    assert json.loads(_cookie_file(tmp_path).read_text(encoding='utf-8'))[0]['value'] == 'c'
+
+
+def test_retired_session_cookies_are_discarded(tmp_path):
+    pool = CrawlerSessionPool(size=1, cookie_dir=tmp_path, cookie_save_interval=0, retire_score=1)
+    crawler = pool.checkout()
+    crawler.session.cookies.set('NID', 'blocked', domain='.naver.com')
+    pool.checkin(crawler)
+    pool.flush_cookies()
+    assert _cookie_file(tmp_path).exists()
+
+    crawler = pool.checkout()
+    crawler.block_score = 5
+    pool.checkin(crawler)
+    fresh = pool.checkout()
+    assert fresh is not crawler
+    assert fresh.session.cookies.get('NID') is None
+    pool.flush_cookies()
+    assert not _cookie_file(tmp_path).exists()
@@ -0,0 +1,77 @@
+"""
+스트리밍 수집 테스트
+본문을 찾은 뒤 남은 응답이 작으면 끝까지 읽어 전체 페이지로 처리하고,
+중간에 멈춘 응답은 앞부분만 담은 페이지로 표시되어 페이지 캐시에 전체 본문처럼 저장되지 않는지 확인합니다.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from crawler import naver_crawler
+from crawler.naver_crawler import NaverCrawler
+from crawler.page_cache import PageCache
+from crawler.stream_parser import MODE_CONTENT, read_streamed
+
+POST_HTML = (Path(__file__).parent / "fixtures" / "posts" / "se3_post.html").read_text(encoding="utf-8")
+# 본문 뒤에 긴 꼬리(댓글/스크립트 등)가 붙은 페이지
+LONG_TAIL_HTML = POST_HTML.replace('</body>', '<script>' + 'x' * 200_000 + '</script></body>')
+POST_KEY = ('test', '223000000001')
+
+
+def _chunks(html: str, size: int = 1024):
+    data = html.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_small_tail_is_read_to_the_end():
+    reader = read_streamed(_chunks(POST_HTML), MODE_CONTENT)
+    assert reader.done and reader.complete
+    assert reader.text == POST_HTML
+
+
+def test_long_tail_stops_after_content():
+    reader = read_streamed(_chunks(LONG_TAIL_HTML), MODE_CONTENT, drain_bytes=4096)
+    assert reader.done and not reader.complete
+    assert '</html>' not in reader.text
+    assert reader.bytes_read < len(LONG_TAIL_HTML.encode('utf-8'))
+
+
+class _StreamingResponse:
+    """requests 스트리밍 응답 대용"""
+
+    def __init__(self, html: str):
+        self.status_code = 200
+        self.url = 'https://blog.naver.com/PostView.naver?blogId=test&logNo=223000000001'
+        self.headers = {'ETag': '"v1"'}
+        self._html = html
+
+    def iter_content(self, chunk_size: int):
+        return iter(_chunks(self._html, chunk_size))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def page_cache(tmp_path, monkeypatch):
+    cache = PageCache(tmp_path / "page_cache", ttl=3600)
+    monkeypatch.setattr(naver_crawler, 'get_page_cache', lambda: cache)
+    return cache
+
+
+@pytest.mark.parametrize('html, partial', [(POST_HTML, False), (LONG_TAIL_HTML, True)])
+def test_partial_pages_are_marked_in_cache(page_cache, monkeypatch, html, partial):
+    crawler = NaverCrawler()
+    monkeypatch.setattr(crawler, '_before_request', lambda url: None)
+    monkeypatch.setattr(crawler.session, 'get', lambda url, **kwargs: _StreamingResponse(html))
+
+    page = crawler._fetch_post_direct(POST_KEY)
+    assert page['partial'] is partial
+    crawler._store_page(POST_KEY, page)
+
+    entry = page_cache.get(POST_KEY)
+    assert entry['partial'] is partial
+    # 본문 추출에는 앞부분만 담은 항목도 사용하지만, 전체 본문이 필요한 곳에는 주지 않음
+    assert (page_cache.get(POST_KEY, full_body=True) is None) is partial
+    assert crawler._page_from_cache(entry)['partial'] is partial
@@ -0,0 +1,53 @@
+"""
+페이지 종류 기록 테스트
+VariantMemory가 임시 파일을 거쳐 원자적으로 저장하고, 비동기 수집 경로에서는 이벤트 루프 밖에서 기록하는지 확인합니다.
+"""
+
+import asyncio
+import json
+import threading
+
+from crawler import naver_crawler
+from crawler.naver_crawler import NaverCrawler
+from crawler.url_resolver import VariantMemory
+
+
+def test_save_replaces_file_atomically(tmp_path):
+    path = tmp_path / "variant_memory.json"
+    memory = VariantMemory(path)
+    memory.record('blogA', 'mobile')
+    memory.record('blogB', 'iframe')
+
+    assert json.loads(path.read_text(encoding='utf-8')) == {'blogA': 'mobile', 'blogB': 'iframe'}
+    # 임시 파일이 남지 않음
+    assert [p.name for p in tmp_path.iterdir()] == ['variant_memory.json']
+    assert VariantMemory(path).order_for('blogA') == ['mobile', 'iframe']
+
+
+def test_async_fetch_records_off_the_event_loop(tmp_path, monkeypatch):
+    memory = VariantMemory(tmp_path / "variant_memory.json")
+    threads = []
+    original = memory.record
+
+    def tracking_record(blog_id, source):
+        threads.append(threading.current_thread())
+        original(blog_id, source)
+
+    monkeypatch.setattr(memory, 'record', tracking_record)
+    monkeypatch.setattr(naver_crawler, 'get_variant_memory', lambda: memory)
+
+    class FakeResponse:
+        url = 'https://m.blog.naver.com/blogA/223000000000'
+        headers = {}
+
+    async def fake_fetch_variant(self, blog_id, log_no, source):
+        if source == 'mobile':
+            return source, FakeResponse(), '<html></html>'
+        return None
+
+    monkeypatch.setattr(NaverCrawler, '_fetch_variant_async', fake_fetch_variant)
+    page = asyncio.run(NaverCrawler()._fetch_post_direct_async(('blogA', '223000000000')))
+
+    assert page['source'] == 'mobile'
+    assert threads and threads[0] is not threading.main_thread()
+    assert memory.order_for('blogA') == ['mobile', 'iframe']